@@ -0,0 +1,35 @@
+"""Hatch build hook that ships precompiled Jinja2 templates and the template manifest in the wheel."""
+
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CompileTemplatesHook(BuildHookInterface):
+    """Compile every packaged template and its manifest into ``src/_compiled`` inside the wheel."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:  # noqa: ARG002
+        """Compile the templates into a temporary directory and force-include it."""
+        if self.target_name != "wheel":
+            return
+
+        sys.path.insert(0, self.root)
+        from src.manifest import MANIFEST_FILE, write_manifest
+        from src.utils import COMPILED_TEMPLATES_DIR, compile_templates
+
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        target = Path(self._tmp_dir.name)
+        count = compile_templates(target)
+        write_manifest(target / MANIFEST_FILE)
+        self.app.display_info(f"Precompiled {count} templates and wrote the template manifest")
+        build_data["force_include"][self._tmp_dir.name] = f"src/{COMPILED_TEMPLATES_DIR}"
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:  # noqa: ARG002
+        """Remove the temporary compile directory."""
+        if hasattr(self, "_tmp_dir"):
+            self._tmp_dir.cleanup()
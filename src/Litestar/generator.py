@@ -1,162 +1,468 @@
 """Litestar project generator."""
 
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Self
 
-from jinja2 import Environment
+import msgspec
+from jinja2 import Environment, TemplateError
+from jinja2.environment import TemplateExpression
 
+from src.generator import FileStatus, GenerationError, RenderedFile, changed_assets, changed_contents
+from src.locks import LOCK_FILE, read_lock
+from src.manifest import FrameworkManifest, Phase, TemplateEntry, get_context_value
 from src.models import DatabaseConfig, ProjectConfig
-from src.plugin import discover_plugins
-from src.utils import get_package_dir, get_template_env, write_file
+from src.planner import plan_outputs
+from src.plugin import Plugin, discover_plugins
+from src.profiling import Profiler
+from src.registry import get_framework_manifest
+from src.sinks import DirectorySink, OutputSink
+from src.utils import get_package_dir, get_source_path, get_template_env, hash_content, hash_file
+
+
+class LitestarTemplates(msgspec.Struct, frozen=True):
+    """The manifest, plugins and compiled templates every Litestar project is rendered from.
+
+    Nothing is modified after loading, so one instance can be shared by generators
+    running on any number of threads.
+    """
+
+    manifest: FrameworkManifest
+    plugins: tuple[Plugin, ...]
+    env: Environment
+    framework_dir: Path
+    # Source of each static asset, keyed by template name
+    assets: dict[str, Path]
+    # Compiled front-matter condition of each conditional template, keyed by template name
+    conditions: dict[str, TemplateExpression]
+    # Context keys each template reads, keyed by template name
+    context_keys: dict[str, list[str]]
+
+    @classmethod
+    def load(cls, profiler: Profiler | None = None) -> Self:
+        """Load the manifest, discover plugins and compile the template conditions.
+
+        Args:
+            profiler: Records the time spent in each phase, if given.
+
+        Returns:
+            The loaded templates.
+
+        """
+        profiler = profiler or Profiler(enabled=False)
+        with profiler.phase("discover plugins"):
+            manifest = get_framework_manifest("Litestar")
+            plugins = discover_plugins("Litestar")
+        with profiler.phase("load templates"):
+            env = get_template_env("Litestar", tuple(plugin.path for plugin in plugins))
+            framework_dir = get_package_dir() / "Litestar"
+            plugin_dirs = {plugin.path.name: plugin.path for plugin in plugins}
+            assets = {
+                entry.template: get_source_path(framework_dir, entry.template, plugin_dirs)
+                for entry in manifest.templates
+                if entry.static
+            }
+            conditions = {
+                entry.template: env.compile_expression(entry.condition)
+                for entry in manifest.templates
+                if entry.condition
+            }
+        return cls(
+            manifest=manifest,
+            plugins=plugins,
+            env=env,
+            framework_dir=framework_dir,
+            assets=assets,
+            conditions=conditions,
+            context_keys={entry.template: entry.context_keys for entry in manifest.templates},
+        )
 
 
 class LitestarGenerator:
     """Generates a Litestar project."""
 
-    def __init__(self, config: ProjectConfig, output_dir: Path) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        config: ProjectConfig,
+        output_dir: Path,
+        jobs: int = 1,
+        previous_files: dict[Path, str] | None = None,
+        *,
+        force: bool = False,
+        profiler: Profiler | None = None,
+        previous_config: ProjectConfig | None = None,
+        templates: LitestarTemplates | None = None,
+    ) -> None:
         """Initialize the generator.
 
         Args:
             config: Project configuration.
             output_dir: Directory where the project will be generated.
+            jobs: Number of threads used to render and write files.
+            previous_files: File hashes of an earlier generation into ``output_dir``. When given,
+                only files whose rendered content changed are written.
+            force: Overwrite or remove files that were modified since the earlier generation.
+            profiler: Records the time spent in each phase, if given.
+            previous_config: The configuration the files of ``previous_files`` were rendered from,
+                by the same templates. Files whose templates read no context value that differs
+                from it keep their recorded hash instead of being rendered again.
+            templates: Templates loaded once and shared between generators, loaded on creation if not given.
 
         """
         self.config = config
         self.output_dir = output_dir
-        self.litestar_dir = get_package_dir() / "Litestar"
-        self.plugins = discover_plugins("Litestar")
-
-    def _get_template_context(self) -> dict:
+        self.jobs = jobs
+        self.previous_files = previous_files
+        self.force = force
+        self.profiler = profiler or Profiler(enabled=False)
+        self.previous_config = previous_config
+        self.files: dict[Path, str] = {}
+        self.statuses: dict[Path, FileStatus] = {}
+        self.removed: list[Path] = []
+        templates = templates or LitestarTemplates.load(self.profiler)
+        self.manifest = templates.manifest
+        self.plugins = templates.plugins
+        self.env = templates.env
+        self.framework_dir = templates.framework_dir
+        self.assets = templates.assets
+        self.conditions = templates.conditions
+        self.context_keys = templates.context_keys
+
+    def _get_template_context(self, config: ProjectConfig | None = None) -> dict:
         """Build the template context.
 
+        Args:
+            config: The configuration to build the context for, defaults to the generated one.
+
         Returns:
             The template context dictionary.
 
         """
-        db_config = DatabaseConfig.for_database(self.config.database)
+        config = config or self.config
+        db_config = DatabaseConfig.for_database(config.database)
 
         context = {
-            "project": self.config,
-            "project_name": self.config.name,
-            "project_slug": self.config.slug,
-            "database": self.config.database,
+            "project": config,
+            "project_name": config.name,
+            "project_slug": config.slug,
+            "database": config.database,
             "db_config": db_config,
-            "has_database": self.config.database.value != "None",
-            "docker": self.config.docker,
-            "docker_infra": self.config.docker_infra,
+            "has_database": config.database.value != "None",
+            "docker": config.docker,
+            "docker_infra": config.docker_infra,
         }
 
         # Add plugin-specific context
         for plugin in self.plugins:
             # Set boolean flag for all discovered plugins (True if enabled)
-            enabled = self.config.has_plugin(plugin.id)
+            enabled = config.has_plugin(plugin.id)
             context[plugin.id.lower()] = enabled
 
             # If enabled, let the plugin add its own context
             if enabled:
-                context.update(plugin.get_template_context(self.config))
+                context.update(plugin.get_template_context(config))
 
         return context
 
-    def _render_templates(
-        self,
-        template_dir: Path,
-        output_subdir: Path,
-        env: Environment,
-        context: dict,
-        root_template_dir: Path | None = None,
-    ) -> None:
-        """Recursively render templates from a directory."""
-        if root_template_dir is None:
-            root_template_dir = template_dir
+    def _is_included(self, template_name: str, context: dict) -> bool:
+        """Evaluate the inclusion condition a template declares in its front-matter.
+
+        Args:
+            template_name: The template to check.
+            context: The template context.
+
+        Returns:
+            True if the template has no condition or its condition holds.
+
+        """
+        condition = self.conditions.get(template_name)
+        return condition is None or bool(condition(**context))
 
-        for item in template_dir.iterdir():
-            if item.is_dir():
-                # Recurse into subdirectories
-                self._render_templates(item, output_subdir / item.name, env, context, root_template_dir)
-            elif item.suffix == ".jinja":
-                # Render template - use path relative to the environment's loader root
-                relative_to_loader = item.relative_to(root_template_dir)
-                template_name = str(relative_to_loader).replace("\\", "/")
+    def _is_pristine(self, output_path: Path) -> bool:
+        """Check whether an existing file still matches its previously generated content.
 
-                # Remove .jinja extension for output
-                output_name = item.stem
-                output_path = output_subdir / output_name
+        Returns:
+            True if the file may be overwritten or removed without losing local changes.
+
+        """
+        previous = (self.previous_files or {}).get(output_path)
+        return self.force or (previous is not None and hash_file(self.output_dir / output_path) == previous)
 
-                template = env.get_template(template_name)
-                content = template.render(**context)
-                write_file(output_path, content)
+    def _file_status(self, output_path: Path, digest: str) -> FileStatus:
+        """Decide whether a rendered file needs to be written.
+
+        Returns:
+            The status of the file compared with the output directory.
 
-    def generate(self) -> None:
-        """Generate the Litestar project."""
-        context = self._get_template_context()
+        """
+        if self.previous_files is None or not (self.output_dir / output_path).exists():
+            return FileStatus.CREATED
+        if self.force:
+            # Restore the rendered content even over local modifications
+            return FileStatus.UNCHANGED if hash_file(self.output_dir / output_path) == digest else FileStatus.UPDATED
+        if self.previous_files.get(output_path) == digest:
+            return FileStatus.UNCHANGED
+        if self._is_pristine(output_path):
+            return FileStatus.UPDATED
+        return FileStatus.CONFLICT
+
+    def _keep_file(self, output_path: Path) -> RenderedFile | None:
+        """Keep a previously generated file that is still in the output directory, without rendering it.
 
-        # Generate base config files
-        self._generate_config(context)
+        Returns:
+            The file with its recorded hash, or None if it was not generated before or is gone.
 
-        # Generate base application
-        self._generate_base(context)
+        """
+        digest = (self.previous_files or {}).get(output_path)
+        if digest is None or not (self.output_dir / output_path).exists():
+            return None
+        return RenderedFile(
+            content="",
+            digest=digest,
+            status=FileStatus.UNCHANGED,
+            source=self.output_dir / output_path,
+        )
+
+    def _find_unaffected_files(self, templates: dict[Path, tuple[str, ...]], context: dict) -> dict[Path, RenderedFile]:
+        """Find the files whose templates read nothing that changed since the previous configuration.
 
-        # Generate plugins
-        self._generate_plugins(context)
+        Args:
+            templates: A mapping of output paths to the templates planned for them.
+            context: The template context.
 
-        # Generate Docker files if requested
-        if self.config.docker or self.config.needs_docker_infra:
-            self._generate_containers(context)
+        Returns:
+            The files kept from the previous generation, keyed by output path.
+
+        """
+        # Forcing restores files from fresh renders, so nothing can be kept
+        if self.previous_config is None or self.force:
+            return {}
+
+        previous_context = self._get_template_context(self.previous_config)
+        changed: dict[str, bool] = {}
+
+        def is_changed(key: str) -> bool:
+            if key not in changed:
+                changed[key] = get_context_value(previous_context, key) != get_context_value(context, key)
+            return changed[key]
+
+        unaffected = {}
+        for output_path, template_names in templates.items():
+            keys = {key for template_name in template_names for key in self.context_keys.get(template_name, ())}
+            if not any(map(is_changed, keys)) and (file := self._keep_file(output_path)) is not None:
+                unaffected[output_path] = file
+        return unaffected
+
+    def _render_file(self, output_path: Path, template_names: tuple[str, ...], context: dict) -> RenderedFile:
+        """Render the templates planned for a file and decide whether it needs to be written.
+
+        Returns:
+            The rendered file.
+
+        """
+        source = self.assets.get(template_names[0])
+        # Each file is its own span in traces, on the thread that rendered it
+        with self.profiler.phase(output_path.as_posix(), "file"):
+            if source is not None:
+                # Static assets are hashed from disk and copied later, never decoded through Jinja
+                content = ""
+                digest = hash_file(source)
+            else:
+                content = "".join(
+                    self.env.get_template(template_name).render(**context) for template_name in template_names
+                )
+                digest = hash_content(content)
+
+        return RenderedFile(
+            content=content,
+            digest=digest,
+            status=self._file_status(output_path, digest),
+            source=source,
+        )
+
+    def _render_lock(self, rendered: dict[Path, RenderedFile]) -> RenderedFile | None:
+        """Emit the pre-resolved lock file matching the rendered ``pyproject.toml``, if one is shipped.
+
+        Returns:
+            The lock file, or None if the dependency set was not pre-resolved or a template owns the path.
+
+        """
+        pyproject = rendered.get(Path("pyproject.toml"))
+        if pyproject is None or Path(LOCK_FILE) in rendered:
+            return None
+        if pyproject.source is not None:
+            # A pyproject.toml kept from the previous generation keeps its lock file
+            return self._keep_file(Path(LOCK_FILE))
+        content = read_lock(self.framework_dir, pyproject.content, self.config.slug)
+        if content is None:
+            return None
+        digest = hash_content(content)
+        return RenderedFile(content=content, digest=digest, status=self._file_status(Path(LOCK_FILE), digest))
+
+    def _find_stale_files(self, rendered: dict[Path, RenderedFile]) -> None:
+        """Find previously generated files that are no longer part of the project."""
+        for output_path in sorted((self.previous_files or {}).keys() - rendered.keys()):
+            if not (self.output_dir / output_path).exists():
+                continue
+            if self._is_pristine(output_path):
+                self.removed.append(output_path)
+                self.statuses[output_path] = FileStatus.REMOVED
+            else:
+                self.statuses[output_path] = FileStatus.CONFLICT
+
+    def _render_templates(self, templates: dict[Path, tuple[str, ...]], context: dict) -> dict[Path, RenderedFile]:
+        """Render templates in memory, on a thread pool when more than one job is allowed.
+
+        Args:
+            templates: A mapping of output paths to the templates planned for them.
+            context: The template context.
+
+        Returns:
+            The rendered files, keyed by output path.
+
+        Raises:
+            GenerationError: If any file failed to render.
+
+        """
+        errors: dict[Path, Exception] = {}
+        results: dict[Path, RenderedFile] = {}
+
+        if self.jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="litestar-start") as executor:
+                futures = {
+                    output_path: executor.submit(self._render_file, output_path, template_names, context)
+                    for output_path, template_names in templates.items()
+                }
+                for output_path, future in futures.items():
+                    try:
+                        results[output_path] = future.result()
+                    except (TemplateError, OSError) as exc:
+                        errors[output_path] = exc
+        else:
+            for output_path, template_names in templates.items():
+                try:
+                    results[output_path] = self._render_file(output_path, template_names, context)
+                except (TemplateError, OSError) as exc:
+                    errors[output_path] = exc
+
+        if errors:
+            raise GenerationError(errors)
+
+        return dict(sorted(results.items()))
+
+    def render(self) -> dict[Path, RenderedFile]:
+        """Render the Litestar project in memory without touching the output directory.
+
+        Returns:
+            The rendered files, keyed by path relative to the project root.
+
+        """
+        with self.profiler.phase("template context"):
+            context = self._get_template_context()
+
+        with self.profiler.phase("plan outputs"):
+            # Collect every template in precedence order: config, base, plugins, containers
+            entries = [
+                *self._generate_config(),
+                *self._generate_base(),
+                *self._generate_plugins(),
+                *self._generate_containers(),
+            ]
+
+            # Skip templates whose front-matter condition does not hold, then settle the owner
+            # of each output path, so every file is rendered once and collisions fail up front
+            templates = plan_outputs(entry for entry in entries if self._is_included(entry.template, context))
+
+        with self.profiler.phase("find unaffected files"):
+            unaffected = self._find_unaffected_files(templates, context)
+
+        with self.profiler.phase("render templates"):
+            rendered = self._render_templates(
+                {output_path: names for output_path, names in templates.items() if output_path not in unaffected},
+                context,
+            )
+            rendered = dict(sorted({**rendered, **unaffected}.items()))
+
+        with self.profiler.phase("lock file"):
+            if (lock := self._render_lock(rendered)) is not None:
+                rendered = dict(sorted({**rendered, Path(LOCK_FILE): lock}.items()))
+
+        self.files = {output_path: file.digest for output_path, file in rendered.items()}
+        self.statuses = {output_path: file.status for output_path, file in rendered.items()}
+        self.removed = []
+        with self.profiler.phase("find stale files"):
+            self._find_stale_files(rendered)
+
+        return rendered
+
+    def generate(self, sink: OutputSink | None = None) -> None:
+        """Generate the Litestar project.
+
+        Args:
+            sink: Where to write the project, defaults to the output directory.
+
+        """
+        if sink is None:
+            sink = DirectorySink(self.output_dir, jobs=self.jobs)
+        rendered = self.render()
+        with self.profiler.phase("write files"):
+            sink.commit(changed_contents(rendered), self.removed, changed_assets(rendered))
 
     def post_generate(self) -> None:
-        """Run post-generation tasks for enabled plugins."""
+        """Run post-generation tasks for enabled plugins, one by one and without timeouts.
+
+        The CLI runs the hooks as setup steps instead (see :mod:`src.setup_tasks`), concurrently
+        where their ordering allows and each within its timeout.
+        """
         for plugin in self.plugins:
             if self.config.has_plugin(plugin.id):
-                plugin.post_generate(self.config, self.output_dir)
+                with self.profiler.phase(f"post_generate: {plugin.id}"):
+                    result = plugin.post_generate(self.config, self.output_dir)
+                    if inspect.iscoroutine(result):
+                        asyncio.run(result)
 
-    def _generate_config(self, context: dict) -> None:
-        """Generate configuration files (pyproject.toml, .gitignore, etc.)."""
-        config_dir = self.litestar_dir / "Config"
-        env = get_template_env(config_dir)
+    def _generate_config(self) -> list[TemplateEntry]:
+        """Collect configuration files (pyproject.toml, .gitignore, etc.).
+
+        Returns:
+            The manifest entries of the phase.
 
-        for template_file in config_dir.glob("*.jinja"):
-            template_name = template_file.name
-            output_name = template_file.stem  # Remove .jinja extension
+        """
+        return self.manifest.for_phase(Phase.CONFIG)
+
+    def _generate_base(self) -> list[TemplateEntry]:
+        """Collect base application files.
+
+        Returns:
+            The manifest entries of the phase.
 
-            template = env.get_template(template_name)
-            content = template.render(**context)
-            write_file(self.output_dir / output_name, content)
+        """
+        return self.manifest.for_phase(Phase.BASE)
 
-    def _generate_base(self, context: dict) -> None:
-        """Generate base application files."""
-        app_dir = self.litestar_dir / "App"
-        env = get_template_env(app_dir)
+    def _generate_plugins(self) -> list[TemplateEntry]:
+        """Collect plugin-specific files.
 
-        self._render_templates(app_dir, self.output_dir, env, context)
+        Returns:
+            The manifest entries of every enabled plugin.
 
-    def _generate_plugins(self, context: dict) -> None:
-        """Generate plugin-specific files."""
+        """
+        entries = []
         for plugin in self.plugins:
             if self.config.has_plugin(plugin.id):
-                templates_dir = plugin.path / "Templates"
-
-                if templates_dir.exists():
-                    env = get_template_env(templates_dir)
-                    self._render_templates(templates_dir, self.output_dir, env, context)
-
-    def _generate_containers(self, context: dict) -> None:
-        """Generate Docker-related files."""
-        containers_dir = self.litestar_dir / "Containers"
-        env = get_template_env(containers_dir)
-
-        # Generate Dockerfile if requested
-        if self.config.docker:
-            template = env.get_template("Dockerfile.jinja")
-            content = template.render(**context)
-            write_file(self.output_dir / "Dockerfile", content)
-
-            # Also generate docker-compose.yml for the app
-            template = env.get_template("docker-compose.yml.jinja")
-            content = template.render(**context)
-            write_file(self.output_dir / "docker-compose.yml", content)
-
-        # Generate docker-compose.infra.yml if needed
-        if self.config.needs_docker_infra:
-            template = env.get_template("docker-compose.infra.yml.jinja")
-            content = template.render(**context)
-            write_file(self.output_dir / "docker-compose.infra.yml", content)
+                entries.extend(self.manifest.for_plugin(plugin.path.name))
+        return entries
+
+    def _generate_containers(self) -> list[TemplateEntry]:
+        """Collect Docker-related files.
+
+        Dockerfile and docker-compose.yml are only included if Docker was requested,
+        docker-compose.infra.yml if the database needs infrastructure; each template
+        declares this in its front-matter.
+
+        Returns:
+            The manifest entries of the phase.
+
+        """
+        return self.manifest.for_phase(Phase.CONTAINERS)
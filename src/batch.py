@@ -0,0 +1,125 @@
+"""Generation of many projects at once on a pool of warm worker processes."""
+
+import importlib
+import itertools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import msgspec
+
+from src.generator import GenerationError, ProjectGenerator
+from src.manifest import load_manifest
+from src.models import ProjectConfig
+from src.plugin import discover_plugins
+from src.project_cache import ProjectCache
+from src.registry import get_framework_manifest
+from src.sinks import DirectorySink
+from src.utils import get_template_env
+
+
+class BatchResult(msgspec.Struct, frozen=True):
+    """Outcome of generating one project of a batch."""
+
+    name: str
+    output_dir: Path
+    seconds: float
+    files: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project was generated."""
+        return self.error is None
+
+
+def warm_up(frameworks: set[str]) -> None:
+    """Import the generators of the given frameworks and load their manifest, plugins and template environments.
+
+    Run once in-process for a single job, or once by each worker as its initializer.
+
+    Args:
+        frameworks: The framework names to prepare.
+
+    """
+    load_manifest()
+    for framework in sorted(frameworks):
+        importlib.import_module(f"src.{framework}.generator")
+        get_framework_manifest(framework)
+        plugins = discover_plugins(framework)
+        get_template_env(framework, tuple(plugin.path for plugin in plugins))
+
+
+def generate_one(config: ProjectConfig, output_dir: Path, cache: ProjectCache | None = None) -> BatchResult:
+    """Generate a single project of a batch, capturing its timing and failure.
+
+    Args:
+        config: The project configuration.
+        output_dir: Directory where the project is generated.
+        cache: Materializes projects generated before, if given.
+
+    Returns:
+        The outcome of the generation.
+
+    """
+    start = time.perf_counter()
+    try:
+        generator = ProjectGenerator(config, output_dir, cache=cache)
+        generator.generate(DirectorySink(output_dir))
+    except (GenerationError, OSError) as exc:
+        return BatchResult(config.name, output_dir, time.perf_counter() - start, error=str(exc))
+    except Exception as exc:  # noqa: BLE001
+        # E.g. a third-party plugin raising; it fails this project rather than the whole batch
+        error = f"{type(exc).__name__}: {exc}"
+        return BatchResult(config.name, output_dir, time.perf_counter() - start, error=error)
+    return BatchResult(config.name, output_dir, time.perf_counter() - start, files=len(generator.files))
+
+
+def run_batch(
+    configs: list[ProjectConfig],
+    output_root: Path,
+    jobs: int = 1,
+    cache: ProjectCache | None = None,
+) -> list[BatchResult]:
+    """Generate every project of a batch into ``output_root/<project_slug>``.
+
+    Templates and plugins are loaded once by each of ``jobs`` worker processes, which
+    the projects are fanned out to; with one job they are generated in-process.
+
+    Args:
+        configs: The configuration of each project.
+        output_root: Directory the projects are generated into.
+        jobs: Number of worker processes.
+        cache: Materializes projects generated before, by this or an earlier batch, if given.
+
+    Returns:
+        The outcome of each project, in the order of ``configs``.
+
+    """
+    frameworks = {config.framework.value for config in configs}
+    output_dirs = [output_root / config.slug for config in configs]
+    if cache is not None:
+        # Identify the environment once; workers receive the cache with the key computed
+        _ = cache.environment_key
+    caches = itertools.repeat(cache)
+
+    workers = min(jobs, len(configs))
+    if workers <= 1:
+        warm_up(frameworks)
+        return list(map(generate_one, configs, output_dirs, caches))
+
+    # Workers are started by a fork server rather than forked from this process, whose other
+    # threads (e.g. a progress display) may hold locks a child would inherit held
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    context = multiprocessing.get_context(method)
+    if method == "forkserver":
+        # Imported once by the fork server and inherited by every worker it forks
+        context.set_forkserver_preload(["src.batch"])
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=warm_up,
+        initargs=(frameworks,),
+    ) as executor:
+        return list(executor.map(generate_one, configs, output_dirs, caches))
@@ -1,24 +1,324 @@
-"""Command-line interface for litestar-start."""
+"""Command-line interface for litestar-start.
 
-import shutil
-import subprocess  # noqa: S404
+Only the standard library and :mod:`src.sinks` are imported at module load, so that
+``--help`` and ``--version`` answer without loading the interactive or rendering
+dependencies; everything else is imported by the function that first needs it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import os
+import sys
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from src import __version__
+from src.sinks import ArchiveFormat, ArchiveSink, infer_archive_format
+
+# Options that describe the project, named after the ProjectConfig fields they set
+CONFIG_OPTIONS = ("name", "framework", "database", "plugins", "docker", "docker_infra")
+# Options of ``update`` that change the settings of an existing project
+SETTING_OPTIONS = ("database", "plugins", "docker", "docker_infra")
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from rich.console import Console
+
+    from src.generator import ProjectGenerator
+    from src.models import Database, Framework, ProjectConfig
+    from src.plugin import Plugin
+    from src.prefetch import Prefetcher
+    from src.profiling import Profiler
+
+
+@functools.cache
+def get_console() -> Console:
+    """Create the console shared by every command on first use.
+
+    Returns:
+        The rich console.
+
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line argument.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        msg = f"expected a positive integer, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
 
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+    Returns:
+        The configured argument parser.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="litestar-start",
+        description="Interactive CLI to scaffold Litestar projects.",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    add_generation_arguments(parser, defaults=True)
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="where to write the project: a directory (default: ./<project_slug>), "
+        "an archive file, or '-' to stream an archive to standard output",
+    )
+    parser.add_argument(
+        "--format",
+        dest="archive_format",
+        type=ArchiveFormat,
+        choices=list(ArchiveFormat),
+        help="archive format, inferred from the --output file name; required with '--output -'",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        dest="prefetch",
+        action="store_false",
+        help="do not download the project's dependencies into the uv cache while the prompts are answered",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="render every file instead of reusing a project generated before from the same configuration",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="set the project up without network access, from the shipped lock file and the uv cache",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    update_parser = subparsers.add_parser(
+        "update",
+        help="re-render an existing project, rewriting only files whose content changed",
+        description="Re-render a project generated by litestar-start, rewriting only files whose content changed.",
+    )
+    update_parser.add_argument(
+        "directory",
+        nargs="?",
+        type=Path,
+        default=Path(),
+        help="root directory of the project (default: current directory)",
+    )
+    update_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="overwrite or remove files that were modified since they were generated",
+    )
+    # Only override the top-level values when given after the subcommand
+    add_generation_arguments(update_parser, defaults=False)
+    add_setting_arguments(update_parser)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="generate every project of a matrix file on a pool of worker processes",
+        description="Generate every project listed in a TOML or JSON matrix file, loading templates and plugins once.",
+    )
+    batch_parser.add_argument("matrix", type=Path, help="matrix file listing the projects")
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=argparse.SUPPRESS,
+        help="number of worker processes (default: 1)",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        dest="batch_output",
+        help="directory the projects are generated into (default: the matrix's output, next to the file)",
+    )
+    batch_parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        default=argparse.SUPPRESS,
+        help="render every project instead of reusing projects generated before",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="serve project generation over HTTP with templates and plugins kept warm",
+        description="Run an HTTP service that generates projects from JSON configurations and streams them back "
+        "as archives. Requires the 'serve' extra.",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=positive_int, default=8000, help="port to listen on (default: 8000)")
+    serve_parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=4,
+        help="number of projects generated at the same time (default: 4)",
+    )
+    serve_parser.add_argument(
+        "--backlog",
+        type=int,
+        default=16,
+        help="number of requests waiting for a worker before new ones are rejected with 503 (default: 16)",
+    )
+    serve_parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        default=argparse.SUPPRESS,
+        help="render every project instead of reusing projects generated before",
+    )
+
+    add_config_arguments(parser)
+    return parser
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that configure a project without prompting.
 
-from src.generator import ProjectGenerator
-from src.models import Database, Framework, ProjectConfig
-from src.plugin import Plugin, discover_plugins
-from src.utils import validate_project_name
+    Args:
+        parser: The parser to add the options to.
 
-console = Console()
+    """
+    group = parser.add_argument_group(
+        "non-interactive generation",
+        "Giving --config or any project option skips every prompt; options override the config file.",
+    )
+    group.add_argument(
+        "--config",
+        type=Path,
+        help="project configuration file (.toml or .json) with the fields name, framework, database, "
+        "plugins, docker and docker_infra",
+    )
+    group.add_argument("--name", help="project name")
+    group.add_argument("--framework", help="backend framework: Litestar (default)")
+    group.add_argument("--database", help="database: PostgreSQL, SQLite, MySQL or None (default)")
+    group.add_argument(
+        "--plugin",
+        dest="plugins",
+        action="append",
+        metavar="ID",
+        help="enable a plugin by id, e.g. advanced_alchemy (repeatable)",
+    )
+    group.add_argument(
+        "--docker",
+        action=argparse.BooleanOptionalAction,
+        help="generate a Dockerfile and docker-compose.yml",
+    )
+    group.add_argument(
+        "--docker-infra",
+        action=argparse.BooleanOptionalAction,
+        help="generate docker-compose.infra.yml for the database",
+    )
+    group.add_argument(
+        "--setup",
+        action="store_true",
+        help="run the post-generation setup (git init, uv sync, plugin hooks) without prompting",
+    )
+
+
+def add_setting_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that change the settings of an existing project to a parser.
+
+    Options that are not given are left unset, so the recorded settings are kept.
+
+    Args:
+        parser: The parser to add the options to.
+
+    """
+    group = parser.add_argument_group(
+        "changing settings",
+        "Options change the recorded configuration; only files that depend on a changed setting are re-rendered.",
+        argument_default=argparse.SUPPRESS,
+    )
+    group.add_argument("--database", help="database: PostgreSQL, SQLite, MySQL or None")
+    group.add_argument(
+        "--plugin",
+        dest="plugins",
+        action="append",
+        metavar="ID",
+        help="enable a plugin by id (repeatable); replaces the enabled plugins",
+    )
+    group.add_argument(
+        "--no-plugins",
+        dest="plugins",
+        action="store_const",
+        const=[],
+        help="disable every plugin",
+    )
+    group.add_argument("--docker", action=argparse.BooleanOptionalAction, help="generate Docker files")
+    group.add_argument(
+        "--docker-infra",
+        action=argparse.BooleanOptionalAction,
+        help="generate docker-compose.infra.yml for the database",
+    )
+
+
+def add_generation_arguments(parser: argparse.ArgumentParser, *, defaults: bool) -> None:
+    """Add the options shared by every generating command to a parser.
+
+    Args:
+        parser: The parser to add the options to.
+        defaults: Whether to set default values, rather than leaving the options unset when not given.
+
+    """
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1 if defaults else argparse.SUPPRESS,
+        help="number of threads used to render and write project files (default: 1)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
+        help="print the files that would be written, with their sizes and hashes, without writing anything",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False if defaults else argparse.SUPPRESS,
+        help="print how long each phase of generation and setup took",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        metavar="FILE",
+        default=None if defaults else argparse.SUPPRESS,
+        help="also write the timings as a Chrome trace (chrome://tracing, ui.perfetto.dev); implies --profile",
+    )
 
 
 def print_banner() -> None:
     """Print the welcome banner."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
     banner = Text("⚡ Litestar Start ⚡", style="bold cyan", justify="center")
     console.print(Panel(banner))
     console.print()
@@ -34,6 +334,12 @@ def ask_project_name() -> str:
         SystemExit: If the user cancels the operation.
 
     """
+    import questionary
+
+    from src.utils import validate_project_name
+
+    console = get_console()
+
     while True:
         name = questionary.text(
             "What is your project name?",
@@ -62,6 +368,12 @@ def ask_framework() -> Framework:
         SystemExit: If the user cancels the operation.
 
     """
+    import questionary
+
+    from src.models import Framework
+
+    console = get_console()
+
     choices = [
         questionary.Choice(title="Litestar", value=Framework.LITESTAR),
     ]
@@ -88,6 +400,12 @@ def ask_database() -> Database:
         SystemExit: If the user cancels the operation.
 
     """
+    import questionary
+
+    from src.models import Database
+
+    console = get_console()
+
     choices = [
         questionary.Choice(title="PostgreSQL", value=Database.POSTGRESQL),
         questionary.Choice(title="SQLite", value=Database.SQLITE),
@@ -107,7 +425,7 @@ def ask_database() -> Database:
     return result
 
 
-def ask_plugins(config: ProjectConfig, discovered_plugins: list[Plugin]) -> list[str]:
+def ask_plugins(config: ProjectConfig, discovered_plugins: Sequence[Plugin]) -> list[str]:
     """Ask for plugins to install.
 
     Args:
@@ -121,6 +439,10 @@ def ask_plugins(config: ProjectConfig, discovered_plugins: list[Plugin]) -> list
         SystemExit: If the user cancels the operation.
 
     """
+    import questionary
+
+    console = get_console()
+
     choices = [
         questionary.Choice(title=plugin.name, value=plugin.id)
         for plugin in discovered_plugins
@@ -152,6 +474,10 @@ def ask_docker() -> tuple[bool, bool]:
         SystemExit: If the user cancels the operation (e.g., presses Ctrl+C).
 
     """
+    import questionary
+
+    console = get_console()
+
     docker = questionary.confirm(
         "Generate Dockerfile for the application?",
         default=False,
@@ -174,58 +500,66 @@ def ask_docker() -> tuple[bool, bool]:
 
 
 def run_post_generation_setup(generator: ProjectGenerator, output_dir: Path) -> None:
-    """Run post-generation setup commands.
+    """Run the post-generation setup steps concurrently, streaming their output.
 
     Args:
         generator: The project generator instance.
         output_dir: The output directory for the project.
 
+    Raises:
+        SystemExit: If a setup step failed.
+
     """
-    config = generator.config
-
-    # Initialize git repository
-    with console.status("[bold green]Initializing git repository..."):
-        subprocess.run(["git", "init"], cwd=output_dir, check=True, capture_output=True)  # noqa: S607
-    console.print("[bold green]✓[/bold green] Git repository initialized")
-
-    # Install dependencies with uv
-    with console.status("[bold green]Installing dependencies with uv sync..."):
-        subprocess.run(["uv", "sync"], cwd=output_dir, check=True, capture_output=True)  # noqa: S607
-    console.print("[bold green]✓[/bold green] Dependencies installed")
-
-    # Start docker infrastructure if needed
-    if config.needs_docker_infra:
-        with console.status("[bold green]Starting Docker infrastructure..."):
-            subprocess.run(
-                ["docker", "compose", "-f", "docker-compose.infra.yml", "up", "-d"],  # noqa: S607
-                cwd=output_dir,
-                check=True,
-                capture_output=True,
-            )
-        console.print("[bold green]✓[/bold green] Docker infrastructure started")
+    from rich.text import Text
+
+    from src.setup_tasks import StepStatus, build_setup_steps, run_setup
 
-    # Create .dockerignore from .gitignore
-    if config.docker:
-        gitignore = output_dir / ".gitignore"
-        dockerignore = output_dir / ".dockerignore"
-        if gitignore.exists():
-            shutil.copy(gitignore, dockerignore)
+    console = get_console()
+    steps = build_setup_steps(generator, output_dir)
+    width = max(len(step.name) for step in steps)
 
-    # Run plugin post-generation hooks
-    generator.post_generate()
+    def show(step: str, line: str) -> None:
+        console.print(Text.assemble((f"{step:>{width}} │ ", "dim"), line), soft_wrap=True)
 
-    # Copy .env.example to .env
-    env_example = output_dir / ".env.example"
-    env_file = output_dir / ".env"
-    if env_example.exists():
-        shutil.copy(env_example, env_file)
+    with console.status("[bold green]Setting up the project..."), generator.profiler.phase("setup"):
+        results = run_setup(steps, output_dir, show, generator.profiler)
+
+    for result in results:
+        if result.status == StepStatus.DONE:
+            console.print(f"[bold green]✓[/bold green] {result.name} [dim]({result.seconds:.1f}s)[/dim]")
+        elif result.status == StepStatus.FAILED:
+            console.print(f"[bold red]✗[/bold red] {result.name}: {result.error}", highlight=False)
+        else:
+            console.print(f"[yellow]-[/yellow] {result.name} skipped: {result.error}", highlight=False)
+
+    if any(result.status != StepStatus.DONE for result in results):
+        raise SystemExit(1)
+
+
+def offer_to_start(config: ProjectConfig, output_dir: Path, *, interactive: bool = True) -> None:
+    """Start the generated application if the user wants to, or explain how to.
+
+    Args:
+        config: The project configuration.
+        output_dir: The output directory for the project.
+        interactive: Ask whether to start the application, rather than only explaining how.
+
+    """
+    import subprocess  # noqa: S404
+
+    import questionary
+
+    console = get_console()
 
     # Ask if user wants to start the application
     console.print()
-    start_app = questionary.confirm(
-        "Start the application now?",
-        default=True,
-    ).ask()
+    start_app = (
+        interactive
+        and questionary.confirm(
+            "Start the application now?",
+            default=True,
+        ).ask()
+    )
 
     if start_app:
         subprocess.run(["uv", "run", "litestar", "run"], cwd=output_dir, check=True)  # noqa: S607
@@ -237,78 +571,506 @@ def run_post_generation_setup(generator: ProjectGenerator, output_dir: Path) ->
         console.print()
 
 
-def main() -> None:
-    """Run the main CLI interface.
+def create_profiler(args: argparse.Namespace) -> Profiler | None:
+    """Create a profiler if ``--profile`` or ``--profile-trace`` was given.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Returns:
+        The profiler, or None when not profiling.
+
+    """
+    if not args.profile and args.profile_trace is None:
+        return None
+
+    from src.profiling import Profiler
+
+    return Profiler()
+
+
+def create_prefetcher(
+    args: argparse.Namespace,
+    archive_format: ArchiveFormat | None,
+    *,
+    interactive: bool,
+    profiler: Profiler | None,
+) -> Prefetcher | None:
+    """Create the background prefetch of a project's dependencies, unless it would be wasted.
+
+    With ``--offline``, uv is switched to offline mode for the rest of the run instead.
+
+    Returns:
+        The prefetcher, or None if nothing is prefetched.
+
+    """
+    if args.offline:
+        # Inherited by uv sync and the uv commands of plugin hooks
+        os.environ["UV_OFFLINE"] = "1"
+        return None
+    # Only prefetch when the prompts are followed by a setup that installs dependencies
+    if not interactive or archive_format is not None or args.dry_run or not args.prefetch:
+        return None
+
+    from src.prefetch import Prefetcher
+
+    return Prefetcher(profiler=profiler)
+
+
+def print_profile(profiler: Profiler | None, trace: Path | None) -> None:
+    """Print the time spent in each phase and write the Chrome trace, if profiling.
+
+    Args:
+        profiler: The profiler of the run, or None when not profiling.
+        trace: Where to write the Chrome trace, if anywhere.
+
+    """
+    if profiler is None:
+        return
+
+    from rich.table import Table
+
+    console = get_console()
+    totals = profiler.totals()
+    # Nested phases are included in their parent, so only top-level phases add up to the run
+    elapsed = sum(total.seconds for total in totals if not total.depth) or 1.0
+
+    table = Table(title="Profile", title_justify="left")
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Share", justify="right")
+    for total in totals:
+        table.add_row(
+            "  " * total.depth + total.name,
+            str(total.calls),
+            f"{total.seconds * 1000:.1f}",
+            f"{total.seconds / elapsed:.0%}",
+            style=None if total.depth else "bold",
+        )
+    console.print(table)
+
+    if trace is not None:
+        profiler.write_trace(trace)
+        console.print(f"Chrome trace written to [cyan]{trace}[/cyan]")
+
+
+def print_plan(generator: ProjectGenerator) -> None:
+    """Render a project without writing it and print the planned files with their sizes and hashes.
+
+    Args:
+        generator: The generator of the project, the project manifest included.
+
+    """
+    from src.manifest import PROJECT_MANIFEST_FILE
+
+    console = get_console()
+    rendered = generator.render()
+    manifest = generator.render_manifest()
+    rendered[Path(PROJECT_MANIFEST_FILE)] = manifest
+    statuses = {**generator.statuses, Path(PROJECT_MANIFEST_FILE): manifest.status}
+
+    for path, status in sorted(statuses.items()):
+        file = rendered.get(path)
+        size = f"{file.size:>8}" if file else f"{'-':>8}"
+        digest = file.digest if file else "-" * 64
+        console.print(
+            f"{status.value:>9}  {size}  {digest}  {path.as_posix()}",
+            markup=False,
+            highlight=False,
+            soft_wrap=True,
+        )
+
+    total_size = sum(file.size for file in rendered.values())
+    console.print(f"[bold]Dry run:[/bold] {len(rendered)} files, {total_size} bytes; nothing was written.")
+
+
+def run_update(  # noqa: PLR0913
+    project_dir: Path,
+    jobs: int,
+    *,
+    force: bool,
+    dry_run: bool,
+    profiler: Profiler | None = None,
+    changes: dict[str, Any] | None = None,
+) -> None:
+    """Incrementally update an existing project from its manifest.
+
+    Args:
+        project_dir: The root directory of the generated project.
+        jobs: Number of threads used to render and write files.
+        force: Overwrite or remove files that were modified since they were generated.
+        dry_run: Only print the planned changes.
+        profiler: Records the time spent in each phase, if profiling.
+        changes: Configuration fields to change before re-rendering.
 
     Raises:
-        SystemExit: If the user cancels the operation (e.g., presses Ctrl+C).
+        SystemExit: If the project has no readable manifest, the changes are invalid or generation fails.
 
     """
-    print_banner()
+    import msgspec
+
+    from src.generator import FileStatus, GenerationError, ProjectGenerator
+    from src.manifest import PROJECT_MANIFEST_FILE
+
+    console = get_console()
+
+    try:
+        generator = ProjectGenerator.from_project(project_dir, jobs, force=force, profiler=profiler, changes=changes)
+    except FileNotFoundError as exc:
+        console.print(f"[red]No {PROJECT_MANIFEST_FILE} found in {project_dir.resolve()}.[/red]")
+        raise SystemExit(1) from exc
+    except (OSError, msgspec.DecodeError) as exc:
+        console.print(f"[red]Could not read {PROJECT_MANIFEST_FILE}: {exc}[/red]")
+        raise SystemExit(1) from exc
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise SystemExit(1) from exc
 
     try:
-        # Gather project configuration
-        name = ask_project_name()
-        framework = ask_framework()
-        database = ask_database()
-
-        # Discover plugins early to pass to ask_plugins
-        discovered_plugins = discover_plugins(framework.value)
-
-        # Create partial project config to check applicability
-        config = ProjectConfig(
-            name=name,
-            framework=framework,
-            database=database,
-            plugins=[],  # Will be populated next
-            docker=False,  # Placeholder
-            docker_infra=False,  # Placeholder
+        if dry_run:
+            print_plan(generator)
+            return
+
+        with console.status("[bold green]Updating project..."):
+            generator.generate()
+    except (GenerationError, OSError) as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise SystemExit(1) from exc
+
+    styles = {
+        FileStatus.CREATED: "green",
+        FileStatus.UPDATED: "cyan",
+        FileStatus.REMOVED: "yellow",
+        FileStatus.CONFLICT: "red",
+    }
+    for path, status in generator.statuses.items():
+        if status != FileStatus.UNCHANGED:
+            console.print(f"  [{styles[status]}]{status.value:>9}[/{styles[status]}]  {path.as_posix()}")
+
+    counts = Counter(generator.statuses.values())
+    console.print(
+        f"[bold green]✓[/bold green] Project updated: {counts[FileStatus.CREATED]} created, "
+        f"{counts[FileStatus.UPDATED]} updated, {counts[FileStatus.REMOVED]} removed, "
+        f"{counts[FileStatus.UNCHANGED]} unchanged",
+    )
+    if counts[FileStatus.CONFLICT]:
+        console.print(
+            f"[yellow]{counts[FileStatus.CONFLICT]} locally modified file(s) were left untouched; "
+            "re-run with --force to overwrite them.[/yellow]",
         )
 
-        plugins = ask_plugins(config, discovered_plugins)
-        config.plugins = plugins
 
-        docker, docker_infra = ask_docker()
-        config.docker = docker
-        config.docker_infra = docker_infra
+def run_batch_command(matrix_path: Path, jobs: int, output: Path | None, *, cache: bool = True) -> None:
+    """Generate every project of a matrix file and report per-project timings and failures.
 
-        # Show summary
-        console.print()
-        console.print(
-            Panel.fit(
-                f"[bold]Project:[/bold] {config.name}\n"
-                f"[bold]Framework:[/bold] {config.framework.value}\n"
-                f"[bold]Database:[/bold] {config.database.value}\n"
-                f"[bold]Plugins:[/bold] {', '.join(config.plugins) or 'None'}\n"
-                f"[bold]Docker:[/bold] {'Yes' if config.docker else 'No'}\n"
-                f"[bold]Docker Infra:[/bold] {'Yes' if config.docker_infra else 'No'}",
-                title="Configuration Summary",
-            ),
+    Args:
+        matrix_path: The matrix file.
+        jobs: Number of worker processes.
+        output: Directory overriding the matrix's output directory.
+        cache: Reuse projects generated before from the same configuration.
+
+    Raises:
+        SystemExit: If the matrix is invalid or any project failed.
+
+    """
+    import time
+
+    from rich.text import Text
+
+    from src.batch import run_batch
+    from src.config import load_batch_matrix
+    from src.project_cache import ProjectCache
+
+    console = get_console()
+
+    try:
+        output_root, configs = load_batch_matrix(matrix_path)
+    except ValueError as exc:
+        console.print(Text(str(exc), style="red"))
+        raise SystemExit(1) from exc
+
+    start = time.perf_counter()
+    with console.status(f"[bold green]Generating {len(configs)} projects..."):
+        results = run_batch(configs, output or output_root, jobs, ProjectCache() if cache else None)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.ok:
+            console.print(
+                f"  [green]{'ok':>6}[/green]  {result.seconds:7.3f}s  {result.files:>4} files  {result.output_dir}",
+            )
+        else:
+            console.print(f"  [red]{'failed':>6}[/red]  {result.seconds:7.3f}s  {result.output_dir}", highlight=False)
+            console.print(Text(result.error or "", style="red"), highlight=False)
+
+    failed = sum(not result.ok for result in results)
+    console.print(
+        f"[bold]{len(results) - failed} generated, {failed} failed[/bold] in {elapsed:.2f}s with {jobs} worker(s)",
+    )
+    if failed:
+        raise SystemExit(1)
+
+
+def run_serve_command(host: str, port: int, max_concurrency: int, backlog: int, *, cache: bool = True) -> None:
+    """Serve project generation over HTTP until interrupted.
+
+    Args:
+        host: The address to listen on.
+        port: The port to listen on.
+        max_concurrency: Number of projects generated at the same time.
+        backlog: Number of requests allowed to wait for a worker.
+        cache: Reuse projects generated before from the same configuration.
+
+    Raises:
+        SystemExit: If the ``serve`` extra is not installed.
+
+    """
+    try:
+        import uvicorn
+
+        from src.server import GeneratorService, create_app
+    except ImportError as exc:
+        get_console().print(
+            f"[red]litestar-start serve requires the 'serve' extra ({exc.name} is missing): "
+            "pip install 'litestar-start\\[serve]'[/red]",
         )
-        console.print()
+        raise SystemExit(1) from exc
+    from src.project_cache import ProjectCache
 
-        # Confirm
-        proceed = questionary.confirm("Generate project?", default=True).ask()
-        if not proceed:
-            console.print("[yellow]Cancelled.[/yellow]")
-            raise SystemExit(0)
+    service = GeneratorService(max_concurrency, backlog, ProjectCache() if cache else None)
+    uvicorn.run(create_app(service), host=host, port=port)
+
+
+def ask_project_config(prefetcher: Prefetcher | None = None) -> ProjectConfig:
+    """Ask for the whole project configuration and confirm it.
+
+    Args:
+        prefetcher: Warms the caches for each answer while the next prompts are shown, if given.
 
-        # Generate project
-        output_dir = Path.cwd() / config.slug
-        generator = ProjectGenerator(config, output_dir)
+    Returns:
+        The confirmed project configuration.
+
+    Raises:
+        SystemExit: If the user cancels the operation.
+
+    """
+    import questionary
+    from rich.panel import Panel
+
+    from src.models import ProjectConfig
+    from src.plugin import discover_plugins
+
+    console = get_console()
+
+    # Gather project configuration
+    name = ask_project_name()
+    framework = ask_framework()
+    if prefetcher:
+        # Start on the framework's base dependencies and templates right away
+        prefetcher.update(ProjectConfig(name=name, framework=framework))
+    database = ask_database()
+
+    # Discover plugins early to pass to ask_plugins
+    discovered_plugins = discover_plugins(framework.value)
+
+    # Create partial project config to check applicability
+    config = ProjectConfig(
+        name=name,
+        framework=framework,
+        database=database,
+        plugins=[],  # Will be populated next
+        docker=False,  # Placeholder
+        docker_infra=False,  # Placeholder
+    )
+
+    if prefetcher:
+        prefetcher.update(config)
+
+    plugins = ask_plugins(config, discovered_plugins)
+    config.plugins = plugins
+    if prefetcher:
+        prefetcher.update(config)
+
+    docker, docker_infra = ask_docker()
+    config.docker = docker
+    config.docker_infra = docker_infra
+
+    # Show summary
+    console.print()
+    console.print(
+        Panel.fit(
+            f"[bold]Project:[/bold] {config.name}\n"
+            f"[bold]Framework:[/bold] {config.framework.value}\n"
+            f"[bold]Database:[/bold] {config.database.value}\n"
+            f"[bold]Plugins:[/bold] {', '.join(config.plugins) or 'None'}\n"
+            f"[bold]Docker:[/bold] {'Yes' if config.docker else 'No'}\n"
+            f"[bold]Docker Infra:[/bold] {'Yes' if config.docker_infra else 'No'}",
+            title="Configuration Summary",
+        ),
+    )
+    console.print()
+
+    # Confirm
+    proceed = questionary.confirm("Generate project?", default=True).ask()
+    if not proceed:
+        console.print("[yellow]Cancelled.[/yellow]")
+        raise SystemExit(0)
+
+    return config
+
+
+def generate_project(  # noqa: PLR0913
+    config: ProjectConfig,
+    args: argparse.Namespace,
+    archive_format: ArchiveFormat | None,
+    stdout: BinaryIO,
+    *,
+    interactive: bool,
+    profiler: Profiler | None = None,
+    prefetcher: Prefetcher | None = None,
+) -> None:
+    """Generate a configured project into a directory or archive.
+
+    Args:
+        config: The project configuration.
+        args: The parsed command-line arguments.
+        archive_format: The archive format, or None to write a directory.
+        stdout: The original binary standard output, for archives streamed to ``-``.
+        interactive: Whether the configuration was gathered through prompts.
+        profiler: Records the time spent in each phase, if profiling.
+        prefetcher: The background prefetch to complete before the setup installs dependencies, if any.
+
+    Raises:
+        SystemExit: If generation fails.
+
+    """
+    with profiler.phase("import") if profiler else contextlib.nullcontext():
+        from src.generator import GenerationError, ProjectGenerator
+        from src.project_cache import ProjectCache
+
+    console = get_console()
+
+    output_dir = Path(args.output) if args.output and not archive_format else Path.cwd() / config.slug
+    cache = ProjectCache() if args.cache else None
+    generator = ProjectGenerator(config, output_dir, jobs=args.jobs, profiler=profiler, cache=cache)
+
+    sink = None
+    if archive_format:
+        archive = stdout if args.output == "-" else Path(args.output or f"{config.slug}.{archive_format}")
+        sink = ArchiveSink(archive, archive_format)
+
+    try:
+        if args.dry_run:
+            print_plan(generator)
+            print_profile(profiler, args.profile_trace)
+            return
 
         with console.status("[bold green]Generating project..."):
-            generator.generate()
+            generator.generate(sink)
+    except (GenerationError, OSError) as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise SystemExit(1) from exc
+
+    if sink is not None:
+        destination = "standard output" if args.output == "-" else sink.target
+        console.print(f"[bold green]✓[/bold green] Project archive written to [cyan]{destination}[/cyan]")
+        print_profile(profiler, args.profile_trace)
+        return
 
-        console.print()
-        console.print(f"[bold green]✓[/bold green] Project created at [cyan]{output_dir}[/cyan]")
-        console.print()
+    console.print()
+    console.print(f"[bold green]✓[/bold green] Project created at [cyan]{output_dir}[/cyan]")
+    console.print()
 
-        # Run post-generation setup
+    # Run post-generation setup; scripted runs only do so when asked
+    setup = interactive or args.setup
+    if setup:
+        if prefetcher:
+            with console.status("[bold green]Finishing the dependency prefetch..."):
+                prefetcher.finish()
+        if args.offline and Path("uv.lock") not in generator.files:
+            console.print("[yellow]No pre-resolved lock file matches this project; uv sync needs the network.[/yellow]")
         run_post_generation_setup(generator, output_dir)
+    # Report before the application may be started, which runs until interrupted
+    print_profile(profiler, args.profile_trace)
+    if setup:
+        offer_to_start(config, output_dir, interactive=interactive)
+
 
+def main(argv: list[str] | None = None) -> None:
+    """Run the main CLI interface.
+
+    Prompts for the project configuration, unless it is given through ``--config``
+    or project options.
+
+    Args:
+        argv: Command-line arguments, defaults to ``sys.argv[1:]``.
+
+    """
+    # Fast path: --help and --version exit here, before any heavy import
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    profiler = create_profiler(args)
+
+    if args.command == "update":
+        changes = {option: getattr(args, option) for option in SETTING_OPTIONS if getattr(args, option) is not None}
+        run_update(
+            args.directory,
+            args.jobs,
+            force=args.force,
+            dry_run=args.dry_run,
+            profiler=profiler,
+            changes=changes,
+        )
+        print_profile(profiler, args.profile_trace)
+        return
+    if args.command == "batch":
+        run_batch_command(args.matrix, args.jobs, args.batch_output, cache=args.cache)
+        return
+    if args.command == "serve":
+        run_serve_command(args.host, args.port, args.max_concurrency, args.backlog, cache=args.cache)
+        return
+
+    archive_format = args.archive_format or (infer_archive_format(args.output) if args.output else None)
+    if args.output == "-" and archive_format is None:
+        parser.error("--format is required when streaming to standard output")
+
+    overrides = {option: getattr(args, option) for option in CONFIG_OPTIONS if getattr(args, option) is not None}
+    interactive = args.config is None and not overrides
+    config = None
+    if not interactive:
+        from src.config import load_project_config
+
+        try:
+            with profiler.phase("load config") if profiler else contextlib.nullcontext():
+                config = load_project_config(args.config, overrides)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    stdout = sys.stdout.buffer
+    if args.output == "-":
+        # Keep standard output for the archive; prompts and messages go to stderr
+        sys.stdout = sys.stderr
+
+    prefetcher = create_prefetcher(args, archive_format, interactive=interactive, profiler=profiler)
+
+    try:
+        with prefetcher or contextlib.nullcontext():
+            if config is None:
+                print_banner()
+                config = ask_project_config(prefetcher)
+            generate_project(
+                config,
+                args,
+                archive_format,
+                stdout,
+                interactive=interactive,
+                profiler=profiler,
+                prefetcher=prefetcher,
+            )
     except KeyboardInterrupt:
-        console.print("\n[yellow]Cancelled.[/yellow]")
+        get_console().print("\n[yellow]Cancelled.[/yellow]")
         return
 
 
@@ -0,0 +1,164 @@
+"""Loading and strict validation of project configurations given as files or options."""
+
+import itertools
+from pathlib import Path
+from typing import Any
+
+import msgspec
+
+from src.models import Database, Framework, ProjectConfig
+from src.plugin import discover_plugins
+from src.utils import validate_project_name
+
+
+class BatchMatrix(msgspec.Struct, forbid_unknown_fields=True):
+    """A matrix of projects generated together by the ``batch`` command."""
+
+    projects: list[dict[str, Any]]
+    # Directory the projects are generated into, relative to the matrix file
+    output: str = "."
+    # Configuration fields shared by every project, overridden per project
+    defaults: dict[str, Any] = {}
+
+
+def read_config_file(path: Path) -> object:
+    """Decode a TOML or JSON configuration file, chosen by its suffix.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        The decoded document.
+
+    Raises:
+        ValueError: If the file cannot be read or decoded.
+
+    """
+    decode = msgspec.toml.decode if path.suffix == ".toml" else msgspec.json.decode
+    try:
+        return decode(path.read_bytes())
+    except (OSError, msgspec.DecodeError) as exc:
+        msg = f"could not read {path}: {exc}"
+        raise ValueError(msg) from exc
+
+
+def validate_project_config(data: dict[str, Any]) -> ProjectConfig:
+    """Convert configuration fields into a strictly validated project configuration.
+
+    Args:
+        data: The configuration fields, with enum members given by value.
+
+    Returns:
+        The project configuration.
+
+    Raises:
+        ValueError: If a field is unknown, has the wrong type or value, or names an unusable plugin.
+
+    """
+    if unknown := data.keys() - set(ProjectConfig.__struct_fields__):
+        msg = f"unknown configuration field(s): {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+
+    try:
+        config = msgspec.convert(data, type=ProjectConfig, strict=True)
+    except msgspec.ValidationError as exc:
+        msg = f"invalid configuration: {exc}"
+        raise ValueError(msg) from exc
+
+    if error := validate_project_name(config.name):
+        raise ValueError(error)
+
+    plugins = {plugin.id: plugin for plugin in discover_plugins(config.framework.value)}
+    for plugin_id in config.plugins:
+        if plugin_id not in plugins:
+            msg = f"unknown plugin {plugin_id!r}; available plugins: {', '.join(sorted(plugins))}"
+            raise ValueError(msg)
+        if not plugins[plugin_id].is_applicable(config):
+            msg = f"plugin {plugin_id!r} cannot be used with database {config.database.value}"
+            raise ValueError(msg)
+    config.plugins = list(dict.fromkeys(config.plugins))
+
+    return config
+
+
+def load_project_config(path: Path | None, overrides: dict[str, Any]) -> ProjectConfig:
+    """Load a project configuration from a file and command-line options, strictly validated.
+
+    Args:
+        path: A ``.toml`` or ``.json`` file holding the configuration fields, if any.
+        overrides: Field values given on the command line, which take precedence over the file.
+
+    Returns:
+        The project configuration.
+
+    Raises:
+        ValueError: If the configuration cannot be read or is invalid.
+
+    """
+    data = {} if path is None else read_config_file(path)
+    if not isinstance(data, dict):
+        msg = f"{path} must contain a table of configuration fields"
+        raise ValueError(msg)  # noqa: TRY004
+    return validate_project_config({**data, **overrides})
+
+
+def load_batch_matrix(path: Path) -> tuple[Path, list[ProjectConfig]]:
+    """Load and validate every project of a batch matrix file.
+
+    Args:
+        path: A ``.toml`` or ``.json`` matrix file.
+
+    Returns:
+        The output directory and the configuration of each project, in file order.
+
+    Raises:
+        ValueError: If the matrix cannot be read, a project is invalid, or two projects share a name.
+
+    """
+    try:
+        matrix = msgspec.convert(read_config_file(path), type=BatchMatrix, strict=True)
+    except msgspec.ValidationError as exc:
+        msg = f"invalid matrix {path}: {exc}"
+        raise ValueError(msg) from exc
+
+    configs = []
+    for index, project in enumerate(matrix.projects):
+        try:
+            configs.append(validate_project_config({**matrix.defaults, **project}))
+        except ValueError as exc:
+            msg = f"project {index + 1} in {path}: {exc}"
+            raise ValueError(msg) from exc
+
+    slugs = [config.slug for config in configs]
+    if duplicates := sorted({slug for slug in slugs if slugs.count(slug) > 1}):
+        msg = f"projects in {path} share the output directories: {', '.join(duplicates)}"
+        raise ValueError(msg)
+
+    return path.parent / matrix.output, configs
+
+
+def build_config_matrix(name: str) -> list[ProjectConfig]:
+    """List every combination of database, applicable plugin set and Docker flags.
+
+    Args:
+        name: The project name of every configuration.
+
+    Returns:
+        The configuration of each combination.
+
+    """
+    plugins = discover_plugins(Framework.LITESTAR.value)
+    configs = []
+    for database in Database:
+        base = ProjectConfig(name=name, database=database)
+        applicable = [plugin.id for plugin in plugins if plugin.is_applicable(base)]
+        plugin_sets = [
+            list(plugin_set)
+            for size in range(len(applicable) + 1)
+            for plugin_set in itertools.combinations(applicable, size)
+        ]
+        configs.extend(
+            ProjectConfig(name=name, database=database, plugins=plugin_set, docker=docker, docker_infra=docker_infra)
+            for plugin_set, docker, docker_infra in itertools.product(plugin_sets, (False, True), (False, True))
+        )
+    return configs
@@ -1,41 +1,302 @@
 """Project generator orchestrator."""
 
+from __future__ import annotations
+
+import contextlib
+from enum import StrEnum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+import msgspec
 
+from src import __version__
+from src.manifest import PROJECT_MANIFEST_FILE, encode_project_manifest, read_project_manifest
 from src.models import Framework, ProjectConfig
+from src.profiling import Profiler
+from src.sinks import DirectorySink, OutputSink
+from src.utils import hash_content
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from src.Litestar.generator import LitestarGenerator, LitestarTemplates
+    from src.project_cache import ProjectCache
+
+
+class FileStatus(StrEnum):
+    """Outcome of generating a single project file."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    REMOVED = "removed"
+    CONFLICT = "conflict"
+
+
+# Statuses of rendered files that have to be written to the output directory
+WRITE_STATUSES = frozenset({FileStatus.CREATED, FileStatus.UPDATED})
+
+
+class RenderedFile(msgspec.Struct, frozen=True):
+    """A project file rendered in memory, or a static asset copied from ``source``."""
+
+    content: str
+    digest: str
+    status: FileStatus
+    source: Path | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the size of the file in bytes."""
+        if self.source is not None:
+            return self.source.stat().st_size
+        return len(self.content.encode("utf-8"))
+
+
+def changed_contents(files: dict[Path, RenderedFile]) -> dict[Path, str]:
+    """Select the rendered files that have to be written.
+
+    Args:
+        files: The rendered files, keyed by output path.
+
+    Returns:
+        The content of every created or updated file, keyed by output path.
+
+    """
+    return {path: file.content for path, file in files.items() if file.status in WRITE_STATUSES and file.source is None}
+
+
+def changed_assets(files: dict[Path, RenderedFile]) -> dict[Path, Path]:
+    """Select the static assets that have to be copied.
+
+    Args:
+        files: The rendered files, keyed by output path.
+
+    Returns:
+        The source of every created or updated static asset, keyed by output path.
+
+    """
+    return {
+        path: file.source for path, file in files.items() if file.status in WRITE_STATUSES and file.source is not None
+    }
+
+
+class GenerationError(Exception):
+    """Raised when one or more project files could not be generated."""
+
+    def __init__(self, errors: dict[Path, Exception]) -> None:
+        """Initialize the error.
+
+        Args:
+            errors: A mapping of output paths to the error raised while generating them.
+
+        """
+        self.errors = dict(sorted(errors.items()))
+        details = "\n".join(f"  {path}: {exc}" for path, exc in self.errors.items())
+        super().__init__(f"Failed to generate {len(self.errors)} file(s):\n{details}")
 
 
 class ProjectGenerator:
     """Orchestrates project generation based on configuration."""
 
-    def __init__(self, config: ProjectConfig, output_dir: Path) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        config: ProjectConfig,
+        output_dir: Path,
+        jobs: int = 1,
+        previous_files: dict[Path, str] | None = None,
+        *,
+        force: bool = False,
+        profiler: Profiler | None = None,
+        cache: ProjectCache | None = None,
+        previous_config: ProjectConfig | None = None,
+        templates: LitestarTemplates | None = None,
+    ) -> None:
         """Initialize the generator.
 
         Args:
             config: Project configuration.
             output_dir: Directory where the project will be generated.
+            jobs: Number of threads used to render and write files.
+            previous_files: File hashes of an earlier generation into ``output_dir``. When given,
+                only files whose rendered content changed are written.
+            force: Overwrite or remove files that were modified since the earlier generation.
+            profiler: Records the time spent in each phase, if given.
+            cache: Materializes a new project generated before from the same configuration
+                instead of rendering it, and stores the projects it does not hold yet.
+            previous_config: The configuration the files of ``previous_files`` were rendered from,
+                by the same package version. Only files whose templates read a setting that
+                changed since are rendered again.
+            templates: Templates loaded once and shared between generators, loaded on first render if not given.
 
         """
         self.config = config
         self.output_dir = output_dir
-        self._framework_generator = None
+        self.jobs = jobs
+        self.previous_files = previous_files
+        self.force = force
+        self.profiler = profiler or Profiler(enabled=False)
+        self.cache = cache
+        self.previous_config = previous_config
+        self.templates = templates
+        self.files: dict[Path, str] = {}
+        self.statuses: dict[Path, FileStatus] = {}
+        self.removed: list[Path] = []
+        # Whether the last generation was materialized from the cache instead of rendered
+        self.cached = False
+        self._framework_generator: LitestarGenerator | None = None
+
+    @classmethod
+    def from_project(
+        cls,
+        project_dir: Path,
+        jobs: int = 1,
+        *,
+        force: bool = False,
+        profiler: Profiler | None = None,
+        changes: Mapping[str, Any] | None = None,
+    ) -> Self:
+        """Create a generator that incrementally updates an existing project.
 
-    def generate(self) -> None:
-        """Generate the project based on configuration."""
-        # Create output directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        Args:
+            project_dir: The root directory of a project created by litestar-start.
+            jobs: Number of threads used to render and write files.
+            force: Overwrite or remove files that were modified since the last generation.
+            profiler: Records the time spent in each phase, if given.
+            changes: Configuration fields to change, with enum members given by value.
+
+        Returns:
+            A generator configured from the project's manifest.
+
+        """
+        manifest = read_project_manifest(project_dir)
+        config = manifest.config
+        if changes:
+            from src.config import validate_project_config
+
+            config = validate_project_config({**msgspec.to_builtins(manifest.config), **changes})
+
+        # Unaffected files are only kept without rendering when the same templates rendered them
+        keep_unaffected = manifest.version == __version__ and config != manifest.config
+        return cls(
+            config,
+            project_dir,
+            jobs,
+            manifest.file_hashes,
+            force=force,
+            profiler=profiler,
+            previous_config=manifest.config if keep_unaffected else None,
+        )
+
+    def _create_framework_generator(self) -> LitestarGenerator:
+        """Create the generator of the configured framework.
+
+        Returns:
+            The framework-specific generator.
 
+        Raises:
+            NotImplementedError: If the framework is not supported.
+
+        """
         # Delegate to framework-specific generator
         if self.config.framework == Framework.LITESTAR:
             from src.Litestar.generator import LitestarGenerator
 
-            self._framework_generator = LitestarGenerator(self.config, self.output_dir)
-            self._framework_generator.generate()
-        else:
-            msg = f"Framework {self.config.framework} is not yet supported"
-            raise NotImplementedError(msg)
+            return LitestarGenerator(
+                self.config,
+                self.output_dir,
+                jobs=self.jobs,
+                previous_files=self.previous_files,
+                force=self.force,
+                profiler=self.profiler,
+                previous_config=self.previous_config,
+                templates=self.templates,
+            )
+        msg = f"Framework {self.config.framework} is not yet supported"
+        raise NotImplementedError(msg)
+
+    def render(self) -> dict[Path, RenderedFile]:
+        """Render the project in memory without touching the output directory.
+
+        Returns:
+            The rendered files, keyed by path relative to the project root.
+
+        """
+        with self.profiler.phase("render"):
+            self._framework_generator = self._create_framework_generator()
+            rendered = self._framework_generator.render()
+
+        self.files = self._framework_generator.files
+        self.statuses = self._framework_generator.statuses
+        self.removed = self._framework_generator.removed
+        return rendered
+
+    def render_manifest(self) -> RenderedFile:
+        """Render the project manifest of the files rendered last.
+
+        An up-to-date manifest is kept untouched when updating an existing project.
+
+        Returns:
+            The manifest, with what would be done with it.
+
+        """
+        manifest = encode_project_manifest(self.config, self.files)
+        manifest_path = self.output_dir / PROJECT_MANIFEST_FILE
+        status = FileStatus.CREATED
+        if self.previous_files is not None and manifest_path.exists():
+            unchanged = manifest_path.read_text(encoding="utf-8") == manifest
+            status = FileStatus.UNCHANGED if unchanged else FileStatus.UPDATED
+        return RenderedFile(manifest, hash_content(manifest), status)
+
+    def generate(self, sink: OutputSink | None = None) -> None:
+        """Generate the project based on configuration.
+
+        The whole project is rendered in memory first and then committed to the
+        sink in one step, together with the project manifest.
+
+        Args:
+            sink: Where to write the project, defaults to the output directory.
+
+        """
+        if sink is None:
+            sink = DirectorySink(self.output_dir, jobs=self.jobs)
+
+        # Only new projects are cached; updates depend on the files already in the output directory
+        cache = self.cache if self.previous_files is None else None
+        if cache is not None:
+            with self.profiler.phase("cache lookup"):
+                cached = cache.load(self.config)
+            if cached is not None:
+                self.files, blobs = cached
+                self.statuses = dict.fromkeys(self.files, FileStatus.CREATED)
+                self.removed = []
+                self.cached = True
+                with self.profiler.phase("write files"):
+                    sink.commit({}, (), blobs)
+                return
+
+        self.cached = False
+        rendered = self.render()
+        contents = changed_contents(rendered)
+
+        with self.profiler.phase("encode manifest"):
+            manifest = self.render_manifest()
+            if manifest.status in WRITE_STATUSES:
+                contents[Path(PROJECT_MANIFEST_FILE)] = manifest.content
+
+        assets = changed_assets(rendered)
+        with self.profiler.phase("write files"):
+            sink.commit(contents, self.removed, assets)
+
+        if cache is not None:
+            # An unwritable cache only costs rendering the project next time
+            with self.profiler.phase("cache store"), contextlib.suppress(OSError):
+                cache.store(self.config, self.files, contents, assets)
 
     def post_generate(self) -> None:
         """Run post-generation tasks."""
-        if self._framework_generator and hasattr(self._framework_generator, "post_generate"):
+        if self._framework_generator is None:
+            # A project materialized from the cache was never rendered
+            self._framework_generator = self._create_framework_generator()
+        if hasattr(self._framework_generator, "post_generate"):
             self._framework_generator.post_generate()
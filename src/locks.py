@@ -0,0 +1,115 @@
+"""Pre-resolved ``uv.lock`` files shipped for each dependency set of the generated projects.
+
+Lock files live in a framework's ``Locks`` directory, named after a digest of the
+dependencies declared by the rendered ``pyproject.toml``, so any configuration with
+the same dependencies shares one lock. They are resolved for a placeholder project
+name, which is replaced by the generated project's name when the lock is emitted.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Self
+
+import msgspec
+
+# Directory (inside a framework directory) holding the pre-resolved lock files
+LOCKS_DIR = "Locks"
+# Lock file emitted into generated projects
+LOCK_FILE = "uv.lock"
+# Project name the shipped lock files are resolved for
+LOCK_PROJECT_NAME = "litestar-start-project"
+
+
+class DependencySpec(msgspec.Struct, frozen=True):
+    """The parts of a ``pyproject.toml`` that decide its resolved dependencies."""
+
+    requires_python: str
+    dependencies: list[str]
+    dependency_groups: dict[str, list[str]]
+
+    @classmethod
+    def from_pyproject(cls, pyproject: str) -> Self:
+        """Read the dependency declarations of a rendered ``pyproject.toml``.
+
+        Args:
+            pyproject: The content of the file.
+
+        Returns:
+            The dependency declarations.
+
+        """
+        data = msgspec.toml.decode(pyproject.encode("utf-8"))
+        project = data.get("project", {})
+        return cls(
+            requires_python=project.get("requires-python", ""),
+            dependencies=list(project.get("dependencies", [])),
+            # Entries including another group are tables; that group is listed on its own anyway
+            dependency_groups={
+                name: [requirement for requirement in group if isinstance(requirement, str)]
+                for name, group in data.get("dependency-groups", {}).items()
+            },
+        )
+
+    @property
+    def requirements(self) -> list[str]:
+        """Every requirement ``uv sync`` installs: the project's and its dependency groups'."""
+        return [
+            *self.dependencies,
+            *(requirement for group in self.dependency_groups.values() for requirement in group),
+        ]
+
+    @property
+    def key(self) -> str:
+        """Identify the dependency set, independently of the declaration order."""
+        canonical = msgspec.json.encode(
+            [
+                self.requires_python,
+                sorted(self.dependencies),
+                sorted((name, sorted(group)) for name, group in self.dependency_groups.items()),
+            ],
+        )
+        return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name the way lock files record it (PEP 503).
+
+    Returns:
+        The normalized name.
+
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_lock_path(framework_dir: Path, spec: DependencySpec) -> Path:
+    """Locate the shipped lock file of a dependency set.
+
+    Args:
+        framework_dir: The framework directory (e.g. ``src/Litestar``).
+        spec: The dependency declarations.
+
+    Returns:
+        The path of the lock file, which exists only if the set was pre-resolved.
+
+    """
+    return framework_dir / LOCKS_DIR / f"{spec.key}.lock"
+
+
+def read_lock(framework_dir: Path, pyproject: str, project_name: str) -> str | None:
+    """Read the shipped lock file matching a rendered ``pyproject.toml``.
+
+    Args:
+        framework_dir: The framework directory (e.g. ``src/Litestar``).
+        pyproject: The content of the rendered ``pyproject.toml``.
+        project_name: The name the project declares in ``pyproject.toml``.
+
+    Returns:
+        The lock file for the project, or None if its dependency set was not pre-resolved.
+
+    """
+    try:
+        lock = get_lock_path(framework_dir, DependencySpec.from_pyproject(pyproject)).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    return lock.replace(f'name = "{LOCK_PROJECT_NAME}"', f'name = "{normalize_name(project_name)}"', 1)
@@ -0,0 +1,458 @@
+"""Static manifest of the templates shipped with the package."""
+
+import contextlib
+import functools
+import hashlib
+import os
+import re
+import secrets
+from collections.abc import Mapping
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+import msgspec
+from jinja2 import BaseLoader, FileSystemLoader, PrefixLoader, meta, nodes
+
+from src import __version__
+from src.models import ProjectConfig
+from src.plugin import PluginMetadata, read_plugin_metadata
+from src.utils import (
+    COMPILED_TEMPLATES_DIR,
+    PLUGIN_TEMPLATES_DIR,
+    PLUGINS_PREFIX,
+    create_environment,
+    get_cache_dir,
+    get_framework_dirs,
+    get_package_dir,
+    get_plugin_dirs,
+    get_source_key,
+    get_template_loader,
+    write_file,
+)
+
+MANIFEST_FILE = "manifest.json"
+# Cache file (inside the cache directory) holding the manifest scanned from a source checkout
+SCANNED_MANIFEST_FILE = "manifest.json"
+# File recording the configuration and file hashes inside a generated project
+PROJECT_MANIFEST_FILE = ".litestar-start.json"
+# Front-matter comment opening a template, e.g. ``{#- when: advanced_alchemy -#}``
+FRONT_MATTER_PATTERN = re.compile(r"\A\{#-?(?P<body>.*?)-?#\}", re.DOTALL)
+FRONT_MATTER_LINE_PATTERN = re.compile(r"(?P<key>when|overlay):\s*(?P<value>.+)")
+# Value of a context key that a context does not hold
+MISSING = object()
+
+
+class Phase(StrEnum):
+    """Generation phase owning a template."""
+
+    CONFIG = "config"
+    BASE = "base"
+    PLUGIN = "plugin"
+    CONTAINERS = "containers"
+
+
+class Overlay(StrEnum):
+    """How a template treats an output path already owned by an earlier template."""
+
+    EXCLUSIVE = "exclusive"
+    OVERRIDE = "override"
+    MERGE = "merge"
+
+
+# Template root (loader prefix) of each phase, plugins excluded
+PHASE_ROOTS = {"Config": Phase.CONFIG, "App": Phase.BASE, "Containers": Phase.CONTAINERS}
+
+
+class TemplateEntry(msgspec.Struct, frozen=True):
+    """A single template and where it is rendered to."""
+
+    template: str
+    output: str
+    phase: Phase
+    plugin: str | None = None
+    # Context variables the template reads, as ``name`` or ``name.attribute`` (see find_context_keys)
+    context_keys: list[str] = []
+    condition: str | None = None
+    overlay: Overlay = Overlay.EXCLUSIVE
+    # Static assets are copied verbatim instead of being rendered
+    static: bool = False
+
+
+class FrameworkManifest(msgspec.Struct):
+    """Templates and plugins of a framework."""
+
+    # Plugin metadata keyed by plugin directory name
+    plugins: dict[str, PluginMetadata]
+    templates: list[TemplateEntry]
+
+    def for_phase(self, phase: Phase) -> list[TemplateEntry]:
+        """List the templates owned by a phase.
+
+        Args:
+            phase: The generation phase.
+
+        Returns:
+            The templates of the phase, in manifest order.
+
+        """
+        return [entry for entry in self.templates if entry.phase == phase]
+
+    def for_plugin(self, plugin: str) -> list[TemplateEntry]:
+        """List the templates shipped by a plugin.
+
+        Args:
+            plugin: The plugin directory name (e.g. 'AdvancedAlchemy').
+
+        Returns:
+            The templates of the plugin, in manifest order.
+
+        """
+        return [entry for entry in self.templates if entry.plugin == plugin]
+
+
+class TemplateManifest(msgspec.Struct):
+    """Manifest of every framework's templates, built once per package version."""
+
+    version: str
+    frameworks: dict[str, FrameworkManifest]
+
+
+class ScannedManifest(msgspec.Struct):
+    """A manifest built by scanning the package, cached with the sources it was scanned from."""
+
+    # See get_source_key
+    source_key: str
+    manifest: TemplateManifest
+
+
+def read_front_matter(source: str) -> dict[str, str]:
+    """Read the settings declared in a template's front-matter comment.
+
+    The comment must open the template and hold one ``key: value`` pair per line,
+    with ``when`` (an inclusion condition) and ``overlay`` as the known keys.
+
+    Args:
+        source: The template source.
+
+    Returns:
+        The declared settings, empty if the template has no front-matter.
+
+    """
+    match = FRONT_MATTER_PATTERN.match(source)
+    if match is None:
+        return {}
+
+    settings = {}
+    for line in filter(None, map(str.strip, match["body"].splitlines())):
+        line_match = FRONT_MATTER_LINE_PATTERN.fullmatch(line)
+        if line_match is None:
+            # An ordinary leading comment
+            return {}
+        settings[line_match["key"]] = line_match["value"].strip()
+    return settings
+
+
+def find_context_keys(ast: nodes.Template) -> set[str]:
+    """Find the context variables a template reads.
+
+    A variable that is only ever read through attribute access is recorded as
+    ``variable.attribute`` for each attribute, so the template only depends on those
+    attributes (e.g. ``project.docker`` rather than the whole ``project``).
+
+    Args:
+        ast: The parsed template.
+
+    Returns:
+        The context keys the rendered output depends on.
+
+    """
+    attribute_reads: dict[str, set[str]] = {}
+    read_through_attribute = set()
+    for getattr_node in ast.find_all(nodes.Getattr):
+        if isinstance(getattr_node.node, nodes.Name):
+            attribute_reads.setdefault(getattr_node.node.name, set()).add(getattr_node.attr)
+            read_through_attribute.add(id(getattr_node.node))
+
+    keys = set()
+    for name in meta.find_undeclared_variables(ast):
+        loads = [node for node in ast.find_all(nodes.Name) if node.name == name and node.ctx == "load"]
+        if loads and all(id(node) in read_through_attribute for node in loads):
+            keys.update(f"{name}.{attribute}" for attribute in attribute_reads[name])
+        else:
+            keys.add(name)
+    return keys
+
+
+def get_context_value(context: Mapping[str, Any], key: str) -> object:
+    """Read the value of a context key recorded by :func:`find_context_keys`.
+
+    Args:
+        context: The template context.
+        key: A ``name`` or ``name.attribute`` context key.
+
+    Returns:
+        The value, or :data:`MISSING` if the context does not hold it.
+
+    """
+    name, _, attribute = key.partition(".")
+    value = context.get(name, MISSING)
+    if attribute and value is not MISSING:
+        return getattr(value, attribute, MISSING)
+    return value
+
+
+def _build_entry(
+    template_name: str,
+    context_keys: set[str],
+    front_matter: dict[str, str],
+    *,
+    static: bool = False,
+) -> TemplateEntry:
+    """Describe a template or static asset from its prefixed loader name and front-matter.
+
+    Returns:
+        The manifest entry for the template.
+
+    """
+    root, _, relative_name = template_name.partition("/")
+    plugin = None
+    if root == PLUGINS_PREFIX:
+        plugin, _, relative_name = relative_name.partition("/")
+
+    return TemplateEntry(
+        template=template_name,
+        output=relative_name.removesuffix(".jinja"),
+        phase=Phase.PLUGIN if plugin else PHASE_ROOTS[root],
+        plugin=plugin,
+        context_keys=sorted(context_keys),
+        condition=front_matter.get("when"),
+        overlay=Overlay(front_matter.get("overlay", Overlay.EXCLUSIVE)),
+        static=static,
+    )
+
+
+def scan_templates(loader: BaseLoader) -> list[TemplateEntry]:
+    """Describe every template and static asset exposed by a prefixed loader.
+
+    Args:
+        loader: A loader laid out like :func:`src.utils.get_template_loader`.
+
+    Returns:
+        The manifest entries, sorted by template name.
+
+    """
+    env = create_environment(loader)
+    templates = []
+    for template_name in env.list_templates():
+        if "__pycache__" in template_name:
+            continue
+        if not template_name.endswith(".jinja"):
+            # Static assets are never decoded, so they have no front-matter or context keys
+            templates.append(_build_entry(template_name, set(), {}, static=True))
+            continue
+
+        source, _, _ = loader.get_source(env, template_name)
+        context_keys = find_context_keys(env.parse(source))
+        front_matter = read_front_matter(source)
+        if "when" in front_matter:
+            # Fail the build on invalid conditions rather than at generation time
+            env.compile_expression(front_matter["when"])
+        templates.append(_build_entry(template_name, context_keys, front_matter))
+    return templates
+
+
+def scan_plugin_templates(plugin_dir: Path) -> list[TemplateEntry]:
+    """Describe the templates of a plugin that lives outside the package.
+
+    Args:
+        plugin_dir: The plugin directory.
+
+    Returns:
+        The manifest entries of the plugin's ``Templates`` directory.
+
+    """
+    if not (plugin_dir / PLUGIN_TEMPLATES_DIR).is_dir():
+        return []
+    loader = PrefixLoader(
+        {
+            PLUGINS_PREFIX: PrefixLoader({plugin_dir.name: FileSystemLoader(str(plugin_dir / PLUGIN_TEMPLATES_DIR))}),
+        },
+    )
+    return scan_templates(loader)
+
+
+def build_manifest() -> TemplateManifest:
+    """Build the template manifest by scanning the package.
+
+    Returns:
+        The manifest describing every framework's templates and plugins.
+
+    """
+    frameworks = {}
+    for framework_dir in get_framework_dirs():
+        plugin_dirs = get_plugin_dirs(framework_dir)
+        frameworks[framework_dir.name] = FrameworkManifest(
+            plugins={plugin_dir.name: read_plugin_metadata(plugin_dir) for plugin_dir in plugin_dirs},
+            templates=scan_templates(get_template_loader(framework_dir, plugin_dirs)),
+        )
+
+    return TemplateManifest(version=__version__, frameworks=frameworks)
+
+
+def write_manifest(path: Path) -> TemplateManifest:
+    """Build the template manifest and write it to a file.
+
+    Args:
+        path: The file to write the manifest to.
+
+    Returns:
+        The written manifest.
+
+    """
+    manifest = build_manifest()
+    path.write_bytes(msgspec.json.encode(manifest))
+    return manifest
+
+
+def load_scanned_manifest() -> TemplateManifest:
+    """Scan the package, reusing the result of an earlier scan of the same sources.
+
+    The scanned manifest is cached in the per-user cache directory, keyed by the size
+    and modification time of every packaged file, so a source checkout only scans its
+    templates again after one of them changed.
+
+    Returns:
+        The template manifest.
+
+    """
+    source_key = get_source_key()
+    cache_path = get_cache_dir() / SCANNED_MANIFEST_FILE
+    try:
+        scanned = msgspec.json.decode(cache_path.read_bytes(), type=ScannedManifest)
+    except (OSError, msgspec.DecodeError):
+        scanned = None
+    if scanned is not None and scanned.source_key == source_key:
+        return scanned.manifest
+
+    manifest = build_manifest()
+    # An unwritable cache only costs a scan next time
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved into place, so concurrent processes never read a partial file
+        temporary = cache_path.with_name(f".{os.getpid()}.{secrets.token_hex(4)}.tmp")
+        try:
+            temporary.write_bytes(msgspec.json.encode(ScannedManifest(source_key, manifest)))
+            temporary.replace(cache_path)
+        finally:
+            temporary.unlink(missing_ok=True)
+    return manifest
+
+
+@functools.cache
+def read_shipped_manifest() -> bytes | None:
+    """Read the manifest generated at build time, if it belongs to this package version.
+
+    Returns:
+        The encoded manifest, or None if no manifest was shipped (e.g. in a source
+        checkout) or it belongs to another package version.
+
+    """
+    try:
+        shipped = (get_package_dir() / COMPILED_TEMPLATES_DIR / MANIFEST_FILE).read_bytes()
+        manifest = msgspec.json.decode(shipped, type=TemplateManifest)
+    except (OSError, msgspec.DecodeError):
+        return None
+    return shipped if manifest.version == __version__ else None
+
+
+def get_templates_key() -> str:
+    """Identify the templates and plugins the package renders from.
+
+    An installed package is identified by its shipped manifest, which records the
+    package version, so nothing is walked on disk; only a source checkout lists its
+    packaged files (see :func:`src.utils.get_source_key`).
+
+    Returns:
+        A hex digest that changes whenever the templates change.
+
+    """
+    shipped = read_shipped_manifest()
+    if shipped is None:
+        return get_source_key()
+    return hashlib.sha256(shipped).hexdigest()
+
+
+@functools.cache
+def load_manifest() -> TemplateManifest:
+    """Load the template manifest generated at build time.
+
+    Falls back to scanning the package when no manifest was shipped (e.g. in a
+    source checkout) or it belongs to another package version (see
+    :func:`load_scanned_manifest`).
+
+    Returns:
+        The template manifest.
+
+    """
+    shipped = read_shipped_manifest()
+    if shipped is None:
+        return load_scanned_manifest()
+    return msgspec.json.decode(shipped, type=TemplateManifest)
+
+
+class ProjectManifest(msgspec.Struct):
+    """Configuration and file hashes of a generated project, used for incremental updates."""
+
+    version: str
+    config: ProjectConfig
+    files: dict[str, str]
+
+    @property
+    def file_hashes(self) -> dict[Path, str]:
+        """Return the recorded file hashes keyed by path relative to the project root."""
+        return {Path(path): digest for path, digest in self.files.items()}
+
+
+def read_project_manifest(project_dir: Path) -> ProjectManifest:
+    """Read the manifest of a generated project.
+
+    Args:
+        project_dir: The root directory of the generated project.
+
+    Returns:
+        The project manifest.
+
+    """
+    return msgspec.json.decode((project_dir / PROJECT_MANIFEST_FILE).read_bytes(), type=ProjectManifest)
+
+
+def encode_project_manifest(config: ProjectConfig, files: dict[Path, str]) -> str:
+    """Encode the manifest of a generated project.
+
+    Args:
+        config: The configuration the project was generated from.
+        files: The hash of each generated file, keyed by path relative to the project root.
+
+    Returns:
+        The manifest as formatted JSON.
+
+    """
+    manifest = ProjectManifest(
+        version=__version__,
+        config=config,
+        files={path.as_posix(): digest for path, digest in sorted(files.items())},
+    )
+    return msgspec.json.format(msgspec.json.encode(manifest), indent=2).decode("utf-8") + "\n"
+
+
+def write_project_manifest(project_dir: Path, config: ProjectConfig, files: dict[Path, str]) -> None:
+    """Write the manifest of a generated project.
+
+    Args:
+        project_dir: The root directory of the generated project.
+        config: The configuration the project was generated from.
+        files: The hash of each generated file, keyed by path relative to the project root.
+
+    """
+    write_file(project_dir / PROJECT_MANIFEST_FILE, encode_project_manifest(config, files))
@@ -26,11 +26,11 @@ class ProjectConfig(msgspec.Struct):
     """Configuration for a new project."""
 
     name: str
-    framework: Framework
-    database: Database
-    plugins: list[str]
-    docker: bool
-    docker_infra: bool
+    framework: Framework = Framework.LITESTAR
+    database: Database = Database.NONE
+    plugins: list[str] = []
+    docker: bool = False
+    docker_infra: bool = False
 
     @property
     def slug(self) -> str:
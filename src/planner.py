@@ -0,0 +1,98 @@
+"""Plan which templates own each output path of a project."""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.generator import GenerationError
+from src.manifest import Overlay, TemplateEntry
+
+
+class OverlayConflictError(Exception):
+    """Raised when several templates claim an output path without declaring an overlay."""
+
+    def __init__(
+        self,
+        templates: list[str],
+        hint: str = "declare 'overlay: override' or 'overlay: merge' in the front-matter of the later template",
+    ) -> None:
+        """Initialize the error.
+
+        Args:
+            templates: The templates claiming the output path, in precedence order.
+            hint: How to resolve the conflict.
+
+        """
+        self.templates = templates
+        super().__init__(f"rendered by {', '.join(templates)}; {hint}")
+
+
+class StaticMergeError(OverlayConflictError):
+    """Raised when a static asset would be merged with another template of the same output path."""
+
+    def __init__(self, templates: list[str], static: list[str]) -> None:
+        """Initialize the error.
+
+        Args:
+            templates: The templates claiming the output path, in precedence order.
+            static: The static assets among them.
+
+        """
+        self.static = static
+        super().__init__(
+            templates,
+            f"static asset(s) {', '.join(static)} are copied verbatim and cannot be merged; "
+            "declare 'overlay: override' to replace the file instead",
+        )
+
+
+def plan_outputs(entries: Iterable[TemplateEntry]) -> dict[Path, tuple[str, ...]]:
+    """Work out the final templates of every output path before anything is rendered.
+
+    Entries are given in precedence order (config, base, plugins, containers). A later
+    entry for an output path that is already owned replaces the owner if it declares
+    ``overlay: override``, is appended to it if it declares ``overlay: merge``, and
+    is a conflict otherwise. Static assets are copied verbatim, so they can override or be
+    overridden, but never be merged with anything.
+
+    Args:
+        entries: The manifest entries selected for the project, in precedence order.
+
+    Returns:
+        The templates rendered into each output path, concatenated in order.
+
+    Raises:
+        GenerationError: If any output path is claimed by more than one exclusive template.
+
+    """
+    plan: dict[Path, list[str]] = {}
+    conflicts: dict[Path, list[str]] = {}
+    static: set[str] = set()
+
+    for entry in entries:
+        output_path = Path(entry.output)
+        owners = plan.get(output_path)
+        if entry.static:
+            static.add(entry.template)
+        if owners is None or entry.overlay == Overlay.OVERRIDE:
+            plan[output_path] = [entry.template]
+        elif entry.overlay == Overlay.MERGE and not static.intersection([*owners, entry.template]):
+            owners.append(entry.template)
+        else:
+            conflicts.setdefault(output_path, [*owners]).append(entry.template)
+
+    if conflicts:
+        raise GenerationError({path: _conflict_error(templates, static) for path, templates in conflicts.items()})
+
+    return {output_path: tuple(templates) for output_path, templates in plan.items()}
+
+
+def _conflict_error(templates: list[str], static: set[str]) -> OverlayConflictError:
+    """Describe why the templates of an output path conflict.
+
+    Returns:
+        A static merge error if a static asset is involved, an overlay conflict otherwise.
+
+    """
+    if static_templates := [template for template in templates if template in static]:
+        return StaticMergeError(templates, static_templates)
+    return OverlayConflictError(templates)
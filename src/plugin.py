@@ -1,12 +1,19 @@
 """Plugin system for project generation."""
 
+import functools
 import importlib
-import pkgutil
 import re
+from collections.abc import Awaitable
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
-from src.models import ProjectConfig
+import msgspec
+
+from src.models import Database, Framework, ProjectConfig
+from src.utils import PLUGIN_METADATA_FILE, PLUGINS_PREFIX, get_package_dir
+
+# Seconds a post-generation hook may run before it is cancelled, unless its plugin sets another timeout
+DEFAULT_HOOK_TIMEOUT = 600.0
 
 
 def camel_to_snake(name: str) -> str:
@@ -20,6 +27,15 @@ def camel_to_snake(name: str) -> str:
     return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).lower()
 
 
+class HookSettings(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """When a plugin's post-generation hook runs, read from the ``[hook]`` table of ``plugin.toml``."""
+
+    # Ids of the plugins whose hooks have to complete first, when they are enabled
+    after: list[str] = []
+    # Seconds the hook may run before it is cancelled
+    timeout: float = DEFAULT_HOOK_TIMEOUT
+
+
 @runtime_checkable
 class Plugin(Protocol):
     """Protocol for Litestar-Start plugins."""
@@ -52,8 +68,8 @@ class Plugin(Protocol):
         """Return context variables to be added to the template rendering context."""
         ...
 
-    def post_generate(self, config: ProjectConfig, output_dir: Path) -> None:
-        """Run post-generation logic."""
+    def post_generate(self, config: ProjectConfig, output_dir: Path) -> Awaitable[None] | None:
+        """Run post-generation logic; an ``async`` hook returns a coroutine awaited by the setup."""
         ...
 
 
@@ -90,41 +106,200 @@ class BasePlugin:
         """
         return {}
 
+    @property
+    def hook(self) -> HookSettings:
+        """Default implementation: no ordering and the default timeout."""
+        return HookSettings()
+
+    @property
+    def has_post_generate(self) -> bool:
+        """Whether the subclass overrides the no-op post-generation hook."""
+        return type(self).post_generate is not BasePlugin.post_generate
+
     def post_generate(self, config: ProjectConfig, output_dir: Path) -> None:
         """Default implementation: no-op."""
 
 
-def discover_plugins(framework: str) -> list[Plugin]:
+def get_hook_settings(plugin: Plugin) -> HookSettings:
+    """Read when a plugin's post-generation hook runs.
+
+    Plugins written against the protocol alone have no ``hook`` settings and get the defaults.
+
+    Returns:
+        The ordering and timeout of the hook.
+
+    """
+    return getattr(plugin, "hook", None) or HookSettings()
+
+
+def has_post_generate(plugin: Plugin) -> bool:
+    """Check whether a plugin has post-generation logic to run.
+
+    Plugins written against the protocol alone cannot tell, so their hook is always run.
+
+    Returns:
+        True if the plugin's ``post_generate`` has to run.
+
+    """
+    return getattr(plugin, "has_post_generate", True)
+
+
+class PluginMetadata(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """Declarative description of a plugin, read from its ``plugin.toml``."""
+
+    id: str
+    name: str
+    description: str = ""
+    # Framework a third-party plugin extends; built-in plugins live in their framework's directory
+    framework: Framework = Framework.LITESTAR
+    # Databases the plugin can be used with; empty means any database
+    databases: list[Database] = []
+    hook: HookSettings = msgspec.field(default_factory=HookSettings)
+
+    def is_applicable(self, config: ProjectConfig) -> bool:
+        """Check the applicability rules against a configuration.
+
+        Args:
+            config: The project configuration.
+
+        Returns:
+            True if the plugin can be offered for the configuration.
+
+        """
+        return not self.databases or config.database in self.databases
+
+
+def read_plugin_metadata(plugin_dir: Path) -> PluginMetadata:
+    """Read the metadata file of a plugin.
+
+    Args:
+        plugin_dir: The plugin directory.
+
+    Returns:
+        The plugin metadata.
+
+    """
+    return msgspec.toml.decode((plugin_dir / PLUGIN_METADATA_FILE).read_bytes(), type=PluginMetadata)
+
+
+class RegisteredPlugin:
+    """A plugin known from its metadata, whose module is only imported when its hooks run."""
+
+    def __init__(self, metadata: PluginMetadata, path: Path, module_name: str) -> None:
+        """Initialize the plugin.
+
+        Args:
+            metadata: The plugin metadata.
+            path: Absolute path to the plugin directory.
+            module_name: The dotted name of the plugin package.
+
+        """
+        self.metadata = metadata
+        self.path = path
+        self.module_name = module_name
+
+    @property
+    def id(self) -> str:
+        """Unique identifier for the plugin."""
+        return self.metadata.id
+
+    @property
+    def name(self) -> str:
+        """Display name for the CLI."""
+        return self.metadata.name
+
+    @property
+    def description(self) -> str:
+        """Short description for the CLI."""
+        return self.metadata.description
+
+    @property
+    def hook(self) -> HookSettings:
+        """When the post-generation hook runs: the hooks it waits for and its timeout."""
+        return self.metadata.hook
+
+    @property
+    def has_post_generate(self) -> bool:
+        """Whether the plugin overrides the no-op post-generation hook; imports the plugin package."""
+        return type(self.implementation).post_generate is not BasePlugin.post_generate
+
+    @functools.cached_property
+    def implementation(self) -> BasePlugin:
+        """Import the plugin package and instantiate its plugin class.
+
+        Packages without a :class:`BasePlugin` subclass get the default hooks.
+        """
+        module = importlib.import_module(self.module_name)
+        plugin_class = next(
+            (
+                attr
+                for attr in vars(module).values()
+                if isinstance(attr, type) and issubclass(attr, BasePlugin) and attr is not BasePlugin
+            ),
+            BasePlugin,
+        )
+        plugin = plugin_class()
+        plugin.path = self.path
+        return plugin
+
+    def is_applicable(self, config: ProjectConfig) -> bool:
+        """Check if the plugin is applicable for the given configuration.
+
+        Returns:
+            True if the plugin's applicability rules hold.
+
+        """
+        return self.metadata.is_applicable(config)
+
+    def get_template_context(self, config: ProjectConfig) -> dict:
+        """Return context variables to be added to the template rendering context.
+
+        Returns:
+            The plugin's template context.
+
+        """
+        return self.implementation.get_template_context(config)
+
+    def post_generate(self, config: ProjectConfig, output_dir: Path) -> Awaitable[None] | None:
+        """Run post-generation logic.
+
+        Returns:
+            The coroutine of an ``async`` hook, to be awaited by the caller.
+
+        """
+        return self.implementation.post_generate(config, output_dir)
+
+
+@functools.cache
+def discover_plugins(framework: str) -> tuple[Plugin, ...]:
     """Discover plugins for a specific framework.
 
+    The registry is built once per process from the plugin metadata recorded in the
+    template manifest, followed by third-party plugins published under the
+    ``litestar_start.plugins`` entry-point group; plugin modules are only imported
+    when one of their hooks runs.
+
     Args:
         framework: The framework name (e.g., 'Litestar').
 
     Returns:
-        A list of discovered plugin instances.
+        The built-in plugins sorted by directory name, then the third-party plugins.
 
     """
-    from src.utils import get_package_dir
-
-    plugins_path = get_package_dir() / framework / "Plugins"
-    if not plugins_path.exists():
-        return []
-
-    plugins = []
-    # Use pkgutil to iterate over modules in the Plugins directory
-    for _, module_name, is_pkg in pkgutil.iter_modules([str(plugins_path)]):
-        if is_pkg:
-            try:
-                module = importlib.import_module(f"src.{framework}.Plugins.{module_name}")
-                # Look for a class that implements the Plugin protocol
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, BasePlugin) and attr is not BasePlugin:
-                        plugin_instance = attr()
-                        plugin_instance.path = plugins_path / module_name
-                        plugins.append(plugin_instance)
-                        break  # Only one plugin per module
-            except (ImportError, AttributeError):
-                continue
-
-    return plugins
+    from src.manifest import load_manifest
+    from src.registry import get_external_plugins
+
+    framework_manifest = load_manifest().frameworks.get(framework)
+    if framework_manifest is None:
+        return ()
+
+    plugins_path = get_package_dir() / framework / PLUGINS_PREFIX
+    builtin = [
+        RegisteredPlugin(metadata, plugins_path / plugin_dir, f"src.{framework}.{PLUGINS_PREFIX}.{plugin_dir}")
+        for plugin_dir, metadata in framework_manifest.plugins.items()
+    ]
+    external = [
+        RegisteredPlugin(plugin.metadata, Path(plugin.path), plugin.module)
+        for plugin in get_external_plugins(framework)
+    ]
+    return (*builtin, *external)
@@ -0,0 +1,161 @@
+"""Background warming of the template and dependency caches while prompts are answered."""
+
+import os
+import shutil
+import subprocess  # noqa: S404
+import tempfile
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import msgspec
+
+from src.generator import GenerationError, ProjectGenerator
+from src.locks import DependencySpec
+from src.models import ProjectConfig
+from src.profiling import Profiler
+
+
+class Prefetcher:
+    """Compile templates and download a project's dependencies into the uv cache on a background thread.
+
+    The configuration is refined as prompts are answered; the worker always moves on to
+    the latest one and only installs again when it brings requirements that were not
+    prefetched yet. Everything is best effort: failures only mean ``uv sync`` downloads
+    the packages itself.
+    """
+
+    def __init__(self, uv: str | None = None, profiler: Profiler | None = None) -> None:
+        """Initialize the prefetcher; the worker starts with the first configuration.
+
+        Args:
+            uv: The uv executable, found on ``PATH`` by default. Without uv only templates are warmed.
+            profiler: Records the time spent prefetching, if given.
+
+        """
+        self.uv = uv or shutil.which("uv")
+        self.profiler = profiler or Profiler(enabled=False)
+        self.prefetched: set[str] = set()
+        self.errors: list[str] = []
+        self._pending: ProjectConfig | None = None
+        self._closed = False
+        self._cancelled = False
+        self._process: subprocess.Popen[bytes] | None = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="litestar-start-prefetch", daemon=True)
+
+    def __enter__(self) -> Self:
+        """Use the prefetcher for a block, cancelling whatever is left when it exits.
+
+        Returns:
+            The prefetcher.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Cancel any prefetch still running."""
+        self.cancel()
+
+    def update(self, config: ProjectConfig) -> None:
+        """Prefetch for a possibly partial configuration, replacing one that was not started yet.
+
+        Args:
+            config: The configuration answered so far.
+
+        """
+        with self._condition:
+            if self._closed:
+                return
+            # The prompts keep filling in the same configuration object
+            self._pending = msgspec.structs.replace(config, plugins=list(config.plugins))
+            self._condition.notify()
+        if not self._thread.is_alive():
+            self._thread.start()
+
+    def finish(self) -> None:
+        """Wait until the latest configuration has been prefetched."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread.is_alive():
+            with self.profiler.phase("wait for prefetch"):
+                self._thread.join()
+
+    def cancel(self) -> None:
+        """Stop prefetching, interrupting a running download."""
+        with self._condition:
+            self._closed = self._cancelled = True
+            self._pending = None
+            if self._process is not None:
+                self._process.terminate()
+            self._condition.notify()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Prefetch every configuration handed over until the prefetcher is closed."""
+        with tempfile.TemporaryDirectory(prefix="litestar-start-prefetch-") as venv:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                    config, self._pending = self._pending, None
+                if config is None:
+                    return
+                try:
+                    self._prefetch(config, Path(venv))
+                except (GenerationError, OSError, subprocess.CalledProcessError, msgspec.DecodeError) as exc:
+                    self.errors.append(str(exc))
+
+    def _prefetch(self, config: ProjectConfig, venv: Path) -> None:
+        """Render a configuration, compiling its templates, and install its requirements into a scratch venv."""
+        with self.profiler.phase("prefetch templates"):
+            rendered = ProjectGenerator(config, Path(config.slug)).render()
+        pyproject = rendered.get(Path("pyproject.toml"))
+        if self.uv is None or pyproject is None:
+            return
+
+        spec = DependencySpec.from_pyproject(pyproject.content)
+        requirements = spec.requirements
+        if self.prefetched.issuperset(requirements):
+            return
+
+        with self.profiler.phase("prefetch dependencies"):
+            if not (venv / "pyvenv.cfg").exists():
+                self._uv("venv", "--quiet", "--no-project", "--python", spec.requires_python or "3", str(venv))
+            # Installing resolves the whole set like uv sync will; symlinks avoid copying out of the cache
+            self._uv("pip", "install", "--quiet", "--link-mode", "symlink", *requirements, venv=venv)
+        self.prefetched.update(requirements)
+
+    def _uv(self, *args: str, venv: Path | None = None) -> None:
+        """Run uv quietly, unless prefetching was cancelled.
+
+        Args:
+            *args: The uv arguments.
+            venv: The virtual environment uv pip commands act on.
+
+        Raises:
+            CalledProcessError: If uv fails.
+
+        """
+        with self._condition:
+            if self._cancelled:
+                return
+            process = self._process = subprocess.Popen(  # noqa: S603
+                [str(self.uv), *args],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env={**os.environ, "VIRTUAL_ENV": str(venv)} if venv else None,
+            )
+        returncode = process.wait()
+        with self._condition:
+            self._process = None
+        if returncode and not self._cancelled:
+            raise subprocess.CalledProcessError(returncode, [self.uv, *args])
@@ -0,0 +1,219 @@
+"""Per-phase timing of a generation run, reported as a table or a Chrome trace."""
+
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import msgspec
+
+# Category of the spans that make up the phase table; other spans only appear in traces
+PHASE_CATEGORY = "phase"
+
+# Open phases of the current thread or asyncio task, outermost first
+_open_phases: contextvars.ContextVar[tuple[str, ...]] = contextvars.ContextVar("open_phases", default=())
+# Trace track of the current asyncio task, if it runs alongside others on the same thread
+_track: contextvars.ContextVar[str | None] = contextvars.ContextVar("track", default=None)
+
+
+class Span(msgspec.Struct, frozen=True):
+    """A timed section of a generation run."""
+
+    name: str
+    category: str
+    # Nanoseconds since the profiler was created
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    # Name of the thread, or of the track of the asyncio task, the span was recorded on
+    thread_name: str
+    # Names of the enclosing phases on the same thread or task, outermost first
+    parents: tuple[str, ...] = ()
+
+
+class PhaseTotal(msgspec.Struct, frozen=True):
+    """Time spent in one phase, summed over every time it ran."""
+
+    name: str
+    depth: int
+    calls: int
+    seconds: float
+
+
+class TraceEvent(msgspec.Struct, frozen=True, omit_defaults=True):
+    """An event of the Chrome trace event format."""
+
+    name: str
+    ph: str
+    pid: int
+    tid: int
+    ts: float = 0
+    dur: float = 0
+    cat: str = ""
+    args: dict[str, str] = {}
+
+
+class Trace(msgspec.Struct, frozen=True):
+    """A Chrome trace, loadable in ``chrome://tracing`` or Perfetto."""
+
+    traceEvents: list[TraceEvent]  # noqa: N815
+    displayTimeUnit: str = "ms"  # noqa: N815
+
+
+class Profiler:
+    """Record how long each phase of a generation run takes, across threads and asyncio tasks.
+
+    A disabled profiler records nothing and adds next to no overhead, so code can
+    always time its phases through one.
+    """
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        """Initialize the profiler.
+
+        Args:
+            enabled: Whether to record spans.
+
+        """
+        self.enabled = enabled
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def phase(self, name: str, category: str = PHASE_CATEGORY) -> contextlib.AbstractContextManager[None]:
+        """Time a section of the run.
+
+        Args:
+            name: The name of the section.
+            category: Phases make up the timing table; other categories only appear in traces.
+
+        Returns:
+            A context manager timing the enclosed code.
+
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._record(name, category)
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> Generator[None]:  # noqa: PLR6301
+        """Record the spans of the enclosed code on a track of their own in traces.
+
+        Concurrent asyncio tasks share a thread, but their spans overlap rather than nest,
+        so each task records on its own track.
+
+        Args:
+            name: The name of the track.
+
+        Yields:
+            Nothing; spans recorded inside the block go to the track.
+
+        """
+        token = _track.set(name)
+        try:
+            yield
+        finally:
+            _track.reset(token)
+
+    @contextlib.contextmanager
+    def _record(self, name: str, category: str) -> Generator[None]:
+        """Record a span around the enclosed code, nested under the open phases of the thread or task."""
+        parents = _open_phases.get()
+        token = _open_phases.set((*parents, name)) if category == PHASE_CATEGORY else None
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            if token is not None:
+                _open_phases.reset(token)
+            thread = threading.current_thread()
+            span = Span(
+                name,
+                category,
+                start - self._origin,
+                duration,
+                thread.ident or 0,
+                _track.get() or thread.name,
+                parents,
+            )
+            with self._lock:
+                self.spans.append(span)
+
+    def totals(self) -> list[PhaseTotal]:
+        """Sum the time of each phase, listing nested phases right after the phase enclosing them.
+
+        Returns:
+            The total of each phase, in the order phases first started.
+
+        """
+        totals: dict[tuple[str, ...], PhaseTotal] = {}
+        children: dict[tuple[str, ...], list[tuple[str, ...]]] = {}
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            if span.category != PHASE_CATEGORY:
+                continue
+            key = (*span.parents, span.name)
+            if (total := totals.get(key)) is None:
+                children.setdefault(span.parents, []).append(key)
+                total = PhaseTotal(span.name, len(span.parents), 0, 0.0)
+            totals[key] = PhaseTotal(total.name, total.depth, total.calls + 1, total.seconds + span.duration_ns / 1e9)
+
+        ordered: list[PhaseTotal] = []
+
+        def visit(parent: tuple[str, ...]) -> None:
+            for key in children.get(parent, []):
+                ordered.append(totals[key])
+                visit(key)
+
+        visit(())
+        return ordered
+
+    def to_chrome_trace(self) -> Trace:
+        """Convert the recorded spans to the Chrome trace event format.
+
+        Returns:
+            The trace, with one complete event per span and the name of every thread.
+
+        """
+        pid = os.getpid()
+        # Number every thread and task track, as tracks of one thread must not share its id
+        tracks = {track: index for index, track in enumerate(dict.fromkeys(map(_track_of, self.spans)), 1)}
+        events = [
+            TraceEvent("thread_name", "M", pid, track_id, args={"name": thread_name})
+            for (_, thread_name), track_id in tracks.items()
+        ]
+        events.extend(
+            TraceEvent(
+                span.name,
+                "X",
+                pid,
+                tracks[_track_of(span)],
+                ts=span.start_ns / 1000,
+                dur=span.duration_ns / 1000,
+                cat=span.category,
+            )
+            for span in sorted(self.spans, key=lambda span: span.start_ns)
+        )
+        return Trace(events)
+
+    def write_trace(self, path: Path) -> None:
+        """Write the recorded spans to a Chrome trace file.
+
+        Args:
+            path: The JSON file to write.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(msgspec.json.encode(self.to_chrome_trace()))
+
+
+def _track_of(span: Span) -> tuple[int, str]:
+    """Identify the thread or task track a span was recorded on.
+
+    Returns:
+        The thread id and the thread or track name.
+
+    """
+    return span.thread_id, span.thread_name
@@ -0,0 +1,200 @@
+"""Content-addressed cache of generated projects.
+
+Generating a project is a pure function of its configuration, the package (templates
+included) and the installed third-party plugins. Each generated file is stored once
+as a blob named after the SHA-256 of its bytes, and each configuration records which
+blob every output path holds, so a repeated configuration is materialized by copying
+(or reflinking) blobs instead of rendering anything.
+"""
+
+import functools
+import hashlib
+import os
+import secrets
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+import msgspec
+
+from src import __version__
+from src.manifest import get_templates_key
+from src.models import ProjectConfig
+from src.registry import get_environment_key
+from src.utils import copy_asset, get_cache_dir, write_file
+
+# Directory (inside the cache directory) holding the project cache
+PROJECT_CACHE_DIR = "projects"
+
+
+class CachedProject(msgspec.Struct, frozen=True):
+    """The files of a cached project, keyed by POSIX path relative to the project root."""
+
+    # The hash of each generated file, as recorded in the project manifest
+    files: dict[str, str]
+    # The blob holding each file, the project manifest included
+    blobs: dict[str, str]
+
+
+class ProjectCache:
+    """Store generated projects on disk and materialize repeated configurations from it."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: The cache directory, defaults to ``projects`` in the per-user cache directory.
+
+        """
+        self.root = root or get_cache_dir() / PROJECT_CACHE_DIR
+
+    @functools.cached_property
+    def environment_key(self) -> str:
+        """Identify the package version and templates and the installed distributions, once per cache."""
+        return hashlib.sha256(f"{__version__}\0{get_environment_key()}\0{get_templates_key()}".encode()).hexdigest()
+
+    def key(self, config: ProjectConfig) -> str:
+        """Identify the project generated from a configuration.
+
+        Returns:
+            A hex digest of the configuration, the package version and templates, and the
+            installed distributions.
+
+        """
+        digest = hashlib.sha256(self.environment_key.encode())
+        digest.update(msgspec.json.encode(config))
+        return digest.hexdigest()
+
+    def _blob_path(self, blob: str) -> Path:
+        """Locate a blob, sharded by the first two characters of its name.
+
+        Returns:
+            The path of the blob.
+
+        """
+        return self.root / "blobs" / blob[:2] / blob
+
+    def _entry_path(self, config: ProjectConfig) -> Path:
+        """Locate the entry of a configuration.
+
+        Returns:
+            The path of the entry.
+
+        """
+        key = self.key(config)
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def load(self, config: ProjectConfig) -> tuple[dict[Path, str], dict[Path, Path]] | None:
+        """Look up the project generated from a configuration.
+
+        Every blob is hashed again, so a blob that went missing or was modified on disk
+        is never materialized; the entry is dropped and the project rendered again.
+
+        Args:
+            config: The project configuration.
+
+        Returns:
+            The hash of each generated file and the blob to materialize each output path
+            from, or None if the project is not cached or a blob is missing or corrupt.
+
+        """
+        entry_path = self._entry_path(config)
+        try:
+            entry = msgspec.json.decode(entry_path.read_bytes(), type=CachedProject)
+        except (OSError, msgspec.DecodeError):
+            return None
+        blobs = {Path(path): self._blob_path(blob) for path, blob in entry.blobs.items()}
+        if not all(map(self._verify_blob, blobs.values())):
+            entry_path.unlink(missing_ok=True)
+            return None
+        return {Path(path): digest for path, digest in entry.files.items()}, blobs
+
+    @staticmethod
+    def _verify_blob(blob_path: Path) -> bool:
+        """Check that a blob still holds the bytes it is named after, deleting it otherwise.
+
+        A corrupt blob is deleted so that storing the project again replaces it.
+
+        Returns:
+            True if the blob exists and is intact.
+
+        """
+        try:
+            with blob_path.open("rb") as file:
+                intact = hashlib.file_digest(file, "sha256").hexdigest() == blob_path.name
+        except OSError:
+            return False
+        if not intact:
+            blob_path.unlink(missing_ok=True)
+        return intact
+
+    def store(
+        self,
+        config: ProjectConfig,
+        files: Mapping[Path, str],
+        contents: Mapping[Path, str],
+        assets: Mapping[Path, Path],
+    ) -> None:
+        """Store the project generated from a configuration.
+
+        Blobs and entries are written to temporary files and moved into place, so
+        concurrent processes storing the same project never see a partial file.
+
+        Args:
+            config: The project configuration.
+            files: The hash of each generated file, as recorded in the project manifest.
+            contents: The content of each rendered file, keyed by output path.
+            assets: The source of each static asset, keyed by output path.
+
+        """
+        blobs = {}
+        # Text is written the way the uncached project would be, newline translation included
+        for path, content in contents.items():
+            blobs[path.as_posix()] = self._store_blob(functools.partial(write_file, content=content))
+        for path, source in assets.items():
+            blobs[path.as_posix()] = self._store_blob(functools.partial(copy_asset, source))
+
+        entry = CachedProject(
+            files={path.as_posix(): digest for path, digest in sorted(files.items())},
+            blobs=dict(sorted(blobs.items())),
+        )
+        entry_path = self._entry_path(config)
+        temporary = self._temporary_path()
+        try:
+            temporary.write_bytes(msgspec.json.encode(entry))
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.replace(entry_path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    def _temporary_path(self) -> Path:
+        """Reserve a temporary file name on the filesystem of the cache.
+
+        Returns:
+            A path that does not exist yet.
+
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f".{os.getpid()}.{secrets.token_hex(4)}.tmp"
+
+    def _store_blob(self, write: Callable[[Path], None]) -> str:
+        """Write a file and move it to the blob named after its bytes, unless that blob exists.
+
+        Args:
+            write: Creates the file at the given path.
+
+        Returns:
+            The name of the blob.
+
+        """
+        temporary = self._temporary_path()
+        try:
+            write(temporary)
+            with temporary.open("rb") as file:
+                blob = hashlib.file_digest(file, "sha256").hexdigest()
+            blob_path = self._blob_path(blob)
+            if not blob_path.exists():
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                temporary.replace(blob_path)
+        finally:
+            temporary.unlink(missing_ok=True)
+        return blob
@@ -0,0 +1,167 @@
+"""Registry of third-party plugins published under an entry-point group."""
+
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import sys
+from pathlib import Path
+
+import msgspec
+
+from src.manifest import FrameworkManifest, TemplateEntry, load_manifest, scan_plugin_templates
+from src.plugin import PluginMetadata, read_plugin_metadata
+from src.utils import get_cache_dir
+
+# Entry-point group under which distributions publish plugin packages
+ENTRY_POINT_GROUP = "litestar_start.plugins"
+# Cache file (inside the cache directory) holding the resolved third-party plugins
+REGISTRY_FILE = "plugins.json"
+
+
+class ExternalPlugin(msgspec.Struct, frozen=True):
+    """A third-party plugin resolved from an entry point."""
+
+    module: str
+    path: str
+    metadata: PluginMetadata
+    templates: list[TemplateEntry] = []
+
+    @property
+    def key(self) -> str:
+        """Plugin key used in template names, the name of the plugin directory."""
+        return Path(self.path).name
+
+
+class PluginRegistry(msgspec.Struct):
+    """Third-party plugins resolved for one set of installed distributions."""
+
+    key: str
+    plugins: list[ExternalPlugin]
+
+
+def get_environment_key() -> str:
+    """Identify the set of installed distributions without reading their metadata.
+
+    Only lists the ``*.dist-info``/``*.egg-info`` directories on ``sys.path``, whose
+    names carry each distribution's name and version.
+
+    Returns:
+        A hex digest that changes whenever a distribution is installed, upgraded or removed.
+
+    """
+    digest = hashlib.sha256()
+    for entry in sys.path:
+        try:
+            names = sorted(
+                path.name for path in Path(entry or ".").iterdir() if path.name.endswith((".dist-info", ".egg-info"))
+            )
+        except OSError:
+            continue
+        digest.update("\0".join([entry, *names, "\n"]).encode())
+    return digest.hexdigest()
+
+
+def _resolve_plugin(entry_point: importlib.metadata.EntryPoint) -> ExternalPlugin | None:
+    """Resolve an entry point to the plugin package it names.
+
+    Returns:
+        The plugin, or None if the entry point does not name a plugin package.
+
+    """
+    try:
+        spec = importlib.util.find_spec(entry_point.module)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+
+    path = Path(next(iter(spec.submodule_search_locations)))
+    try:
+        metadata = read_plugin_metadata(path)
+        templates = scan_plugin_templates(path)
+    except (OSError, ValueError, msgspec.DecodeError):
+        return None
+    return ExternalPlugin(module=entry_point.module, path=str(path), metadata=metadata, templates=templates)
+
+
+def scan_entry_points() -> list[ExternalPlugin]:
+    """Resolve every plugin published under the entry-point group.
+
+    Returns:
+        The resolved plugins, sorted by plugin key.
+
+    """
+    plugins = filter(None, map(_resolve_plugin, importlib.metadata.entry_points(group=ENTRY_POINT_GROUP)))
+    return sorted(plugins, key=lambda plugin: plugin.key)
+
+
+@functools.cache
+def load_plugin_registry() -> PluginRegistry:
+    """Load the third-party plugin registry, rescanning entry points only when needed.
+
+    The registry is cached on disk, keyed by the installed distributions, so
+    ``importlib.metadata`` is only scanned when a distribution is installed,
+    upgraded or removed.
+
+    Returns:
+        The plugin registry for the current environment.
+
+    """
+    key = get_environment_key()
+    registry_path = get_cache_dir() / REGISTRY_FILE
+    try:
+        registry = msgspec.json.decode(registry_path.read_bytes(), type=PluginRegistry)
+    except (OSError, msgspec.DecodeError):
+        registry = None
+    if registry is not None and registry.key == key:
+        return registry
+
+    registry = PluginRegistry(key=key, plugins=scan_entry_points())
+    try:
+        registry_path.parent.mkdir(parents=True, exist_ok=True)
+        registry_path.write_bytes(msgspec.json.encode(registry))
+    except OSError:
+        # An unwritable cache only costs a rescan next time
+        pass
+    return registry
+
+
+def get_external_plugins(framework: str) -> list[ExternalPlugin]:
+    """List the third-party plugins of a framework.
+
+    Plugins whose key clashes with a built-in plugin are ignored.
+
+    Args:
+        framework: The framework name (e.g., 'Litestar').
+
+    Returns:
+        The third-party plugins extending the framework.
+
+    """
+    framework_manifest = load_manifest().frameworks.get(framework)
+    builtin = framework_manifest.plugins if framework_manifest else {}
+    return [
+        plugin
+        for plugin in load_plugin_registry().plugins
+        if plugin.metadata.framework == framework and plugin.key not in builtin
+    ]
+
+
+@functools.cache
+def get_framework_manifest(framework: str) -> FrameworkManifest:
+    """Combine a framework's built-in manifest with its third-party plugins.
+
+    Args:
+        framework: The framework name (e.g., 'Litestar').
+
+    Returns:
+        The manifest of the framework's built-in and third-party templates and plugins.
+
+    """
+    manifest = load_manifest().frameworks[framework]
+    external = get_external_plugins(framework)
+    return FrameworkManifest(
+        plugins={**manifest.plugins, **{plugin.key: plugin.metadata for plugin in external}},
+        templates=[*manifest.templates, *(entry for plugin in external for entry in plugin.templates)],
+    )
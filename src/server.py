@@ -0,0 +1,236 @@
+"""HTTP service generating projects from one long-running process.
+
+The manifest, plugin registry and compiled templates are loaded once at startup and
+stay warm, so a request only pays for rendering (or materializing a cached project)
+and archiving it. Requires the ``serve`` extra: ``pip install 'litestar-start[serve]'``.
+"""
+
+import io
+import time
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+
+import anyio
+import anyio.to_thread
+import msgspec
+from litestar import Litestar, get, post
+from litestar.exceptions import ServiceUnavailableException, ValidationException
+from litestar.params import QueryParameter
+from litestar.response import Stream
+
+from src.api import Generator
+from src.config import validate_project_config
+from src.models import ProjectConfig
+from src.project_cache import ProjectCache
+from src.sinks import ArchiveFormat, ArchiveSink
+
+# Size of the chunks an archive is streamed to the client in
+CHUNK_SIZE = 64 * 1024
+
+# Content type of each archive format
+MEDIA_TYPES = {
+    ArchiveFormat.ZIP: "application/zip",
+    ArchiveFormat.TAR: "application/x-tar",
+    ArchiveFormat.TAR_GZ: "application/gzip",
+}
+
+
+class ServiceMetrics(msgspec.Struct):
+    """Counters of the requests served since startup."""
+
+    # Generation requests received
+    requests: int = 0
+    # Projects generated and streamed
+    generated: int = 0
+    # Generated projects materialized from the project cache
+    cached: int = 0
+    # Requests rejected for an invalid configuration
+    invalid: int = 0
+    # Requests rejected because every worker was busy and the backlog was full
+    rejected: int = 0
+    # Projects that failed to generate
+    failed: int = 0
+    # Projects being generated or waiting for a worker
+    in_flight: int = 0
+    # Bytes of archives sent
+    bytes_sent: int = 0
+    # Total and slowest time spent generating and archiving a project
+    generation_seconds: float = 0.0
+    max_generation_seconds: float = 0.0
+
+
+class GeneratorService:
+    """Generate archived projects on a bounded pool of worker threads."""
+
+    def __init__(self, max_concurrency: int = 4, backlog: int = 16, cache: ProjectCache | None = None) -> None:
+        """Initialize the service.
+
+        Args:
+            max_concurrency: Number of projects generated at the same time.
+            backlog: Number of requests allowed to wait for a worker before new ones are rejected.
+            cache: Materializes projects generated before, if given.
+
+        """
+        self.max_concurrency = max_concurrency
+        self.backlog = backlog
+        self.cache = cache
+        self.metrics = ServiceMetrics()
+        self._generator: Generator | None = None
+        self._limiter: anyio.CapacityLimiter | None = None
+
+    async def start(self) -> None:
+        """Load the templates and plugins shared by every request and create the worker limiter."""
+        self._limiter = anyio.CapacityLimiter(self.max_concurrency)
+        self._generator = await anyio.to_thread.run_sync(lambda: Generator(cache=self.cache))
+
+    def build_archive(self, config: ProjectConfig, archive_format: ArchiveFormat) -> tuple[bytes, bool]:
+        """Generate a project into an in-memory archive.
+
+        Args:
+            config: The project configuration.
+            archive_format: The archive format.
+
+        Returns:
+            The bytes of the archive, and whether it was materialized from the project cache.
+
+        Raises:
+            RuntimeError: If the service was not started.
+
+        """
+        if self._generator is None:
+            msg = "the service was not started"
+            raise RuntimeError(msg)
+        buffer = io.BytesIO()
+        result = self._generator.generate(config, ArchiveSink(buffer, archive_format))
+        return buffer.getvalue(), result.cached
+
+    async def generate(self, data: dict[str, Any], archive_format: ArchiveFormat) -> tuple[ProjectConfig, bytes]:
+        """Validate a configuration and generate its project on a worker thread.
+
+        An error generating the project, e.g. a GenerationError, is counted as a failure and re-raised.
+
+        Args:
+            data: The configuration fields, with enum members given by value.
+            archive_format: The archive format.
+
+        Returns:
+            The validated configuration and the bytes of the archive.
+
+        Raises:
+            ValidationException: If the configuration is invalid.
+            ServiceUnavailableException: If every worker is busy and the backlog is full.
+            RuntimeError: If the service was not started.
+
+        """
+        if self._limiter is None:
+            msg = "the service was not started"
+            raise RuntimeError(msg)
+
+        self.metrics.requests += 1
+        try:
+            config = validate_project_config(data)
+        except ValueError as exc:
+            self.metrics.invalid += 1
+            raise ValidationException(detail=str(exc)) from exc
+
+        if self.metrics.in_flight >= self.max_concurrency + self.backlog:
+            self.metrics.rejected += 1
+            raise ServiceUnavailableException(
+                detail="too many projects are being generated",
+                headers={"Retry-After": "1"},
+            )
+
+        self.metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            archive, cached = await anyio.to_thread.run_sync(
+                self.build_archive,
+                config,
+                archive_format,
+                limiter=self._limiter,
+            )
+        except Exception:
+            # Counted whatever the error, so every request is generated, invalid, rejected or failed
+            self.metrics.failed += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+
+        seconds = time.perf_counter() - start
+        self.metrics.generated += 1
+        self.metrics.cached += cached
+        self.metrics.generation_seconds += seconds
+        self.metrics.max_generation_seconds = max(self.metrics.max_generation_seconds, seconds)
+        return config, archive
+
+    async def stream(self, archive: bytes) -> AsyncIterator[bytes]:
+        """Yield an archive in chunks, counting the bytes sent.
+
+        Yields:
+            The next chunk of the archive.
+
+        """
+        view = memoryview(archive)
+        for offset in range(0, len(view), CHUNK_SIZE):
+            chunk = view[offset : offset + CHUNK_SIZE]
+            yield bytes(chunk)
+            self.metrics.bytes_sent += len(chunk)
+
+
+def create_app(service: GeneratorService | None = None) -> Litestar:
+    """Create the generator service application.
+
+    Args:
+        service: The service generating projects, defaults to one with the default limits and no cache.
+
+    Returns:
+        The Litestar application.
+
+    """
+    service = service or GeneratorService()
+
+    @post("/projects", status_code=200)
+    async def create_project(
+        data: dict[str, Any],
+        archive_format: Annotated[ArchiveFormat, QueryParameter(name="format")] = ArchiveFormat.ZIP,
+    ) -> Stream:
+        """Generate the project of a JSON configuration and stream it back as an archive.
+
+        Returns:
+            The archive, as an attachment named after the project slug.
+
+        """
+        config, archive = await service.generate(data, archive_format)
+        return Stream(
+            service.stream(archive),
+            media_type=MEDIA_TYPES[archive_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{config.slug}.{archive_format.value}"',
+                "Content-Length": str(len(archive)),
+            },
+        )
+
+    @get("/metrics", sync_to_thread=False)
+    def get_metrics() -> ServiceMetrics:
+        """Report the request counters.
+
+        Returns:
+            The counters since startup.
+
+        """
+        return service.metrics
+
+    @get("/health", sync_to_thread=False)
+    def get_health() -> dict[str, str]:
+        """Report that the service is up and warm.
+
+        Returns:
+            The service status.
+
+        """
+        return {"status": "ok"}
+
+    return Litestar(
+        route_handlers=[create_project, get_metrics, get_health],
+        on_startup=[service.start],
+    )
@@ -0,0 +1,397 @@
+"""Post-generation setup of a project, run as a graph of concurrent asyncio tasks."""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import graphlib
+import inspect
+import shutil
+import subprocess  # noqa: S404
+import threading
+import time
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+from pathlib import Path
+
+import msgspec
+
+from src.generator import ProjectGenerator
+from src.plugin import discover_plugins, get_hook_settings, has_post_generate
+from src.profiling import Profiler
+
+# Receives each line a step prints, with the name of the step
+OutputHandler = Callable[[str, str], None]
+
+# Receives each line printed by the commands of the running step
+_step_output: contextvars.ContextVar[Callable[[str], None]] = contextvars.ContextVar("step_output")
+
+
+class _ChildProcesses:
+    """The processes started by the synchronous function of a step, killed if the step is cancelled.
+
+    A thread cannot be interrupted, so cancelling such a step kills the commands it
+    started through :func:`run_command_sync` instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of processes."""
+        self._lock = threading.Lock()
+        self._processes: set[subprocess.Popen[str]] = set()
+        self._cancelled = False
+
+    def add(self, process: subprocess.Popen[str]) -> None:
+        """Track a started process, killing it right away if the step was already cancelled."""
+        with self._lock:
+            if not self._cancelled:
+                self._processes.add(process)
+                return
+        process.kill()
+
+    def discard(self, process: subprocess.Popen[str]) -> None:
+        """Stop tracking a process that exited."""
+        with self._lock:
+            self._processes.discard(process)
+
+    def kill(self) -> None:
+        """Kill every tracked process and any process started from now on."""
+        with self._lock:
+            self._cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            with contextlib.suppress(OSError):
+                process.kill()
+
+
+# Processes started by the synchronous function of the running step
+_step_processes: contextvars.ContextVar[_ChildProcesses] = contextvars.ContextVar("step_processes")
+
+
+class StepStatus(StrEnum):
+    """Outcome of a setup step."""
+
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class SetupStep(msgspec.Struct, frozen=True):
+    """A setup step: a command run in the project directory, or a function.
+
+    Coroutine functions run on the event loop; other functions run on a worker thread,
+    and an awaitable they return is awaited on the event loop.
+    """
+
+    name: str
+    command: list[str] | None = None
+    function: Callable[[], object] | None = None
+    # Names of the steps that have to complete first
+    after: tuple[str, ...] = ()
+    # Seconds the step may run before it is cancelled and fails
+    timeout: float | None = None
+
+
+class StepResult(msgspec.Struct, frozen=True):
+    """Outcome and duration of a setup step."""
+
+    name: str
+    status: StepStatus
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def hook_step_name(plugin_id: str) -> str:
+    """Name the setup step running a plugin's post-generation hook.
+
+    Returns:
+        The step name.
+
+    """
+    return f"{plugin_id} hook"
+
+
+def build_setup_steps(generator: ProjectGenerator, output_dir: Path) -> list[SetupStep]:
+    """List the setup steps of a generated project with their dependencies.
+
+    Each enabled plugin with a post-generation hook gets a step of its own, which waits
+    for ``uv sync`` and for the hooks its plugin declares in ``[hook] after``.
+
+    Args:
+        generator: The generator that rendered the project.
+        output_dir: The root directory of the project.
+
+    Returns:
+        The setup steps.
+
+    """
+    config = generator.config
+
+    def copy_file(source: str, target: str) -> Callable[[], None]:
+        def copy() -> None:
+            if (output_dir / source).exists():
+                shutil.copy(output_dir / source, output_dir / target)
+
+        return copy
+
+    steps = [
+        SetupStep("git init", command=["git", "init"]),
+        SetupStep("uv sync", command=["uv", "sync"]),
+        SetupStep(".env", function=copy_file(".env.example", ".env")),
+    ]
+
+    hooks = [
+        plugin
+        for plugin in discover_plugins(config.framework.value)
+        if config.has_plugin(plugin.id) and has_post_generate(plugin)
+    ]
+    hook_ids = {plugin.id for plugin in hooks}
+    for plugin in hooks:
+        settings = get_hook_settings(plugin)
+        steps.append(
+            SetupStep(
+                hook_step_name(plugin.id),
+                function=functools.partial(plugin.post_generate, config, output_dir),
+                # Plugin hooks run project commands, which need the installed dependencies
+                after=(
+                    "uv sync",
+                    *(hook_step_name(plugin_id) for plugin_id in settings.after if plugin_id in hook_ids),
+                ),
+                timeout=settings.timeout,
+            ),
+        )
+    if config.needs_docker_infra:
+        # Pulling the database image overlaps with installing dependencies
+        steps.append(
+            SetupStep("docker compose up", command=["docker", "compose", "-f", "docker-compose.infra.yml", "up", "-d"]),
+        )
+    if config.docker:
+        steps.append(SetupStep(".dockerignore", function=copy_file(".gitignore", ".dockerignore")))
+    return steps
+
+
+async def run_command(command: Sequence[str], cwd: Path) -> None:
+    """Run a command, streaming its combined output as the output of the running setup step.
+
+    Outside of a setup step the command writes to the terminal. The command is killed
+    if the step is cancelled, e.g. when it times out. Async plugin hooks use this to
+    run project commands.
+
+    Args:
+        command: The program and its arguments.
+        cwd: The directory the command runs in.
+
+    Raises:
+        CalledProcessError: If the command exits with a non-zero status.
+        CancelledError: If the step is cancelled, once the command was killed.
+
+    """
+    output = _step_output.get(None)
+    pipe = asyncio.subprocess.PIPE if output else None
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=cwd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=pipe,
+        stderr=asyncio.subprocess.STDOUT if output else None,
+    )
+    try:
+        if output is not None and process.stdout is not None:
+            async for line in process.stdout:
+                output(line.decode(errors="replace").rstrip())
+        returncode = await process.wait()
+    except asyncio.CancelledError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, list(command))
+
+
+def run_command_sync(command: Sequence[str], cwd: Path) -> None:
+    """Run a command like :func:`run_command`, from a synchronous plugin hook.
+
+    The command's output is shown as the running step's, and the command is killed if
+    the step is cancelled, e.g. when it times out. Commands a synchronous hook starts
+    any other way keep running after the step was cancelled.
+
+    Args:
+        command: The program and its arguments.
+        cwd: The directory the command runs in.
+
+    Raises:
+        CalledProcessError: If the command exits with a non-zero status or was killed.
+
+    """
+    output = _step_output.get(None)
+    process = subprocess.Popen(  # noqa: S603
+        list(command),
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if output else None,
+        stderr=subprocess.STDOUT if output else None,
+        text=True,
+        errors="replace",
+    )
+    children = _step_processes.get(None)
+    if children is not None:
+        children.add(process)
+    try:
+        if output is not None and process.stdout is not None:
+            for line in process.stdout:
+                output(line.rstrip())
+        returncode = process.wait()
+    finally:
+        if children is not None:
+            children.discard(process)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, list(command))
+
+
+async def _run_function(function: Callable[[], object]) -> None:
+    """Run a step's function, awaiting the awaitable it returns.
+
+    Unlike :func:`asyncio.to_thread`, a synchronous function runs on a daemon thread
+    of its own, which is abandoned if the step is cancelled instead of keeping the
+    event loop from closing. The commands it started through :func:`run_command_sync`
+    are killed then; a thread itself cannot be stopped.
+
+    Raises:
+        CancelledError: If the step is cancelled, once the function's commands were killed.
+
+    """
+    if inspect.iscoroutinefunction(function):
+        await function()
+        return
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[object] = loop.create_future()
+    children = _ChildProcesses()
+    _step_processes.set(children)
+    context = contextvars.copy_context()
+
+    def settle(outcome: Callable[[object], None], value: object) -> None:
+        if not future.done():
+            outcome(value)
+
+    def target() -> None:
+        try:
+            result = context.run(function)
+        except BaseException as exc:  # noqa: BLE001
+            outcome, value = future.set_exception, exc
+        else:
+            outcome, value = future.set_result, result
+        # The event loop is gone if the step was abandoned
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(settle, outcome, value)
+
+    threading.Thread(target=target, name="litestar-start-setup", daemon=True).start()
+    try:
+        result = await future
+    except asyncio.CancelledError:
+        children.kill()
+        raise
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _execute(step: SetupStep, cwd: Path) -> str | None:
+    """Run a step's command or function, cancelling it when it exceeds its timeout.
+
+    Any exception fails only this step, so a broken plugin hook cannot take down the
+    other steps: its dependents are skipped and independent steps still complete.
+
+    Returns:
+        The error the step failed with, or None if it completed.
+
+    """
+    try:
+        async with asyncio.timeout(step.timeout) as deadline:
+            if step.command is not None:
+                await run_command(step.command, cwd)
+            elif step.function is not None:
+                await _run_function(step.function)
+    except TimeoutError as exc:
+        return f"timed out after {step.timeout:g}s" if deadline.expired() else str(exc)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        return str(exc)
+    except Exception as exc:  # noqa: BLE001
+        return f"{type(exc).__name__}: {exc}"
+    return None
+
+
+async def run_steps(
+    steps: Sequence[SetupStep],
+    cwd: Path,
+    output: OutputHandler,
+    profiler: Profiler | None = None,
+) -> list[StepResult]:
+    """Run setup steps concurrently, each as soon as the steps it depends on are done.
+
+    A step whose dependency failed or was skipped is skipped; independent steps still run.
+
+    Args:
+        steps: The steps to run.
+        cwd: The directory commands run in.
+        output: Receives every line of command output.
+        profiler: Records the time of each step on a trace track of its own, if given.
+
+    Returns:
+        The outcome of each step, in the order of ``steps``.
+
+    Raises:
+        ValueError: If a step depends on an unknown step or the dependencies form a cycle.
+
+    """
+    profiler = profiler or Profiler(enabled=False)
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        if unknown := set(step.after) - by_name.keys():
+            msg = f"setup step {step.name!r} depends on unknown step(s): {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+    try:
+        graphlib.TopologicalSorter({step.name: step.after for step in steps}).prepare()
+    except graphlib.CycleError as exc:
+        msg = f"setup steps depend on each other in a cycle: {' -> '.join(exc.args[1])}"
+        raise ValueError(msg) from exc
+
+    tasks: dict[str, asyncio.Task[StepResult]] = {}
+
+    async def run(step: SetupStep) -> StepResult:
+        dependencies = await asyncio.gather(*(tasks[name] for name in step.after))
+        if blocked := [result.name for result in dependencies if result.status != StepStatus.DONE]:
+            return StepResult(step.name, StepStatus.SKIPPED, error=f"{', '.join(blocked)} did not complete")
+
+        start = time.perf_counter()
+        _step_output.set(functools.partial(output, step.name))
+        with profiler.track(step.name), profiler.phase(step.name):
+            error = await _execute(step, cwd)
+        status = StepStatus.DONE if error is None else StepStatus.FAILED
+        return StepResult(step.name, status, time.perf_counter() - start, error)
+
+    # Every task is created before any starts, so each can await the tasks it depends on
+    for step in steps:
+        tasks[step.name] = asyncio.create_task(run(step))
+    await asyncio.gather(*tasks.values())
+    return [tasks[step.name].result() for step in steps]
+
+
+def run_setup(
+    steps: Sequence[SetupStep],
+    cwd: Path,
+    output: OutputHandler,
+    profiler: Profiler | None = None,
+) -> list[StepResult]:
+    """Run setup steps concurrently in a new event loop.
+
+    Args:
+        steps: The steps to run.
+        cwd: The directory commands run in.
+        output: Receives every line of command output.
+        profiler: Records the time of each step, if given.
+
+    Returns:
+        The outcome of each step, in the order of ``steps``.
+
+    """
+    return asyncio.run(run_steps(steps, cwd, output, profiler))
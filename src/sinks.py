@@ -0,0 +1,161 @@
+"""Output sinks that receive a rendered project.
+
+The archive and file-writing modules are imported on first use, so the CLI can
+build its argument parser from this module without loading them.
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from pathlib import Path
+from typing import BinaryIO, Protocol, runtime_checkable
+
+# Permission bits of regular files inside generated archives
+ARCHIVE_FILE_MODE = 0o644
+
+
+class ArchiveFormat(StrEnum):
+    """Supported archive formats for generated projects."""
+
+    TAR = "tar"
+    TAR_GZ = "tar.gz"
+    ZIP = "zip"
+
+
+@runtime_checkable
+class OutputSink(Protocol):
+    """Protocol for destinations of a rendered project."""
+
+    def commit(
+        self,
+        files: Mapping[Path, str],
+        removed: Sequence[Path] = (),
+        assets: Mapping[Path, Path] | None = None,
+    ) -> None:
+        """Store the rendered files.
+
+        Args:
+            files: The content of each file, keyed by path relative to the project root.
+            removed: Paths relative to the project root that are no longer generated.
+            assets: The source of each static asset to copy verbatim, keyed by path relative
+                to the project root.
+
+        """
+        ...
+
+
+class DirectorySink:
+    """Write the project to a local directory through a staging directory."""
+
+    def __init__(self, output_dir: Path, jobs: int = 1) -> None:
+        """Initialize the sink.
+
+        Args:
+            output_dir: Directory where the project will be written.
+            jobs: Number of threads used to write files.
+
+        """
+        self.output_dir = output_dir
+        self.jobs = jobs
+
+    def commit(
+        self,
+        files: Mapping[Path, str],
+        removed: Sequence[Path] = (),
+        assets: Mapping[Path, Path] | None = None,
+    ) -> None:
+        """Write the files to the output directory, copy static assets and delete removed ones."""
+        from src.utils import write_tree
+
+        write_tree(self.output_dir, files, removed, jobs=self.jobs, assets=assets)
+
+
+class ArchiveSink:
+    """Stream the project into a tar or zip archive, without a temporary directory."""
+
+    def __init__(self, target: Path | BinaryIO, archive_format: ArchiveFormat) -> None:
+        """Initialize the sink.
+
+        Args:
+            target: The archive file to create, or a binary stream (e.g. ``sys.stdout.buffer``) to write it to.
+            archive_format: The archive format.
+
+        """
+        self.target = target
+        self.archive_format = archive_format
+
+    def commit(
+        self,
+        files: Mapping[Path, str],
+        removed: Sequence[Path] = (),  # noqa: ARG002
+        assets: Mapping[Path, Path] | None = None,
+    ) -> None:
+        """Write the files and static assets into the archive; removed paths do not apply to a new archive."""
+        assets = assets or {}
+        if isinstance(self.target, Path):
+            self.target.parent.mkdir(parents=True, exist_ok=True)
+            with self.target.open("wb") as stream:
+                self._write(stream, files, assets)
+        else:
+            self._write(self.target, files, assets)
+            self.target.flush()
+
+    def _write(self, stream: BinaryIO, files: Mapping[Path, str], assets: Mapping[Path, Path]) -> None:
+        """Write every file into an archive on the given stream."""
+        import io
+        import shutil
+        import tarfile
+        import zipfile
+
+        mtime = time.time()
+        # Static assets are streamed from their source file instead of being read into memory
+        entries: dict[Path, str | Path] = {**files, **assets}
+
+        if self.archive_format == ArchiveFormat.ZIP:
+            with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for path, entry in sorted(entries.items()):
+                    info = zipfile.ZipInfo(path.as_posix(), date_time=time.localtime(mtime)[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    info.external_attr = ARCHIVE_FILE_MODE << 16
+                    if isinstance(entry, Path):
+                        with entry.open("rb") as source, archive.open(info, "w") as target:
+                            shutil.copyfileobj(source, target)
+                    else:
+                        archive.writestr(info, entry.encode("utf-8"))
+            return
+
+        # Stream mode ("w|") never seeks, so the archive can be piped
+        mode = "w|gz" if self.archive_format == ArchiveFormat.TAR_GZ else "w|"
+        with tarfile.open(fileobj=stream, mode=mode) as archive:
+            for path, entry in sorted(entries.items()):
+                info = tarfile.TarInfo(path.as_posix())
+                info.mtime = int(mtime)
+                info.mode = ARCHIVE_FILE_MODE
+                if isinstance(entry, Path):
+                    info.size = entry.stat().st_size
+                    with entry.open("rb") as source:
+                        archive.addfile(info, source)
+                else:
+                    data = entry.encode("utf-8")
+                    info.size = len(data)
+                    archive.addfile(info, io.BytesIO(data))
+
+
+def infer_archive_format(output: str) -> ArchiveFormat | None:
+    """Infer the archive format from an output file name.
+
+    Args:
+        output: The output path.
+
+    Returns:
+        The archive format, or None if the name does not look like an archive.
+
+    """
+    name = output.lower()
+    if name.endswith((".tar.gz", ".tgz")):
+        return ArchiveFormat.TAR_GZ
+    if name.endswith(".tar"):
+        return ArchiveFormat.TAR
+    if name.endswith(".zip"):
+        return ArchiveFormat.ZIP
+    return None
@@ -1,13 +1,53 @@
 """Utility functions for project generation."""
 
+import contextlib
+import functools
+import hashlib
+import os
 import re
+import secrets
+import shutil
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    PrefixLoader,
+    select_autoescape,
+)
+
+from src import __version__
+
+if sys.platform == "linux":
+    import fcntl
 
 MIN_PROJECT_NAME_LENGTH = 1
 MAX_PROJECT_NAME_LENGTH = 50
 
+# Directory (relative to the package) holding templates precompiled at build time
+COMPILED_TEMPLATES_DIR = "_compiled"
+# Stamp file recording the Jinja2 version the precompiled templates were built with
+COMPILED_TEMPLATES_STAMP = "jinja_version.txt"
+# Template roots inside each framework directory
+TEMPLATE_ROOTS = ("Config", "App", "Containers")
+# Template name prefix under which plugin templates are exposed
+PLUGINS_PREFIX = "Plugins"
+# Directory of a plugin holding its templates and static assets
+PLUGIN_TEMPLATES_DIR = "Templates"
+# Declarative metadata file marking a plugin directory
+PLUGIN_METADATA_FILE = "plugin.toml"
+# Linux ioctl that makes a file share the extents of another (copy-on-write reflink)
+FICLONE = 0x40049409
+
 
 def get_package_dir() -> Path:
     """Get the package directory.
@@ -19,18 +59,53 @@ def get_package_dir() -> Path:
     return Path(__file__).parent
 
 
-def get_template_env(template_dir: Path) -> Environment:
-    """Create a Jinja2 environment for the given template directory.
+def get_cache_dir() -> Path:
+    """Get the per-user cache directory, keyed by the package version.
 
-    Args:
-        template_dir: The directory containing the templates.
+    The location can be overridden with the ``LITESTAR_START_CACHE_DIR`` environment variable.
+
+    Returns:
+        The path to the cache directory (not necessarily existing yet).
+
+    """
+    if override := os.environ.get("LITESTAR_START_CACHE_DIR"):
+        return Path(override) / __version__
+
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "litestar-start" / __version__
+
+
+@functools.cache
+def get_bytecode_cache() -> BytecodeCache | None:
+    """Get the shared on-disk Jinja2 bytecode cache.
+
+    Returns:
+        The bytecode cache, or None if the cache directory is not writable.
+
+    """
+    cache_dir = get_cache_dir() / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def create_environment(loader: BaseLoader, bytecode_cache: BytecodeCache | None = None) -> Environment:
+    """Create a Jinja2 environment with the options shared by every template.
 
     Returns:
         A configured Jinja2 environment.
 
     """
     return Environment(
-        loader=FileSystemLoader(str(template_dir)),
+        loader=loader,
+        bytecode_cache=bytecode_cache,
         autoescape=select_autoescape(default=False),
         keep_trailing_newline=True,
         trim_blocks=True,
@@ -38,6 +113,177 @@ def get_template_env(template_dir: Path) -> Environment:
     )
 
 
+def get_framework_dirs() -> list[Path]:
+    """List the framework directories shipped with the package.
+
+    Returns:
+        Every package subdirectory that provides a framework generator.
+
+    """
+    return [path for path in sorted(get_package_dir().iterdir()) if (path / "generator.py").exists()]
+
+
+def get_source_key() -> str:
+    """Identify the templates and plugins the package would render from.
+
+    Lists every file of the framework directories with its size and modification
+    time, so templates edited in a source checkout invalidate cached manifests
+    and projects.
+
+    Returns:
+        A hex digest that changes whenever a packaged file changes.
+
+    """
+    digest = hashlib.sha256()
+    for framework_dir in get_framework_dirs():
+        for path in sorted(framework_dir.rglob("*")):
+            if "__pycache__" in path.parts:
+                continue
+            stat = path.stat()
+            digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def get_plugin_dirs(framework_dir: Path) -> list[Path]:
+    """List the plugins shipped with a framework.
+
+    Args:
+        framework_dir: The framework directory (e.g. ``src/Litestar``).
+
+    Returns:
+        The plugin directories (those with a ``plugin.toml``), sorted by name.
+
+    """
+    plugins_dir = framework_dir / PLUGINS_PREFIX
+    if not plugins_dir.is_dir():
+        return []
+    return sorted(path for path in plugins_dir.iterdir() if (path / PLUGIN_METADATA_FILE).exists())
+
+
+def get_template_loader(framework_dir: Path, plugin_dirs: Iterable[Path] = ()) -> PrefixLoader:
+    """Create a loader over every template root of a framework.
+
+    Templates are addressed by their root, e.g. ``App/app.py.jinja``, ``Config/pyproject.toml.jinja``
+    or ``Plugins/AdvancedAlchemy/lib/services.py.jinja`` for a plugin's ``Templates`` directory.
+
+    Args:
+        framework_dir: The framework directory (e.g. ``src/Litestar``).
+        plugin_dirs: The plugin directories whose ``Templates`` should be exposed.
+
+    Returns:
+        A prefix loader mapping each root to its directory.
+
+    """
+    mapping: dict[str, BaseLoader] = {
+        name: FileSystemLoader(str(framework_dir / name)) for name in TEMPLATE_ROOTS if (framework_dir / name).is_dir()
+    }
+    mapping[PLUGINS_PREFIX] = PrefixLoader(
+        {
+            plugin_dir.name: FileSystemLoader(str(plugin_dir / PLUGIN_TEMPLATES_DIR))
+            for plugin_dir in plugin_dirs
+            if (plugin_dir / PLUGIN_TEMPLATES_DIR).is_dir()
+        },
+    )
+    return PrefixLoader(mapping)
+
+
+def get_source_path(
+    framework_dir: Path,
+    template_name: str,
+    plugin_dirs: Mapping[str, Path] | None = None,
+) -> Path:
+    """Locate the source file behind a prefixed template name.
+
+    Mirrors the layout exposed by :func:`get_template_loader`, for files that are
+    not loaded through Jinja2, such as static assets.
+
+    Args:
+        framework_dir: The framework directory (e.g. ``src/Litestar``).
+        template_name: The prefixed name, e.g. ``Plugins/LitestarVite/public/favicon.ico``.
+        plugin_dirs: Directories of plugins living outside the framework directory, keyed by name.
+
+    Returns:
+        The path of the source file.
+
+    """
+    root, _, relative_name = template_name.partition("/")
+    if root == PLUGINS_PREFIX:
+        plugin, _, relative_name = relative_name.partition("/")
+        plugin_dir = (plugin_dirs or {}).get(plugin, framework_dir / PLUGINS_PREFIX / plugin)
+        return plugin_dir / PLUGIN_TEMPLATES_DIR / relative_name
+    return framework_dir / root / relative_name
+
+
+def get_compiled_templates_dir(framework: str) -> Path | None:
+    """Locate the precompiled templates for a framework.
+
+    Args:
+        framework: The framework name (e.g., 'Litestar').
+
+    Returns:
+        The directory holding the compiled template modules, or None if none were shipped
+        or they were built with a different Jinja2 version.
+
+    """
+    compiled_root = get_package_dir() / COMPILED_TEMPLATES_DIR
+    try:
+        if (compiled_root / COMPILED_TEMPLATES_STAMP).read_text(encoding="utf-8").strip() != jinja2.__version__:
+            return None
+    except OSError:
+        return None
+    compiled_dir = compiled_root / framework
+    return compiled_dir if compiled_dir.is_dir() else None
+
+
+def compile_templates(target: Path) -> int:
+    """Precompile every packaged template into importable Python modules.
+
+    Templates are compiled under the names used by :func:`get_template_loader`, one
+    directory per framework, so that :func:`get_template_env` can load them through
+    a :class:`~jinja2.ModuleLoader`.
+
+    Args:
+        target: The directory to write the compiled modules to.
+
+    Returns:
+        The number of compiled templates.
+
+    """
+    count = 0
+    for framework_dir in get_framework_dirs():
+        env = create_environment(get_template_loader(framework_dir, get_plugin_dirs(framework_dir)))
+        count += len(env.list_templates(extensions=["jinja"]))
+        env.compile_templates(str(target / framework_dir.name), extensions=["jinja"], zip=None, ignore_errors=False)
+
+    (target / COMPILED_TEMPLATES_STAMP).write_text(jinja2.__version__, encoding="utf-8")
+    return count
+
+
+@functools.cache
+def get_template_env(framework: str, plugin_dirs: tuple[Path, ...] = ()) -> Environment:
+    """Get the shared Jinja2 environment for a framework and its plugins.
+
+    The environment is created once per process for a given set of plugins, so compiled
+    templates are reused across generation phases and repeated runs. Templates precompiled
+    at build time are loaded first; anything else is compiled from source and stored in the
+    on-disk bytecode cache for subsequent runs.
+
+    Args:
+        framework: The framework name (e.g., 'Litestar').
+        plugin_dirs: The plugin directories whose templates should be available.
+
+    Returns:
+        A configured Jinja2 environment.
+
+    """
+    loaders: list[BaseLoader] = []
+    if compiled_dir := get_compiled_templates_dir(framework):
+        loaders.append(ModuleLoader(str(compiled_dir)))
+    loaders.append(get_template_loader(get_package_dir() / framework, plugin_dirs))
+
+    return create_environment(ChoiceLoader(loaders), get_bytecode_cache())
+
+
 def slugify(text: str) -> str:
     """Convert text to a valid Python package name.
 
@@ -94,6 +340,164 @@ def write_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def _reflink(source: int, destination: int) -> bool:
+    """Clone a file's extents into another file on copy-on-write filesystems.
+
+    Returns:
+        True if the file was cloned.
+
+    """
+    if sys.platform != "linux":
+        return False
+    try:
+        fcntl.ioctl(destination, FICLONE, source)
+    except OSError:
+        return False
+    return True
+
+
+def _copy_file_range(source: int, destination: int, size: int) -> bool:
+    """Copy a whole file inside the kernel with ``os.copy_file_range``.
+
+    Returns:
+        True if every byte was copied.
+
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(source, destination, size - copied)
+            if not count:
+                break
+            copied += count
+    except OSError:
+        return False
+    return copied == size
+
+
+def copy_asset(source: Path, destination: Path) -> None:
+    """Copy a static asset without reading it into Python, as cheaply as the platform allows.
+
+    Tries a reflink, ``os.copy_file_range`` and finally :func:`shutil.copyfile`, which uses
+    ``sendfile`` or ``fcopyfile`` where available. Never hard links: generated projects are
+    edited in place, and an edit must not reach the installed package or the project cache.
+
+    Args:
+        source: The asset to copy.
+        destination: The file to create; parent directories are created if needed.
+
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+
+    with source.open("rb") as source_file, destination.open("wb") as destination_file:
+        source_fd, destination_fd = source_file.fileno(), destination_file.fileno()
+        if _reflink(source_fd, destination_fd) or _copy_file_range(
+            source_fd,
+            destination_fd,
+            os.fstat(source_fd).st_size,
+        ):
+            return
+
+    shutil.copyfile(source, destination)
+
+
+def write_tree(
+    output_dir: Path,
+    files: Mapping[Path, str],
+    removed: Sequence[Path] = (),
+    jobs: int = 1,
+    assets: Mapping[Path, Path] | None = None,
+) -> None:
+    """Write a rendered file tree through a staging directory.
+
+    Files are first written to a sibling staging directory. A new (or empty) output
+    directory is then committed with a single rename, so it either contains the whole
+    project or nothing. An existing project is updated by moving each staged file into
+    place, which never leaves a partially written file behind.
+
+    Args:
+        output_dir: The directory to commit the tree to.
+        files: The content of each file, keyed by path relative to ``output_dir``.
+        removed: Paths relative to ``output_dir`` to delete once the files are in place,
+            along with the directories they leave empty.
+        jobs: Number of threads used to write the staged files.
+        assets: The source of each static asset to copy, keyed by path relative to ``output_dir``.
+
+    """
+    assets = assets or {}
+    if not files and not assets and not removed:
+        return
+
+    output_dir = output_dir.absolute()
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = output_dir.with_name(f".{output_dir.name}.{secrets.token_hex(4)}.staging")
+    staging_dir.mkdir()
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="litestar-start") as executor:
+            # Consume the results so the first write error is raised
+            list(executor.map(lambda item: write_file(staging_dir / item[0], item[1]), files.items()))
+            list(executor.map(lambda item: copy_asset(item[1], staging_dir / item[0]), assets.items()))
+
+        if not output_dir.exists() or not any(output_dir.iterdir()):
+            if output_dir.exists():
+                output_dir.rmdir()
+            staging_dir.rename(output_dir)
+            return
+
+        # Create every directory first so that conflicts surface before any file is replaced
+        staged = [*files, *assets]
+        for parent in sorted({(output_dir / path).parent for path in staged}):
+            parent.mkdir(parents=True, exist_ok=True)
+        for path in staged:
+            (staging_dir / path).replace(output_dir / path)
+        for path in removed:
+            (output_dir / path).unlink(missing_ok=True)
+        # Prune the directories the removed files leave empty, deepest first
+        for directory in sorted({parent for path in removed for parent in path.parents[:-1]}, reverse=True):
+            with contextlib.suppress(OSError):
+                (output_dir / directory).rmdir()
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def hash_content(content: str) -> str:
+    """Hash rendered file content.
+
+    Args:
+        content: The file content.
+
+    Returns:
+        The hex SHA-256 digest of the UTF-8 encoded content.
+
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """Hash a file the same way as :func:`hash_content`.
+
+    Text files are hashed ignoring platform line endings; files that are not valid
+    UTF-8 (e.g. binary static assets) are hashed byte for byte.
+
+    Args:
+        path: The file to hash.
+
+    Returns:
+        The hex SHA-256 digest of the file content.
+
+    """
+    data = path.read_bytes()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return hashlib.sha256(data).hexdigest()
+    # Same newline translation as reading the file in text mode
+    return hash_content(text.replace("\r\n", "\n").replace("\r", "\n"))
+
+
 def render_template(env: Environment, template_name: str, context: dict) -> str:
     """Render a Jinja2 template with the given context.
 
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep every cache a test writes (projects, manifests, registries, bytecode) out of the user's home.
+
+    Returns:
+        The cache directory of the test.
+
+    """
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("LITESTAR_START_CACHE_DIR", str(cache))
+    return cache
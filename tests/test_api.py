@@ -0,0 +1,59 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.api import Generator
+from src.Litestar.generator import LitestarTemplates
+from src.models import Database, ProjectConfig
+from src.project_cache import ProjectCache
+from src.sinks import ArchiveFormat, ArchiveSink
+from src.utils import hash_file
+
+CONFIGS = [
+    ProjectConfig(name=f"svc{index}", database=database, plugins=plugins, docker=index % 2 == 0)
+    for index, (database, plugins) in enumerate(
+        [(Database.SQLITE, ["advanced_alchemy"]), (Database.POSTGRESQL, []), (Database.NONE, [])] * 4,
+    )
+]
+
+
+def test_generate_reports_files_hashes_and_timings(tmp_path: Path) -> None:
+    """Verify a call returns the hash of every written file and the time of each phase."""
+    result = Generator().generate({"name": "svc", "database": "SQLite"}, tmp_path / "svc")
+
+    assert result.config == ProjectConfig(name="svc", database=Database.SQLITE)
+    assert Path("pyproject.toml") in result.paths
+    assert all(hash_file(tmp_path / "svc" / path) == digest for path, digest in result.files.items())
+    assert "render" in {phase.name for phase in result.phases}
+    assert result.seconds > 0
+    assert not result.cached
+
+
+def test_generator_loads_templates_once_and_is_thread_safe(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify concurrent calls share the loaded templates and match sequential ones."""
+    generator = Generator()
+    sequential = [generator.generate(config, ArchiveSink(io.BytesIO(), ArchiveFormat.ZIP)) for config in CONFIGS]
+
+    def fail() -> None:
+        pytest.fail("templates were loaded again")
+
+    monkeypatch.setattr(LitestarTemplates, "load", lambda *_: fail())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        concurrent = list(
+            executor.map(lambda config: generator.generate(config, tmp_path / config.slug), CONFIGS),
+        )
+
+    assert [result.files for result in concurrent] == [result.files for result in sequential]
+
+
+def test_generator_reports_cached_projects(tmp_path: Path) -> None:
+    """Verify a repeated configuration is materialized from the cache with the same hashes."""
+    generator = Generator(cache=ProjectCache(tmp_path / "cache"))
+    first = generator.generate(CONFIGS[0], tmp_path / "first")
+    second = generator.generate(CONFIGS[0], tmp_path / "second")
+
+    assert not first.cached
+    assert second.cached
+    assert second.files == first.files
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import pytest
+
+from src.batch import run_batch
+from src.cli import main
+from src.config import load_batch_matrix
+from src.generator import ProjectGenerator
+
+MATRIX = """\
+output = "projects"
+
+[defaults]
+database = "SQLite"
+plugins = ["advanced_alchemy"]
+
+[[projects]]
+name = "First Service"
+
+[[projects]]
+name = "Second Service"
+docker = true
+
+[[projects]]
+name = "Postgres Service"
+database = "PostgreSQL"
+plugins = []
+"""
+
+
+def test_load_batch_matrix_applies_defaults(tmp_path: Path) -> None:
+    """Verify matrix defaults are merged into every project and the output is relative to the file."""
+    matrix = tmp_path / "matrix.toml"
+    matrix.write_text(MATRIX)
+
+    output_root, configs = load_batch_matrix(matrix)
+
+    assert output_root == tmp_path / "projects"
+    assert [config.slug for config in configs] == ["first_service", "second_service", "postgres_service"]
+    assert [config.plugins for config in configs] == [["advanced_alchemy"], ["advanced_alchemy"], []]
+    assert configs[1].docker
+
+
+@pytest.mark.parametrize(
+    ("projects", "error"),
+    [
+        ('[[projects]]\nname = "Same"\n[[projects]]\nname = "same"\n', "share the output directories: same"),
+        ('[[projects]]\nname = "Ok"\n[[projects]]\nname = "Bad"\ndatabase = "Oracle"\n', "project 2"),
+    ],
+)
+def test_load_batch_matrix_rejects_invalid_projects(tmp_path: Path, projects: str, error: str) -> None:
+    """Verify clashing output directories and invalid projects are rejected before generating."""
+    matrix = tmp_path / "matrix.toml"
+    matrix.write_text(projects)
+
+    with pytest.raises(ValueError, match=error):
+        load_batch_matrix(matrix)
+
+
+def test_run_batch_generates_projects_in_parallel(tmp_path: Path) -> None:
+    """Verify every project is generated by the worker pool and its outcome reported in order."""
+    matrix = tmp_path / "matrix.toml"
+    matrix.write_text(MATRIX)
+    output_root, configs = load_batch_matrix(matrix)
+
+    results = run_batch(configs, output_root, jobs=2)
+
+    assert [result.name for result in results] == ["First Service", "Second Service", "Postgres Service"]
+    assert all(result.ok and result.files for result in results)
+    assert (output_root / "second_service" / "Dockerfile").is_file()
+    assert not (output_root / "first_service" / "Dockerfile").exists()
+
+
+def test_batch_command_reports_failures(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Verify a failing project is reported without stopping the others, and fails the command."""
+    matrix = tmp_path / "matrix.toml"
+    matrix.write_text(MATRIX)
+    # A file where a project directory belongs makes that project fail
+    (tmp_path / "projects").mkdir()
+    (tmp_path / "projects" / "second_service").write_text("taken")
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["batch", str(matrix), "--jobs", "2"])
+
+    assert exc_info.value.code == 1
+    output = capsys.readouterr().out
+    assert "2 generated, 1 failed" in output
+    assert "[Errno" in output
+    assert "[red]" not in output
+    assert (tmp_path / "projects" / "postgres_service" / "pyproject.toml").is_file()
+
+
+def test_run_batch_reports_unexpected_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify any exception, e.g. from a third-party plugin, fails only its own project."""
+    matrix = tmp_path / "matrix.toml"
+    matrix.write_text(MATRIX)
+    output_root, configs = load_batch_matrix(matrix)
+    generate = ProjectGenerator.generate
+
+    def fail_docker(generator: ProjectGenerator, *args: object) -> None:
+        if generator.config.docker:
+            msg = "plugin failed"
+            raise RuntimeError(msg)
+        generate(generator, *args)
+
+    monkeypatch.setattr(ProjectGenerator, "generate", fail_docker)
+    results = run_batch(configs, output_root)
+
+    assert [result.error for result in results] == [None, "RuntimeError: plugin failed", None]
+    assert (output_root / "postgres_service" / "pyproject.toml").is_file()
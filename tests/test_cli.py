@@ -0,0 +1,141 @@
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from src import __version__
+from src.cli import main
+from src.config import load_project_config
+from src.manifest import PROJECT_MANIFEST_FILE
+from src.models import Database, Framework, ProjectConfig
+
+# Cumulative import time of src.cli allowed by `python -X importtime`, in microseconds
+IMPORT_TIME_BUDGET_US = 100_000
+# Dependencies that must only be imported once a project is actually generated
+HEAVY_MODULES = {"jinja2", "msgspec", "prompt_toolkit", "questionary", "rich"}
+ROOT_DIR = Path(__file__).parent.parent
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Run Python code under ``-X importtime`` in a fresh interpreter.
+
+    Returns:
+        The cumulative import time of every imported module, in microseconds.
+
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.removeprefix("import time:").split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("args", [None, ["--help"], ["--version"]])
+def test_cli_startup_skips_heavy_imports(args: list[str] | None) -> None:
+    """Verify importing the CLI and its fast paths stay within the import-time budget."""
+    code = (
+        "import src.cli"
+        if args is None
+        else f"import contextlib, src.cli\nwith contextlib.suppress(SystemExit): src.cli.main({args!r})"
+    )
+    times = import_times(code)
+
+    assert times["src.cli"] <= IMPORT_TIME_BUDGET_US
+    assert not {name.split(".")[0] for name in times} & HEAVY_MODULES
+
+
+def test_version(capsys: pytest.CaptureFixture[str]) -> None:
+    """Verify --version prints the package version."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.strip() == f"litestar-start {__version__}"
+
+
+def test_load_project_config_merges_file_and_options(tmp_path: Path) -> None:
+    """Verify a config file is decoded strictly into ProjectConfig and options override it."""
+    config_file = tmp_path / "project.toml"
+    config_file.write_text(
+        'name = "billing-service"\ndatabase = "PostgreSQL"\nplugins = ["advanced_alchemy"]\ndocker = true\n',
+        encoding="utf-8",
+    )
+
+    config = load_project_config(config_file, {"docker_infra": True, "plugins": ["advanced_alchemy", "litestar_saq"]})
+
+    assert config == ProjectConfig(
+        name="billing-service",
+        framework=Framework.LITESTAR,
+        database=Database.POSTGRESQL,
+        plugins=["advanced_alchemy", "litestar_saq"],
+        docker=True,
+        docker_infra=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        ({"name": "svc", "database": "Oracle"}, "invalid configuration"),
+        ({"name": "svc", "docker": "yes"}, "invalid configuration"),
+        ({"name": "svc", "color": "blue"}, "unknown configuration field"),
+        ({"name": "svc", "plugins": ["nope"]}, "unknown plugin 'nope'"),
+        ({"name": "svc", "plugins": ["advanced_alchemy"]}, "cannot be used with database None"),
+        ({"database": "SQLite"}, "missing required field `name`"),
+    ],
+)
+def test_load_project_config_rejects_invalid_values(tmp_path: Path, data: dict, error: str) -> None:
+    """Verify enums, types, field names and plugin ids are validated strictly."""
+    config_file = tmp_path / "project.json"
+    config_file.write_bytes(msgspec.json.encode(data))
+
+    with pytest.raises(ValueError, match=error):
+        load_project_config(config_file, {})
+
+
+def test_main_generates_without_prompts(tmp_path: Path) -> None:
+    """Verify project options skip every prompt and the post-generation setup."""
+    output_dir = tmp_path / "svc"
+
+    main(["--name", "svc", "--database", "SQLite", "--plugin", "advanced_alchemy", "-o", str(output_dir)])
+
+    assert (output_dir / "models" / "users.py").exists()
+    assert not (output_dir / ".git").exists()
+
+
+def test_update_dry_run_lists_the_project_manifest(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Verify a dry-run update lists the manifest it would rewrite, and writes nothing."""
+    main(["--name", "svc", "--database", "SQLite", "-o", str(tmp_path)])
+    manifest = (tmp_path / PROJECT_MANIFEST_FILE).read_bytes()
+    capsys.readouterr()
+
+    main(["update", str(tmp_path), "--database", "PostgreSQL", "--dry-run"])
+
+    statuses = {line.split()[-1]: line.split()[0] for line in capsys.readouterr().out.splitlines() if line.strip()}
+    assert statuses[PROJECT_MANIFEST_FILE] == "updated"
+    assert (tmp_path / PROJECT_MANIFEST_FILE).read_bytes() == manifest
+
+
+def test_main_profiles_generation(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Verify --profile-trace prints the phase table and writes a Chrome trace with one span per file."""
+    output_dir = tmp_path / "svc"
+    trace = tmp_path / "trace.json"
+
+    main(["--name", "svc", "-o", str(output_dir), "-j", "2", "--no-cache", "--profile-trace", str(trace)])
+
+    out = capsys.readouterr().out
+    assert all(phase in out for phase in ("render templates", "plan outputs", "write files"))
+    events = msgspec.json.decode(trace.read_bytes())["traceEvents"]
+    files = {event["name"] for event in events if event.get("cat") == "file"}
+    assert "pyproject.toml" in files
@@ -1,7 +1,30 @@
 from pathlib import Path
 
+import pytest
+from jinja2 import TemplateError
+
+from src.generator import FileStatus, GenerationError, ProjectGenerator, RenderedFile
 from src.Litestar.generator import LitestarGenerator
+from src.manifest import (
+    PROJECT_MANIFEST_FILE,
+    FrameworkManifest,
+    Phase,
+    TemplateEntry,
+    read_project_manifest,
+    write_project_manifest,
+)
 from src.models import Database, Framework, ProjectConfig
+from src.utils import hash_file
+
+
+def read_tree(root: Path) -> dict[Path, bytes]:
+    """Read every file below a directory, keyed by its path relative to the directory.
+
+    Returns:
+        A mapping of relative paths to file contents.
+
+    """
+    return {path.relative_to(root): path.read_bytes() for path in root.rglob("*") if path.is_file()}
 
 
 def test_litestar_generator_context(tmp_path: Path) -> None:
@@ -67,3 +90,221 @@ def test_litestar_generator_plugins_rendering(tmp_path: Path) -> None:
     assert (tmp_path / "models" / "users.py").exists()
     assert (tmp_path / "lib" / "dependencies.py").exists()
     assert (tmp_path / "lib" / "services.py").exists()
+
+
+def test_litestar_generator_skips_excluded_templates(tmp_path: Path) -> None:
+    """Verify templates whose front-matter condition fails are neither rendered nor written."""
+    config = ProjectConfig(
+        name="Minimal Test",
+        framework=Framework.LITESTAR,
+        database=Database.NONE,
+        plugins=[],
+        docker=False,
+        docker_infra=False,
+    )
+
+    generator = LitestarGenerator(config, tmp_path)
+    generator.generate()
+
+    assert (tmp_path / "controllers" / "__init__.py").exists()
+    for path in (Path("controllers/users.py"), Path("schemas/users.py"), Path("lib/utils.py")):
+        assert path not in generator.files
+        assert not (tmp_path / path).exists()
+
+
+def test_litestar_generator_copies_static_assets(tmp_path: Path) -> None:
+    """Verify static assets are copied verbatim and tracked like rendered files."""
+    config = ProjectConfig(
+        name="Asset Test",
+        framework=Framework.LITESTAR,
+        database=Database.NONE,
+        plugins=[],
+        docker=False,
+        docker_infra=False,
+    )
+    asset = tmp_path / "favicon.ico"
+    asset.write_bytes(b"\x00\x00\x01\x00\xff")
+
+    generator = LitestarGenerator(config, tmp_path / "project")
+    entry = TemplateEntry(template="App/static/favicon.ico", output="static/favicon.ico", phase=Phase.BASE, static=True)
+    generator.manifest = FrameworkManifest(
+        plugins=generator.manifest.plugins,
+        templates=[*generator.manifest.templates, entry],
+    )
+    generator.assets = {entry.template: asset}
+    generator.generate()
+
+    assert (tmp_path / "project" / "static" / "favicon.ico").read_bytes() == asset.read_bytes()
+    assert generator.files[Path("static/favicon.ico")] == hash_file(asset)
+
+    updater = LitestarGenerator(config, tmp_path / "project", previous_files=generator.files)
+    updater.manifest, updater.assets = generator.manifest, generator.assets
+    assert updater.render()[Path("static/favicon.ico")].status == FileStatus.UNCHANGED
+
+
+def test_litestar_generator_parallel_matches_serial(tmp_path: Path) -> None:
+    """Verify rendering on a thread pool produces the same files as serial rendering."""
+    config = ProjectConfig(
+        name="Parallel Test",
+        framework=Framework.LITESTAR,
+        database=Database.POSTGRESQL,
+        plugins=["advanced_alchemy", "litestar_vite"],
+        docker=True,
+        docker_infra=True,
+    )
+
+    LitestarGenerator(config, tmp_path / "serial").generate()
+    LitestarGenerator(config, tmp_path / "parallel", jobs=4).generate()
+
+    assert read_tree(tmp_path / "serial") == read_tree(tmp_path / "parallel")
+
+
+def test_litestar_generator_collects_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify per-file render failures are collected and nothing is written."""
+    config = ProjectConfig(
+        name="Error Test",
+        framework=Framework.LITESTAR,
+        database=Database.SQLITE,
+        plugins=["advanced_alchemy"],
+        docker=False,
+        docker_infra=False,
+    )
+    render_file = LitestarGenerator._render_file
+
+    def fail_schemas(self: LitestarGenerator, output_path: Path, template_name: str, context: dict) -> RenderedFile:
+        if output_path.parts[0] == "schemas":
+            msg = "boom"
+            raise TemplateError(msg)
+        return render_file(self, output_path, template_name, context)
+
+    monkeypatch.setattr(LitestarGenerator, "_render_file", fail_schemas)
+
+    with pytest.raises(GenerationError) as exc_info:
+        LitestarGenerator(config, tmp_path / "project", jobs=4).generate()
+
+    assert set(exc_info.value.errors) == {Path("schemas/__init__.py"), Path("schemas/users.py")}
+    assert not (tmp_path / "project").exists()
+
+
+def test_project_generator_commit_is_all_or_nothing(tmp_path: Path) -> None:
+    """Verify a failing commit into an existing directory leaves its files untouched."""
+    config = ProjectConfig(
+        name="Commit Test",
+        framework=Framework.LITESTAR,
+        database=Database.NONE,
+        plugins=[],
+        docker=False,
+        docker_infra=False,
+    )
+    # A regular file where a package directory is expected makes the commit fail
+    (tmp_path / "controllers").write_text("", encoding="utf-8")
+
+    with pytest.raises(OSError, match="controllers"):
+        ProjectGenerator(config, tmp_path).generate()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["controllers"]
+
+
+def test_project_generator_render_is_dry(tmp_path: Path) -> None:
+    """Verify rendering plans every file without writing anything."""
+    config = ProjectConfig(
+        name="Dry Run",
+        framework=Framework.LITESTAR,
+        database=Database.POSTGRESQL,
+        plugins=["advanced_alchemy"],
+        docker=True,
+        docker_infra=True,
+    )
+
+    rendered = ProjectGenerator(config, tmp_path / "project").render()
+
+    assert not (tmp_path / "project").exists()
+    assert Path("Dockerfile") in rendered
+    assert rendered[Path("app.py")].status == FileStatus.CREATED
+    assert rendered[Path("app.py")].size == len(rendered[Path("app.py")].content.encode("utf-8"))
+
+
+def test_project_generator_update_rewrites_only_changed_files(tmp_path: Path) -> None:
+    """Verify an update keeps unchanged files untouched and re-renders changed ones."""
+    config = ProjectConfig(
+        name="Update Test",
+        framework=Framework.LITESTAR,
+        database=Database.SQLITE,
+        plugins=[],
+        docker=False,
+        docker_infra=False,
+    )
+    ProjectGenerator(config, tmp_path).generate()
+    assert (tmp_path / PROJECT_MANIFEST_FILE).exists()
+
+    app_file = tmp_path / "app.py"
+    mtime = app_file.stat().st_mtime_ns
+
+    generator = ProjectGenerator.from_project(tmp_path)
+    generator.generate()
+
+    assert set(generator.statuses.values()) == {FileStatus.UNCHANGED}
+    assert app_file.stat().st_mtime_ns == mtime
+
+    # Enable a plugin in the recorded config and update again
+    manifest = read_project_manifest(tmp_path)
+    manifest.config.plugins = ["advanced_alchemy"]
+    write_project_manifest(tmp_path, manifest.config, manifest.file_hashes)
+    (tmp_path / ".env.example").write_text("# local change\n", encoding="utf-8")
+    (tmp_path / "config.py").write_text("# local change\n", encoding="utf-8")
+
+    generator = ProjectGenerator.from_project(tmp_path)
+    generator.generate()
+
+    assert generator.statuses[Path("app.py")] == FileStatus.UPDATED
+    assert generator.statuses[Path("models/users.py")] == FileStatus.CREATED
+    assert generator.statuses[Path("settings.py")] == FileStatus.UNCHANGED
+    assert generator.statuses[Path(".env.example")] == FileStatus.UNCHANGED
+    assert generator.statuses[Path("config.py")] == FileStatus.CONFLICT
+    assert (tmp_path / ".env.example").read_text(encoding="utf-8") == "# local change\n"
+    assert (tmp_path / "config.py").read_text(encoding="utf-8") == "# local change\n"
+    assert "UserController" in app_file.read_text(encoding="utf-8")
+
+
+def test_project_generator_update_renders_only_files_reading_changed_settings(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify changing a setting re-renders only dependent files and matches a fresh generation."""
+    ProjectGenerator(ProjectConfig(name="svc", database=Database.SQLITE), tmp_path / "svc").generate()
+    rendered = []
+    render_file = LitestarGenerator._render_file
+
+    def record(generator: LitestarGenerator, output_path: Path, *args: object) -> RenderedFile:
+        rendered.append(output_path)
+        return render_file(generator, output_path, *args)
+
+    monkeypatch.setattr(LitestarGenerator, "_render_file", record)
+    generator = ProjectGenerator.from_project(tmp_path / "svc", changes={"docker": True})
+    generator.generate()
+
+    assert Path("Dockerfile") in rendered
+    assert Path("app.py") not in rendered
+    assert generator.statuses[Path("Dockerfile")] == FileStatus.CREATED
+    assert generator.statuses[Path("app.py")] == FileStatus.UNCHANGED
+
+    fresh = tmp_path / "fresh"
+    ProjectGenerator(generator.config, fresh).generate()
+    assert {path: hash_file(fresh / path) for path in generator.files} == generator.files
+    assert (tmp_path / "svc" / PROJECT_MANIFEST_FILE).read_text() == (fresh / PROJECT_MANIFEST_FILE).read_text()
+
+
+def test_project_generator_update_prunes_emptied_directories(tmp_path: Path) -> None:
+    """Verify directories left empty by removed files are removed, and the others kept."""
+    ProjectGenerator(
+        ProjectConfig(name="svc", database=Database.SQLITE, plugins=["advanced_alchemy"]),
+        tmp_path,
+    ).generate()
+
+    generator = ProjectGenerator.from_project(tmp_path, changes={"plugins": []})
+    generator.generate()
+
+    assert Path("models/users.py") in generator.removed
+    assert not (tmp_path / "models").exists()
+    assert Path("lib/services.py") in generator.removed
+    assert (tmp_path / "lib").is_dir()
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from src.Litestar.generator import LitestarGenerator
+from src.locks import LOCK_FILE, LOCK_PROJECT_NAME, LOCKS_DIR, DependencySpec, get_lock_path, read_lock
+from src.models import Database, ProjectConfig
+
+PYPROJECT = """\
+[project]
+name = "svc"
+requires-python = ">=3.13"
+dependencies = ["litestar>=2.0", "aiosqlite>=0.20"]
+
+[dependency-groups]
+dev = ["ruff>=0.9", "pytest>=8"]
+"""
+
+LOCK = f"""\
+version = 1
+
+[[package]]
+name = "{LOCK_PROJECT_NAME}"
+version = "0.1.0"
+"""
+
+
+def test_key_ignores_declaration_order() -> None:
+    """Verify dependency sets declared in another order share a lock file."""
+    spec = DependencySpec.from_pyproject(PYPROJECT)
+    reordered = DependencySpec(">=3.13", ["aiosqlite>=0.20", "litestar>=2.0"], {"dev": ["pytest>=8", "ruff>=0.9"]})
+    changed = DependencySpec(">=3.13", ["litestar>=2.0"], spec.dependency_groups)
+
+    assert spec.key == reordered.key
+    assert spec.key != changed.key
+    assert spec.requirements == ["litestar>=2.0", "aiosqlite>=0.20", "ruff>=0.9", "pytest>=8"]
+
+
+def test_read_lock_names_the_project(tmp_path: Path) -> None:
+    """Verify the placeholder name of a shipped lock is replaced by the normalized project name."""
+    lock_path = get_lock_path(tmp_path, DependencySpec.from_pyproject(PYPROJECT))
+    lock_path.parent.mkdir()
+    lock_path.write_text(LOCK, encoding="utf-8")
+
+    lock = read_lock(tmp_path, PYPROJECT, "My_Service")
+
+    assert lock is not None
+    assert 'name = "my-service"' in lock
+    assert read_lock(tmp_path, PYPROJECT.replace("aiosqlite", "asyncpg"), "svc") is None
+
+
+def test_generator_emits_the_matching_lock(tmp_path: Path) -> None:
+    """Verify uv.lock is generated only when the project's dependency set was pre-resolved."""
+    config = ProjectConfig(name="svc", database=Database.SQLITE)
+    generator = LitestarGenerator(config, tmp_path / "svc")
+    generator.framework_dir = tmp_path / "Litestar"
+    assert Path(LOCK_FILE) not in generator.render()
+
+    pyproject = generator.render()[Path("pyproject.toml")].content
+    lock_path = get_lock_path(generator.framework_dir, DependencySpec.from_pyproject(pyproject))
+    assert lock_path.parent.name == LOCKS_DIR
+    lock_path.parent.mkdir(parents=True)
+    lock_path.write_text(LOCK, encoding="utf-8")
+    generator.generate()
+
+    lock = (tmp_path / "svc" / LOCK_FILE).read_text(encoding="utf-8")
+    assert f'name = "{config.slug}"' in lock
+    assert generator.files[Path(LOCK_FILE)]
+
+
+def test_shipped_locks_cover_every_database() -> None:
+    """Verify the shipped lock files give every database's project a lock for its own name."""
+    for database in Database:
+        config = ProjectConfig(name="Billing Service", database=database)
+        lock = LitestarGenerator(config, Path(config.slug)).render()[Path(LOCK_FILE)].content
+
+        assert 'name = "billing-service"' in lock
+        assert LOCK_PROJECT_NAME not in lock
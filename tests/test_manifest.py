@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import msgspec
+import pytest
+from jinja2 import DictLoader
+
+from src import manifest as manifest_module
+from src.manifest import (
+    Phase,
+    TemplateManifest,
+    build_manifest,
+    find_context_keys,
+    load_scanned_manifest,
+    read_front_matter,
+    write_manifest,
+)
+from src.utils import create_environment
+
+
+def test_build_manifest_describes_templates() -> None:
+    """Verify the manifest lists each template's output, owner and context keys."""
+    manifest = build_manifest().frameworks["Litestar"]
+
+    assert {"AdvancedAlchemy", "LitestarSAQ", "LitestarVite"} <= set(manifest.plugins)
+
+    entries = {entry.template: entry for entry in manifest.templates}
+    app = entries["App/app.py.jinja"]
+    assert app.output == "app.py"
+    assert app.phase == Phase.BASE
+    assert app.plugin is None
+    assert {"advanced_alchemy", "litestar_vite"} <= set(app.context_keys)
+
+    services = entries["Plugins/AdvancedAlchemy/lib/services.py.jinja"]
+    assert services.output == "lib/services.py"
+    assert services.phase == Phase.PLUGIN
+    assert services.plugin == "AdvancedAlchemy"
+
+    assert entries["Config/pyproject.toml.jinja"].phase == Phase.CONFIG
+    assert entries["Containers/Dockerfile.jinja"].phase == Phase.CONTAINERS
+
+    assert entries["App/controllers/users.py.jinja"].condition == "advanced_alchemy"
+    assert app.condition is None
+
+
+def test_write_manifest_round_trips(tmp_path: Path) -> None:
+    """Verify the written manifest decodes back to the same manifest."""
+    manifest = write_manifest(tmp_path / "manifest.json")
+
+    assert msgspec.json.decode((tmp_path / "manifest.json").read_bytes(), type=TemplateManifest) == manifest
+
+
+def test_scanned_manifest_is_cached_per_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a source checkout scans its templates once, and again only after they changed."""
+    monkeypatch.setenv("LITESTAR_START_CACHE_DIR", str(tmp_path))
+    scanned = load_scanned_manifest()
+
+    def fail() -> None:
+        pytest.fail("the templates were scanned again")
+
+    monkeypatch.setattr(manifest_module, "build_manifest", fail)
+    assert load_scanned_manifest() == scanned
+
+    monkeypatch.setattr(manifest_module, "get_source_key", lambda: "edited")
+    monkeypatch.setattr(manifest_module, "build_manifest", lambda: scanned)
+    assert load_scanned_manifest() == scanned
+    assert msgspec.json.decode(next(tmp_path.rglob("manifest.json")).read_bytes())["source_key"] == "edited"
+
+
+def test_read_front_matter() -> None:
+    """Verify template settings are only read from a leading front-matter comment."""
+    assert read_front_matter("{#- when: docker and has_database -#}\nFROM python") == {
+        "when": "docker and has_database",
+    }
+    assert read_front_matter("{#-\nwhen: litestar_vite\noverlay: merge\n-#}\n") == {
+        "when": "litestar_vite",
+        "overlay": "merge",
+    }
+    assert not read_front_matter("{# Application settings #}\n")
+    assert not read_front_matter("import os\n{# when: docker #}\n")
+
+
+def test_find_context_keys_narrows_attribute_reads() -> None:
+    """Verify variables only read through attributes are recorded per attribute."""
+    env = create_environment(DictLoader({}))
+
+    assert find_context_keys(env.parse("{{ project.docker }}{% if project.name %}{{ db_config.port }}{% endif %}")) == {
+        "project.docker",
+        "project.name",
+        "db_config.port",
+    }
+    assert find_context_keys(env.parse("{{ project.docker }}{{ project | string }}")) == {"project"}
+    assert not find_context_keys(env.parse("{% set docker = true %}{{ docker }}"))
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+from src.generator import GenerationError
+from src.manifest import Overlay, Phase, TemplateEntry
+from src.planner import OverlayConflictError, StaticMergeError, plan_outputs
+
+
+def make_entry(
+    template: str,
+    output: str,
+    overlay: Overlay = Overlay.EXCLUSIVE,
+    *,
+    static: bool = False,
+) -> TemplateEntry:
+    """Build a manifest entry for a plugin template.
+
+    Returns:
+        The manifest entry.
+
+    """
+    return TemplateEntry(
+        template=template,
+        output=output,
+        phase=Phase.PLUGIN,
+        plugin="Test",
+        overlay=overlay,
+        static=static,
+    )
+
+
+def test_plan_outputs_applies_overlays() -> None:
+    """Verify overriding templates replace the owner and merging templates are appended."""
+    plan = plan_outputs(
+        [
+            make_entry("App/lib/__init__.py.jinja", "lib/__init__.py"),
+            make_entry("App/settings.py.jinja", "settings.py"),
+            make_entry("Plugins/A/lib/__init__.py.jinja", "lib/__init__.py", Overlay.OVERRIDE),
+            make_entry("Plugins/B/lib/__init__.py.jinja", "lib/__init__.py", Overlay.MERGE),
+        ],
+    )
+
+    assert plan == {
+        Path("lib/__init__.py"): ("Plugins/A/lib/__init__.py.jinja", "Plugins/B/lib/__init__.py.jinja"),
+        Path("settings.py"): ("App/settings.py.jinja",),
+    }
+
+
+def test_plan_outputs_reports_every_collision() -> None:
+    """Verify exclusive templates claiming the same output path are all reported before rendering."""
+    with pytest.raises(GenerationError) as exc_info:
+        plan_outputs(
+            [
+                make_entry("App/lib/utils.py.jinja", "lib/utils.py"),
+                make_entry("Plugins/A/lib/utils.py.jinja", "lib/utils.py"),
+                make_entry("App/app.py.jinja", "app.py"),
+                make_entry("Plugins/A/app.py.jinja", "app.py"),
+            ],
+        )
+
+    errors = exc_info.value.errors
+    assert set(errors) == {Path("app.py"), Path("lib/utils.py")}
+    assert isinstance(errors[Path("lib/utils.py")], OverlayConflictError)
+    assert errors[Path("lib/utils.py")].templates == ["App/lib/utils.py.jinja", "Plugins/A/lib/utils.py.jinja"]
+
+
+def test_plan_outputs_never_merges_static_assets() -> None:
+    """Verify a static asset can replace or be replaced by a template but never joins a merge chain."""
+    with pytest.raises(GenerationError) as exc_info:
+        plan_outputs(
+            [
+                make_entry("App/public/logo.svg", "public/logo.svg", static=True),
+                make_entry("Plugins/A/public/logo.svg.jinja", "public/logo.svg", Overlay.MERGE),
+                make_entry("App/static/app.css.jinja", "static/app.css"),
+                make_entry("Plugins/A/static/app.css", "static/app.css", Overlay.MERGE, static=True),
+            ],
+        )
+
+    errors = exc_info.value.errors
+    assert set(errors) == {Path("public/logo.svg"), Path("static/app.css")}
+    assert isinstance(errors[Path("static/app.css")], StaticMergeError)
+    assert errors[Path("static/app.css")].static == ["Plugins/A/static/app.css"]
+
+    plan = plan_outputs(
+        [
+            make_entry("App/public/logo.svg", "public/logo.svg", static=True),
+            make_entry("Plugins/A/public/logo.svg.jinja", "public/logo.svg", Overlay.OVERRIDE),
+            make_entry("App/static/app.css.jinja", "static/app.css"),
+            make_entry("Plugins/A/static/app.css", "static/app.css", Overlay.OVERRIDE, static=True),
+        ],
+    )
+    assert plan == {
+        Path("public/logo.svg"): ("Plugins/A/public/logo.svg.jinja",),
+        Path("static/app.css"): ("Plugins/A/static/app.css",),
+    }
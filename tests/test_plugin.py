@@ -1,6 +1,19 @@
+import sys
 from pathlib import Path
 
-from src.plugin import Plugin, discover_plugins
+import msgspec
+import pytest
+
+from src.models import Database, Framework, ProjectConfig
+from src.plugin import (
+    DEFAULT_HOOK_TIMEOUT,
+    BasePlugin,
+    Plugin,
+    PluginMetadata,
+    discover_plugins,
+    get_hook_settings,
+    has_post_generate,
+)
 
 MIN_PLUGIN_COUNT = 3
 
@@ -24,3 +37,87 @@ def test_discover_litestar_plugins() -> None:
         assert isinstance(plugin.path, Path)
         assert plugin.path.exists()
         assert plugin.path.is_dir()
+
+
+def test_discover_plugins_does_not_import_plugin_modules(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the registry is built from metadata and plugin code is imported on first use."""
+    module_name = "src.Litestar.Plugins.LitestarVite"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    discover_plugins.cache_clear()
+
+    plugins = {plugin.id: plugin for plugin in discover_plugins("Litestar")}
+    assert discover_plugins("Litestar") is discover_plugins("Litestar")
+    assert plugins["litestar_vite"].name == "Litestar Vite (Frontend Integration)"
+    assert module_name not in sys.modules
+
+    assert isinstance(plugins["litestar_vite"].implementation, BasePlugin)
+    assert module_name in sys.modules
+
+
+def test_plugin_metadata_applicability() -> None:
+    """Verify database applicability rules declared in plugin metadata."""
+    metadata = msgspec.toml.decode(
+        b'id = "orm"\nname = "ORM"\ndatabases = ["PostgreSQL"]\n',
+        type=PluginMetadata,
+    )
+    config = ProjectConfig(
+        name="Test",
+        framework=Framework.LITESTAR,
+        database=Database.NONE,
+        plugins=[],
+        docker=False,
+        docker_infra=False,
+    )
+
+    assert not metadata.is_applicable(config)
+    config.database = Database.POSTGRESQL
+    assert metadata.is_applicable(config)
+
+
+class ProtocolPlugin:
+    """A plugin written against the protocol alone, without hook settings."""
+
+    id = "legacy"
+    name = "Legacy"
+    description = ""
+    path = Path()
+
+    def is_applicable(self, config: ProjectConfig) -> bool:  # noqa: ARG002, PLR6301
+        """Apply to every configuration.
+
+        Returns:
+            True.
+
+        """
+        return True
+
+    def get_template_context(self, config: ProjectConfig) -> dict:  # noqa: ARG002, PLR6301
+        """Add no context.
+
+        Returns:
+            An empty context.
+
+        """
+        return {}
+
+    def post_generate(self, config: ProjectConfig, output_dir: Path) -> None:
+        """Do nothing."""
+
+
+class HookPlugin(BasePlugin):
+    """A plugin overriding the post-generation hook."""
+
+    def post_generate(self, config: ProjectConfig, output_dir: Path) -> None:
+        """Do nothing."""
+
+
+def test_plugins_without_hook_members_conform_with_defaults() -> None:
+    """Verify hook settings are optional for protocol plugins and defaulted by BasePlugin."""
+    legacy = ProtocolPlugin()
+
+    assert isinstance(legacy, Plugin)
+    assert get_hook_settings(legacy).timeout == DEFAULT_HOOK_TIMEOUT
+    assert has_post_generate(legacy)
+    assert not BasePlugin().has_post_generate
+    assert HookPlugin().has_post_generate
+    assert get_hook_settings(HookPlugin()).after == []
@@ -0,0 +1,81 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src.generator import ProjectGenerator
+from src.locks import DependencySpec
+from src.models import Database, ProjectConfig
+from src.prefetch import Prefetcher
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the fake uv is a script with a shebang")
+
+# How long the fake uv of the cancellation test would run if it were not interrupted
+SLOW_UV_SECONDS = 30
+
+
+def make_fake_uv(tmp_path: Path, *, sleep: float = 0) -> tuple[Path, Path]:
+    """Create an executable that records its arguments in place of uv.
+
+    Returns:
+        The executable and the log of its invocations, one per line.
+
+    """
+    log = tmp_path / "uv.log"
+    uv = tmp_path / "uv"
+    uv.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        f"with open({str(log)!r}, 'a') as log:\n"
+        "    log.write(' '.join(sys.argv[1:]) + '\\n')\n"
+        f"time.sleep({sleep})\n",
+        encoding="utf-8",
+    )
+    uv.chmod(0o755)
+    return uv, log
+
+
+def test_requirements_match_the_rendered_pyproject(tmp_path: Path) -> None:
+    """Verify the requirements include the database driver, the plugins and the dev group."""
+    config = ProjectConfig(name="svc", database=Database.SQLITE, plugins=["advanced_alchemy"])
+    pyproject = ProjectGenerator(config, tmp_path).render()[Path("pyproject.toml")].content
+
+    spec = DependencySpec.from_pyproject(pyproject)
+
+    names = {requirement.split(">=")[0] for requirement in spec.requirements}
+    assert spec.requires_python.startswith(">=")
+    assert {"advanced-alchemy", "aiosqlite", "ruff"} <= names
+    assert "asyncmy" not in names
+
+
+def test_prefetcher_installs_the_requirements_of_each_answer(tmp_path: Path) -> None:
+    """Verify the base requirements are prefetched first and plugin requirements added later."""
+    uv, log = make_fake_uv(tmp_path)
+    prefetcher = Prefetcher(str(uv))
+
+    prefetcher.update(ProjectConfig(name="svc"))
+    config = ProjectConfig(name="svc", database=Database.SQLITE, plugins=["advanced_alchemy"])
+    prefetcher.update(config)
+    prefetcher.finish()
+
+    installs = [line for line in log.read_text(encoding="utf-8").splitlines() if line.startswith("pip install")]
+    assert prefetcher.errors == []
+    assert installs
+    assert "aiosqlite" in installs[-1]
+    assert any(requirement.startswith("advanced-alchemy") for requirement in prefetcher.prefetched)
+
+
+def test_cancel_interrupts_a_running_download(tmp_path: Path) -> None:
+    """Verify cancelling stops a slow uv instead of waiting for it."""
+    uv, log = make_fake_uv(tmp_path, sleep=SLOW_UV_SECONDS)
+    prefetcher = Prefetcher(str(uv))
+    prefetcher.update(ProjectConfig(name="svc"))
+    while not log.exists():
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    prefetcher.cancel()
+
+    assert time.perf_counter() - start < SLOW_UV_SECONDS / 2
+    assert prefetcher.errors == []
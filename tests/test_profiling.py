@@ -0,0 +1,65 @@
+import threading
+from pathlib import Path
+
+import msgspec
+
+from src.profiling import Profiler
+
+
+def test_totals_nest_phases_under_their_parent() -> None:
+    """Verify repeated phases are summed and listed right after the phase enclosing them."""
+    profiler = Profiler()
+    with profiler.phase("render"):
+        with profiler.phase("context"):
+            pass
+        for _ in range(3):
+            with profiler.phase("template"), profiler.phase("detail", "file"):
+                pass
+    with profiler.phase("write"):
+        pass
+
+    totals = profiler.totals()
+
+    assert [(total.name, total.depth, total.calls) for total in totals] == [
+        ("render", 0, 1),
+        ("context", 1, 1),
+        ("template", 1, 3),
+        ("write", 0, 1),
+    ]
+    assert totals[0].seconds >= totals[1].seconds + totals[2].seconds
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    """Verify a disabled profiler can be used like an enabled one without recording spans."""
+    profiler = Profiler(enabled=False)
+    with profiler.phase("render"):
+        pass
+
+    assert profiler.spans == []
+    assert profiler.totals() == []
+
+
+def test_chrome_trace_has_an_event_per_span_and_thread(tmp_path: Path) -> None:
+    """Verify spans from every thread are exported as complete events with named threads."""
+    profiler = Profiler()
+
+    def work() -> None:
+        with profiler.phase("worker", "file"):
+            pass
+
+    with profiler.phase("main"):
+        thread = threading.Thread(target=work, name="renderer")
+        thread.start()
+        thread.join()
+
+    trace_path = tmp_path / "trace.json"
+    profiler.write_trace(trace_path)
+    events = msgspec.json.decode(trace_path.read_bytes())["traceEvents"]
+
+    thread_names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+    complete = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert thread_names == {threading.current_thread().name, "renderer"}
+    assert complete.keys() == {"main", "worker"}
+    assert complete["main"]["tid"] != complete["worker"]["tid"]
+    assert complete["main"]["ts"] <= complete["worker"]["ts"]
+    assert complete["worker"]["cat"] == "file"
@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from src import manifest as manifest_module
+from src.batch import run_batch
+from src.generator import ProjectGenerator
+from src.manifest import PROJECT_MANIFEST_FILE
+from src.models import Database, ProjectConfig
+from src.project_cache import ProjectCache
+from src.utils import hash_file
+
+CONFIG = ProjectConfig(name="svc", database=Database.SQLITE, plugins=["advanced_alchemy"], docker=True)
+
+
+def read_tree(directory: Path) -> dict[str, bytes]:
+    """Read every file under a directory, keyed by relative POSIX path.
+
+    Returns:
+        The content of each file.
+
+    """
+    return {
+        path.relative_to(directory).as_posix(): path.read_bytes() for path in directory.rglob("*") if path.is_file()
+    }
+
+
+def test_cache_hit_materializes_the_same_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a repeated configuration is materialized from the cache without rendering."""
+    cache = ProjectCache(tmp_path / "cache")
+    first = ProjectGenerator(CONFIG, tmp_path / "first", cache=cache)
+    first.generate()
+
+    def fail() -> None:
+        pytest.fail("a cached project was rendered")
+
+    monkeypatch.setattr(ProjectGenerator, "render", lambda _: fail())
+    second = ProjectGenerator(CONFIG, tmp_path / "second", cache=cache)
+    second.generate()
+
+    assert read_tree(tmp_path / "second") == read_tree(tmp_path / "first")
+    assert second.files == first.files
+    assert PROJECT_MANIFEST_FILE in read_tree(tmp_path / "second")
+    assert all(hash_file(tmp_path / "second" / path) == digest for path, digest in second.files.items())
+
+
+def test_cache_misses_on_another_configuration_or_a_lost_blob(tmp_path: Path) -> None:
+    """Verify the key depends on the configuration and an incomplete entry is ignored."""
+    cache = ProjectCache(tmp_path / "cache")
+    ProjectGenerator(CONFIG, tmp_path / "first", cache=cache).generate()
+
+    assert cache.key(CONFIG) == ProjectCache(tmp_path / "cache").key(CONFIG)
+    assert cache.load(ProjectConfig(name="other", database=Database.SQLITE)) is None
+    loaded = cache.load(CONFIG)
+    assert loaded is not None
+
+    _, blobs = loaded
+    next(iter(blobs.values())).unlink()
+    assert cache.load(CONFIG) is None
+
+
+def test_installed_package_is_keyed_by_its_shipped_manifest(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify an installed package identifies its templates without walking them, unlike a source checkout."""
+    source_key = ProjectCache().environment_key
+
+    def fail() -> None:
+        pytest.fail("the packaged files were walked")
+
+    monkeypatch.setattr(manifest_module, "read_shipped_manifest", lambda: b'{"version": "shipped"}')
+    monkeypatch.setattr(manifest_module, "get_source_key", fail)
+    shipped_key = ProjectCache().environment_key
+
+    monkeypatch.setattr(manifest_module, "read_shipped_manifest", lambda: b'{"version": "rebuilt"}')
+    assert ProjectCache().environment_key not in {source_key, shipped_key}
+    assert shipped_key != source_key
+
+
+def test_cache_drops_entries_with_a_modified_blob(tmp_path: Path) -> None:
+    """Verify a blob modified on disk is never materialized and is replaced on the next store."""
+    cache = ProjectCache(tmp_path / "cache")
+    ProjectGenerator(CONFIG, tmp_path / "first", cache=cache).generate()
+    loaded = cache.load(CONFIG)
+    assert loaded is not None
+
+    _, blobs = loaded
+    blobs[Path("pyproject.toml")].write_text("# edited\n", encoding="utf-8")
+    assert cache.load(CONFIG) is None
+
+    second = ProjectGenerator(CONFIG, tmp_path / "second", cache=cache)
+    second.generate()
+    assert not second.cached
+    assert read_tree(tmp_path / "second") == read_tree(tmp_path / "first")
+    assert cache.load(CONFIG) is not None
+
+
+def test_batch_copies_cached_projects(tmp_path: Path) -> None:
+    """Verify batch projects repeated from the cache are copies, not links to its blobs."""
+    cache = ProjectCache(tmp_path / "cache")
+    run_batch([CONFIG], tmp_path / "first", cache=cache)
+    results = run_batch([CONFIG], tmp_path / "second", cache=cache)
+
+    assert results[0].ok
+    assert results[0].files == len(read_tree(tmp_path / "first" / "svc")) - 1
+    assert (tmp_path / "second" / "svc" / "pyproject.toml").stat().st_nlink == 1
+
+    (tmp_path / "second" / "svc" / "pyproject.toml").write_text("# edited\n", encoding="utf-8")
+    run_batch([CONFIG], tmp_path / "third", cache=cache)
+    assert read_tree(tmp_path / "third" / "svc") == read_tree(tmp_path / "first" / "svc")
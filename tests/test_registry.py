@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src import registry
+from src.Litestar.generator import LitestarGenerator
+from src.models import Database, Framework, ProjectConfig
+from src.plugin import discover_plugins
+from src.registry import REGISTRY_FILE, get_framework_manifest, load_plugin_registry
+
+
+def clear_caches() -> None:
+    """Forget every cached plugin registry."""
+    load_plugin_registry.cache_clear()
+    get_framework_manifest.cache_clear()
+    discover_plugins.cache_clear()
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Install a third-party plugin distribution into a temporary site directory.
+
+    Yields:
+        The site directory, prepended to ``sys.path``.
+
+    """
+    site = tmp_path / "site"
+    package = site / "acme_plugin"
+    (package / "Templates" / "acme").mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "plugin.toml").write_text('id = "acme"\nname = "Acme"\n', encoding="utf-8")
+    (package / "Templates" / "acme" / "__init__.py.jinja").write_text('NAME = "{{ project_name }}"\n', encoding="utf-8")
+
+    dist_info = site / "acme_plugin-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-plugin\nVersion: 1.0\n", encoding="utf-8")
+    (dist_info / "entry_points.txt").write_text("[litestar_start.plugins]\nacme = acme_plugin\n", encoding="utf-8")
+
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setenv("LITESTAR_START_CACHE_DIR", str(tmp_path / "cache"))
+    clear_caches()
+    yield site
+    clear_caches()
+
+
+def test_entry_point_plugin_is_generated(site_dir: Path, tmp_path: Path) -> None:
+    """Verify a plugin published under the entry-point group is discovered and rendered."""
+    plugins = {plugin.id: plugin for plugin in discover_plugins("Litestar")}
+    assert plugins["acme"].path == site_dir / "acme_plugin"
+    assert "advanced_alchemy" in plugins
+
+    config = ProjectConfig(
+        name="Acme Project",
+        framework=Framework.LITESTAR,
+        database=Database.NONE,
+        plugins=["acme"],
+        docker=False,
+        docker_infra=False,
+    )
+    LitestarGenerator(config, tmp_path / "project").generate()
+
+    assert (tmp_path / "project" / "acme" / "__init__.py").read_text(encoding="utf-8") == 'NAME = "Acme Project"\n'
+
+
+def test_registry_is_cached_until_distributions_change(
+    site_dir: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify entry points are only rescanned when the installed distributions change."""
+    assert [plugin.key for plugin in load_plugin_registry().plugins] == ["acme_plugin"]
+    assert list((tmp_path / "cache").rglob(REGISTRY_FILE))
+
+    def fail() -> list:
+        pytest.fail("entry points were rescanned")
+
+    monkeypatch.setattr(registry, "scan_entry_points", fail)
+    clear_caches()
+    assert [plugin.key for plugin in load_plugin_registry().plugins] == ["acme_plugin"]
+
+    (site_dir / "other-2.0.dist-info").mkdir()
+    monkeypatch.setattr(registry, "scan_entry_points", list)
+    clear_caches()
+    assert load_plugin_registry().plugins == []
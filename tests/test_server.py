@@ -0,0 +1,66 @@
+import io
+import zipfile
+
+import pytest
+
+pytest.importorskip("litestar")
+
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+from litestar.testing import TestClient
+
+from src.manifest import PROJECT_MANIFEST_FILE
+from src.server import GeneratorService, create_app
+
+
+def test_serve_streams_a_zipped_project() -> None:
+    """Verify a JSON configuration is answered with the zipped project and counted in the metrics."""
+    with TestClient(app=create_app()) as client:
+        response = client.post("/projects", json={"name": "Billing Service", "database": "SQLite"})
+        metrics = client.get("/metrics").json()
+
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"] == "application/zip"
+    assert 'filename="billing_service.zip"' in response.headers["content-disposition"]
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert "pyproject.toml" in names
+    assert PROJECT_MANIFEST_FILE in names
+    assert metrics["generated"] == 1
+    assert metrics["bytes_sent"] == len(response.content)
+
+
+def test_serve_rejects_invalid_and_excess_requests() -> None:
+    """Verify invalid configurations get 400 and requests beyond the backlog get 503."""
+    service = GeneratorService(max_concurrency=1, backlog=0)
+    with TestClient(app=create_app(service)) as client:
+        invalid = client.post("/projects", json={"name": "svc", "plugins": ["missing"]})
+        service.metrics.in_flight = 1
+        busy = client.post("/projects", json={"name": "svc"})
+
+    assert invalid.status_code == HTTP_400_BAD_REQUEST
+    assert "unknown plugin" in invalid.text
+    assert busy.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    assert busy.headers["retry-after"] == "1"
+    assert service.metrics.invalid == 1
+    assert service.metrics.rejected == 1
+
+
+def test_serve_counts_every_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify an unexpected error is counted as a failure and answered with 500."""
+    service = GeneratorService()
+
+    def fail(*_: object) -> None:
+        msg = "unexpected"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(service, "build_archive", fail)
+    with TestClient(app=create_app(service)) as client:
+        response = client.post("/projects", json={"name": "svc"})
+
+    assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+    assert service.metrics.requests == service.metrics.failed == 1
+    assert service.metrics.in_flight == 0
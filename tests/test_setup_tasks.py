@@ -0,0 +1,224 @@
+import asyncio
+import functools
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from src import setup_tasks
+from src.generator import ProjectGenerator
+from src.models import Database, ProjectConfig
+from src.plugin import DEFAULT_HOOK_TIMEOUT, HookSettings
+from src.profiling import Profiler
+from src.setup_tasks import SetupStep, StepStatus, build_setup_steps, run_command, run_command_sync, run_setup
+
+# Each of the overlapping steps sleeps this long; run in series they would take twice as long
+STEP_SECONDS = 0.4
+# How long the hung steps of the timeout test would run if they were not cancelled
+HUNG_SECONDS = 30
+
+
+def python_step(name: str, code: str, after: tuple[str, ...] = ()) -> SetupStep:
+    """Build a step running Python code in a subprocess.
+
+    Returns:
+        The setup step.
+
+    """
+    return SetupStep(name, command=[sys.executable, "-c", code], after=after)
+
+
+def test_independent_steps_overlap_and_stream_output(tmp_path: Path) -> None:
+    """Verify independent steps run at the same time and their output is attributed to them."""
+    lines: list[tuple[str, str]] = []
+    steps = [
+        python_step("first", f"import time; print('one'); time.sleep({STEP_SECONDS})"),
+        python_step("second", f"import time; print('two'); time.sleep({STEP_SECONDS})"),
+    ]
+
+    start = time.perf_counter()
+    results = run_setup(steps, tmp_path, lambda step, line: lines.append((step, line)))
+
+    assert time.perf_counter() - start < STEP_SECONDS * 2
+    assert [result.status for result in results] == [StepStatus.DONE, StepStatus.DONE]
+    assert sorted(lines) == [("first", "one"), ("second", "two")]
+
+
+def test_dependents_wait_and_are_skipped_after_a_failure(tmp_path: Path) -> None:
+    """Verify a step starts after its dependencies and is skipped when one of them fails."""
+    marker = tmp_path / "marker"
+    steps = [
+        python_step("write", f"import time; time.sleep(0.1); open({str(marker)!r}, 'w').close()"),
+        SetupStep("read", function=marker.read_text, after=("write",)),
+        python_step("fail", "raise SystemExit(3)"),
+        SetupStep("blocked", function=lambda: None, after=("fail",)),
+    ]
+
+    results = {result.name: result for result in run_setup(steps, tmp_path, lambda *_: None)}
+
+    assert results["read"].status == StepStatus.DONE
+    assert results["fail"].status == StepStatus.FAILED
+    assert "exit status 3" in (results["fail"].error or "")
+    assert results["blocked"].status == StepStatus.SKIPPED
+
+
+def test_a_raising_hook_fails_only_its_step(tmp_path: Path) -> None:
+    """Verify an unexpected exception fails its step and skips its dependents without stopping the others."""
+
+    def broken_hook() -> None:
+        msg = "broken plugin"
+        raise RuntimeError(msg)
+
+    async def broken_async_hook() -> None:
+        await asyncio.sleep(0)
+        msg = "missing_module"
+        raise ImportError(msg)
+
+    steps = [
+        SetupStep("hook", function=broken_hook),
+        SetupStep("async hook", function=broken_async_hook),
+        SetupStep("dependent", function=lambda: None, after=("hook",)),
+        python_step("independent", "import time; time.sleep(0.1)"),
+    ]
+
+    results = {result.name: result for result in run_setup(steps, tmp_path, lambda *_: None)}
+
+    assert results["hook"].status == StepStatus.FAILED
+    assert results["hook"].error == "RuntimeError: broken plugin"
+    assert results["async hook"].error == "ImportError: missing_module"
+    assert results["dependent"].status == StepStatus.SKIPPED
+    assert results["independent"].status == StepStatus.DONE
+
+
+@pytest.mark.parametrize(
+    ("steps", "error"),
+    [
+        ([SetupStep("a", after=("missing",))], "unknown step"),
+        ([SetupStep("a", after=("b",)), SetupStep("b", after=("a",))], "cycle"),
+    ],
+)
+def test_invalid_graphs_are_rejected(tmp_path: Path, steps: list[SetupStep], error: str) -> None:
+    """Verify unknown and cyclic dependencies fail before any step runs."""
+    with pytest.raises(ValueError, match=error):
+        run_setup(steps, tmp_path, lambda *_: None)
+
+
+def test_steps_are_profiled_on_their_own_tracks(tmp_path: Path) -> None:
+    """Verify concurrent steps get a phase each and a trace track each."""
+    profiler = Profiler()
+    steps = [python_step("first", "pass"), python_step("second", "pass")]
+
+    with profiler.phase("setup"):
+        run_setup(steps, tmp_path, lambda *_: None, profiler)
+
+    setup, *children = ((total.name, total.depth) for total in profiler.totals())
+    assert setup == ("setup", 0)
+    assert set(children) == {("first", 1), ("second", 1)}
+    tracks = {event.tid for event in profiler.to_chrome_trace().traceEvents if event.ph == "X"}
+    assert len(tracks) == len(steps) + 1
+
+
+def test_build_setup_steps_follows_the_configuration(tmp_path: Path) -> None:
+    """Verify Docker steps are only planned when requested and plugin hooks wait for uv sync."""
+    config = ProjectConfig(
+        name="svc",
+        database=Database.POSTGRESQL,
+        plugins=["advanced_alchemy", "litestar_vite"],
+        docker=True,
+        docker_infra=True,
+    )
+    steps = {step.name: step for step in build_setup_steps(ProjectGenerator(config, tmp_path), tmp_path)}
+    plain = {step.name for step in build_setup_steps(ProjectGenerator(ProjectConfig(name="svc"), tmp_path), tmp_path)}
+
+    assert {"docker compose up", ".dockerignore"} <= steps.keys()
+    # Only plugins with post-generation logic get a step
+    assert "advanced_alchemy hook" not in steps
+    assert steps["litestar_vite hook"].after == ("uv sync",)
+    assert steps["litestar_vite hook"].timeout == DEFAULT_HOOK_TIMEOUT
+    assert plain == {"git init", "uv sync", ".env"}
+
+
+class FakePlugin:
+    """A plugin with an async hook and declared ordering."""
+
+    def __init__(self, plugin_id: str, after: tuple[str, ...] = ()) -> None:
+        """Initialize the plugin."""
+        self.id = plugin_id
+        self.hook = HookSettings(after=list(after), timeout=5)
+        self.has_post_generate = True
+
+    async def post_generate(self, config: ProjectConfig, output_dir: Path) -> None:
+        """Do nothing."""
+
+
+def test_plugin_hooks_wait_for_the_enabled_hooks_they_declare(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify hook ordering only refers to hooks that run, and each hook keeps its timeout."""
+    plugins = (FakePlugin("first"), FakePlugin("second", after=("first", "disabled")), FakePlugin("disabled"))
+    monkeypatch.setattr(setup_tasks, "discover_plugins", lambda _: plugins)
+    config = ProjectConfig(name="svc", plugins=["first", "second"])
+
+    steps = {step.name: step for step in build_setup_steps(ProjectGenerator(config, tmp_path), tmp_path)}
+
+    assert steps["first hook"].after == ("uv sync",)
+    assert steps["second hook"].after == ("uv sync", "first hook")
+    assert steps["second hook"].timeout == FakePlugin("second").hook.timeout
+    assert "disabled hook" not in steps
+
+
+def test_steps_exceeding_their_timeout_are_cancelled(tmp_path: Path) -> None:
+    """Verify hung commands, coroutines and functions fail on their timeout without stalling other steps."""
+    lines: list[tuple[str, str]] = []
+
+    async def hook() -> None:
+        await run_command([sys.executable, "-c", "print('started')"], tmp_path)
+        await asyncio.sleep(HUNG_SECONDS)
+
+    steps = [
+        SetupStep("command", command=[sys.executable, "-c", f"import time; time.sleep({HUNG_SECONDS})"], timeout=0.2),
+        SetupStep("coroutine", function=hook, timeout=0.2),
+        SetupStep("function", function=functools.partial(time.sleep, HUNG_SECONDS), timeout=0.2),
+        python_step("independent", "print('done')"),
+    ]
+
+    start = time.perf_counter()
+    results = {result.name: result for result in run_setup(steps, tmp_path, lambda *line: lines.append(line))}
+
+    assert time.perf_counter() - start < HUNG_SECONDS / 2
+    for name in ("command", "coroutine", "function"):
+        assert results[name].status == StepStatus.FAILED
+        assert results[name].error == "timed out after 0.2s"
+    assert results["independent"].status == StepStatus.DONE
+    assert sorted(lines) == [("coroutine", "started"), ("independent", "done")]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="signal 0 only probes processes on POSIX")
+def test_commands_of_a_cancelled_sync_hook_are_killed(tmp_path: Path) -> None:
+    """Verify a synchronous hook's commands stream their output and are killed on its timeout."""
+    lines: list[tuple[str, str]] = []
+    pid_file = tmp_path / "pid"
+    code = (
+        f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); "
+        f"print('started', flush=True); time.sleep({HUNG_SECONDS})"
+    )
+
+    def hook() -> None:
+        run_command_sync([sys.executable, "-c", code], tmp_path)
+
+    results = run_setup([SetupStep("hook", function=hook, timeout=1)], tmp_path, lambda *line: lines.append(line))
+
+    assert results[0].error == "timed out after 1s"
+    assert lines == [("hook", "started")]
+    pid = int(pid_file.read_text(encoding="utf-8"))
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        time.sleep(0.05)
+    pytest.fail("the hook's command outlived its timeout")
@@ -0,0 +1,93 @@
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.generator import ProjectGenerator
+from src.models import Database, Framework, ProjectConfig
+from src.sinks import ArchiveFormat, ArchiveSink, infer_archive_format
+
+
+def make_config() -> ProjectConfig:
+    """Build a project configuration that enables plugins and Docker files.
+
+    Returns:
+        The project configuration.
+
+    """
+    return ProjectConfig(
+        name="Archived Project",
+        framework=Framework.LITESTAR,
+        database=Database.POSTGRESQL,
+        plugins=["advanced_alchemy"],
+        docker=True,
+        docker_infra=True,
+    )
+
+
+def test_tar_gz_sink_streams_project(tmp_path: Path) -> None:
+    """Verify a tar.gz archive written to a stream holds the same files as a directory generation."""
+    ProjectGenerator(make_config(), tmp_path).generate()
+    expected = {
+        path.relative_to(tmp_path).as_posix(): path.read_bytes() for path in tmp_path.rglob("*") if path.is_file()
+    }
+
+    stream = io.BytesIO()
+    ProjectGenerator(make_config(), tmp_path / "unused").generate(ArchiveSink(stream, ArchiveFormat.TAR_GZ))
+
+    stream.seek(0)
+    with tarfile.open(fileobj=stream, mode="r:gz") as archive:
+        contents = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+    assert contents == expected
+    assert not (tmp_path / "unused").exists()
+
+
+def test_zip_sink_writes_archive_file(tmp_path: Path) -> None:
+    """Verify a zip archive is written to the target path with every generated file."""
+    target = tmp_path / "dist" / "project.zip"
+    generator = ProjectGenerator(make_config(), tmp_path / "project")
+    generator.generate(ArchiveSink(target, ArchiveFormat.ZIP))
+
+    with zipfile.ZipFile(target) as archive:
+        names = set(archive.namelist())
+
+    assert {path.as_posix() for path in generator.files} <= names
+    assert "docker-compose.infra.yml" in names
+
+
+@pytest.mark.parametrize("archive_format", [ArchiveFormat.TAR, ArchiveFormat.ZIP])
+def test_archive_sink_copies_assets(tmp_path: Path, archive_format: ArchiveFormat) -> None:
+    """Verify static assets are stored in archives byte for byte next to rendered files."""
+    asset = tmp_path / "logo.png"
+    asset.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)))
+
+    stream = io.BytesIO()
+    ArchiveSink(stream, archive_format).commit({Path("app.py"): "app = 1\n"}, assets={Path("static/logo.png"): asset})
+
+    stream.seek(0)
+    if archive_format == ArchiveFormat.ZIP:
+        with zipfile.ZipFile(stream) as archive:
+            contents = {name: archive.read(name) for name in archive.namelist()}
+    else:
+        with tarfile.open(fileobj=stream) as archive:
+            contents = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+    assert contents == {"app.py": b"app = 1\n", "static/logo.png": asset.read_bytes()}
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("project.tar.gz", ArchiveFormat.TAR_GZ),
+        ("project.TGZ", ArchiveFormat.TAR_GZ),
+        ("project.tar", ArchiveFormat.TAR),
+        ("project.zip", ArchiveFormat.ZIP),
+        ("project", None),
+    ],
+)
+def test_infer_archive_format(output: str, expected: ArchiveFormat | None) -> None:
+    """Verify archive formats are inferred from output file names."""
+    assert infer_archive_format(output) == expected
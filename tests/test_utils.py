@@ -0,0 +1,86 @@
+import hashlib
+from pathlib import Path
+
+import jinja2
+import pytest
+from jinja2 import ModuleLoader
+
+from src.utils import (
+    COMPILED_TEMPLATES_STAMP,
+    compile_templates,
+    copy_asset,
+    create_environment,
+    get_bytecode_cache,
+    get_package_dir,
+    get_template_env,
+    get_template_loader,
+    hash_content,
+    hash_file,
+)
+
+
+def test_compile_templates_matches_source(tmp_path: Path) -> None:
+    """Verify precompiled templates render the same output as their sources."""
+    count = compile_templates(tmp_path)
+
+    assert count > 0
+    assert (tmp_path / COMPILED_TEMPLATES_STAMP).read_text(encoding="utf-8") == jinja2.__version__
+
+    compiled_env = create_environment(ModuleLoader(str(tmp_path / "Litestar")))
+    source_env = get_template_env("Litestar")
+    context = {"project_name": "Compiled", "advanced_alchemy": True, "litestar_vite": False}
+
+    for name in ("App/app.py.jinja", "App/__init__.py.jinja", "App/controllers/users.py.jinja"):
+        assert compiled_env.get_template(name).render(**context) == source_env.get_template(name).render(**context)
+
+
+def test_template_env_uses_bytecode_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify compiled template bytecode is persisted under the user cache directory."""
+    monkeypatch.setenv("LITESTAR_START_CACHE_DIR", str(tmp_path))
+    get_bytecode_cache.cache_clear()
+    get_template_env.cache_clear()
+
+    try:
+        get_template_env("Litestar").get_template("Config/pyproject.toml.jinja")
+    finally:
+        get_bytecode_cache.cache_clear()
+        get_template_env.cache_clear()
+
+    assert list(tmp_path.rglob("__jinja2_*.cache"))
+
+
+def test_template_env_is_shared_across_roots() -> None:
+    """Verify one environment serves every template root, including plugin templates."""
+    framework_dir = get_package_dir() / "Litestar"
+    plugin_dirs = (framework_dir / "Plugins" / "AdvancedAlchemy",)
+
+    env = get_template_env("Litestar", plugin_dirs)
+
+    assert env is get_template_env("Litestar", plugin_dirs)
+    assert env.get_template("Config/pyproject.toml.jinja")
+    assert env.get_template("Plugins/AdvancedAlchemy/lib/services.py.jinja")
+    assert "Containers/Dockerfile.jinja" in get_template_loader(framework_dir, plugin_dirs).list_templates()
+
+
+def test_copy_asset_preserves_bytes(tmp_path: Path) -> None:
+    """Verify static assets are copied byte for byte into an independent file."""
+    source = tmp_path / "favicon.ico"
+    source.write_bytes(bytes(range(256)) * 1024)
+
+    destination = tmp_path / "project" / "public" / "favicon.ico"
+    copy_asset(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert not destination.samefile(source)
+    assert source.stat().st_nlink == 1
+
+
+def test_hash_file_handles_binary_and_text(tmp_path: Path) -> None:
+    """Verify text files hash like their rendered content and binary files hash their bytes."""
+    text = tmp_path / "app.py"
+    text.write_bytes(b"import os\r\n")
+    binary = tmp_path / "seed.bin"
+    binary.write_bytes(b"\xff\xfe\x00")
+
+    assert hash_file(text) == hash_content("import os\n")
+    assert hash_file(binary) == hashlib.sha256(b"\xff\xfe\x00").hexdigest()
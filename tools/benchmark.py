@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Benchmark project generation across the full configuration matrix.
+
+Every combination of database, applicable plugin set and Docker flags is generated
+once in a fresh interpreter with an empty cache directory (cold), then repeatedly in
+the same interpreter (warm). Results are written as JSON and can be compared with
+the results of an earlier release to catch regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import platform
+import statistics
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import msgspec
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# Make the package importable when the script is run from a checkout
+sys.path.insert(0, str(ROOT_DIR))
+
+from src import __version__  # noqa: E402
+from src.models import ProjectConfig  # noqa: E402
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Timing differences below this many seconds are treated as noise when comparing runs
+ABSOLUTE_TOLERANCE = 0.002
+
+
+class Sample(msgspec.Struct):
+    """Measurements of one configuration, taken in a fresh interpreter."""
+
+    cold_seconds: float
+    warm_seconds: list[float]
+    files: int
+    bytes: int
+    peak_rss_kib: int | None
+
+
+class Measurement(msgspec.Struct):
+    """Benchmark result of one configuration."""
+
+    key: str
+    config: ProjectConfig
+    cold_seconds: float
+    warm_seconds: float
+    warm_min_seconds: float
+    files: int
+    bytes: int
+    peak_rss_kib: int | None
+
+
+class BenchmarkReport(msgspec.Struct):
+    """Benchmark results of every configuration, with the environment they were taken in."""
+
+    version: str
+    python: str
+    platform: str
+    created: str
+    repeat: int
+    results: list[Measurement]
+
+
+@functools.cache
+def get_console() -> Console:
+    """Get the shared console, importing rich on first use so workers measure without it.
+
+    Returns:
+        The console.
+
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def config_key(config: ProjectConfig) -> str:
+    """Build a stable identifier of a configuration, used to match results between runs.
+
+    Returns:
+        The configuration identifier.
+
+    """
+    flags = [flag for flag, enabled in (("docker", config.docker), ("infra", config.docker_infra)) if enabled]
+    return "/".join([config.database.value, "+".join(config.plugins) or "-", "+".join(flags) or "-"])
+
+
+def measure_tree(directory: Path) -> tuple[int, int]:
+    """Count the files under a directory and their total size.
+
+    Returns:
+        The number of files and their size in bytes.
+
+    """
+    sizes = [path.stat().st_size for path in directory.rglob("*") if path.is_file()]
+    return len(sizes), sum(sizes)
+
+
+def peak_rss_kib() -> int | None:
+    """Get the peak resident set size of this process.
+
+    Returns:
+        The peak RSS in KiB, or None where it cannot be measured.
+
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs kibibytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_worker(payload: str, repeat: int) -> None:
+    """Measure one configuration and write the sample to stdout as JSON.
+
+    Args:
+        payload: The project configuration, JSON-encoded.
+        repeat: Number of warm generations.
+
+    """
+    start = time.perf_counter()
+    from src.generator import ProjectGenerator
+
+    config = msgspec.json.decode(payload, type=ProjectConfig)
+    with tempfile.TemporaryDirectory() as tmp:
+        output_root = Path(tmp)
+        ProjectGenerator(config, output_root / "cold").generate()
+        cold_seconds = time.perf_counter() - start
+        files, size = measure_tree(output_root / "cold")
+
+        warm_seconds = []
+        for index in range(repeat):
+            start = time.perf_counter()
+            ProjectGenerator(config, output_root / f"warm-{index}").generate()
+            warm_seconds.append(time.perf_counter() - start)
+
+    sample = Sample(cold_seconds, warm_seconds, files, size, peak_rss_kib())
+    sys.stdout.buffer.write(msgspec.json.encode(sample))
+
+
+def measure(config: ProjectConfig, repeat: int) -> Measurement:
+    """Measure one configuration in a fresh interpreter with an empty cache directory.
+
+    Args:
+        config: The project configuration.
+        repeat: Number of warm generations.
+
+    Returns:
+        The measurement.
+
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {
+            **os.environ,
+            "LITESTAR_START_CACHE_DIR": cache_dir,
+            "PYTHONDONTWRITEBYTECODE": "1",
+        }
+        process = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                msgspec.json.encode(config).decode(),
+                "--repeat",
+                str(repeat),
+            ],
+            capture_output=True,
+            check=True,
+            env=env,
+        )
+    sample = msgspec.json.decode(process.stdout, type=Sample)
+    return Measurement(
+        key=config_key(config),
+        config=config,
+        cold_seconds=sample.cold_seconds,
+        warm_seconds=statistics.median(sample.warm_seconds),
+        warm_min_seconds=min(sample.warm_seconds),
+        files=sample.files,
+        bytes=sample.bytes,
+        peak_rss_kib=sample.peak_rss_kib,
+    )
+
+
+def print_summary(report: BenchmarkReport) -> None:
+    """Print the slowest configurations and the totals of a run."""
+    from rich.table import Table
+
+    table = Table(title=f"litestar-start {report.version} ({len(report.results)} configurations)")
+    for column in ("configuration", "cold (ms)", "warm (ms)", "files", "KiB", "peak RSS (MiB)"):
+        table.add_column(column, justify="left" if column == "configuration" else "right", overflow="fold")
+
+    def add_row(name: str, results: list[Measurement]) -> None:
+        rss = [result.peak_rss_kib for result in results if result.peak_rss_kib is not None]
+        table.add_row(
+            name,
+            f"{sum(result.cold_seconds for result in results) * 1000:.1f}",
+            f"{sum(result.warm_seconds for result in results) * 1000:.1f}",
+            str(sum(result.files for result in results)),
+            f"{sum(result.bytes for result in results) / 1024:.1f}",
+            f"{max(rss) / 1024:.1f}" if rss else "-",
+        )
+
+    for result in sorted(report.results, key=lambda result: result.warm_seconds, reverse=True)[:10]:
+        add_row(result.key, [result])
+    table.add_section()
+    add_row("total", report.results)
+    get_console().print(table)
+
+
+def compare(report: BenchmarkReport, baseline: BenchmarkReport, threshold: float) -> bool:
+    """Compare a run with a baseline and print every configuration that got slower or changed output.
+
+    Args:
+        report: The new results.
+        baseline: The results to compare with.
+        threshold: Relative slowdown tolerated before a configuration counts as a regression.
+
+    Returns:
+        Whether no configuration regressed.
+
+    """
+    from rich.table import Table
+
+    previous = {result.key: result for result in baseline.results}
+    table = Table(title=f"Compared with {baseline.version}")
+    for column in ("configuration", "metric", "before", "after", "change"):
+        table.add_column(column, justify="left" if column in {"configuration", "metric"} else "right", overflow="fold")
+
+    regressions = 0
+    for result in report.results:
+        if (old := previous.get(result.key)) is None:
+            continue
+        for metric in ("cold_seconds", "warm_seconds"):
+            before, after = getattr(old, metric), getattr(result, metric)
+            if after - before > max(before * threshold, ABSOLUTE_TOLERANCE):
+                regressions += 1
+                table.add_row(
+                    result.key,
+                    metric,
+                    f"{before * 1000:.1f} ms",
+                    f"{after * 1000:.1f} ms",
+                    f"{after / before - 1:+.0%}",
+                )
+        if (old.files, old.bytes) != (result.files, result.bytes):
+            table.add_row(
+                result.key,
+                "output",
+                f"{old.files} / {old.bytes} B",
+                f"{result.files} / {result.bytes} B",
+                "changed",
+            )
+
+    if table.row_count:
+        get_console().print(table)
+    missing = previous.keys() - {result.key for result in report.results}
+    if missing:
+        get_console().print(f"[yellow]{len(missing)} configuration(s) of the baseline were not measured[/yellow]")
+    if regressions:
+        get_console().print(f"[red]{regressions} timing(s) regressed by more than {threshold:.0%}[/red]")
+    else:
+        get_console().print(f"[green]No timing regressed by more than {threshold:.0%}[/green]")
+    return not regressions
+
+
+def main() -> None:
+    """Run the benchmark suite.
+
+    Raises:
+        SystemExit: If a timing regressed compared with the baseline.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, default=Path("bench.json"), help="JSON results file")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="warm generations per configuration")
+    parser.add_argument("-k", "--filter", default="", help="only measure configurations whose key contains this")
+    parser.add_argument("--compare", type=Path, help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="tolerated relative slowdown (default: 0.25)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        run_worker(args.worker, args.repeat)
+        return
+
+    from src.config import build_config_matrix
+
+    configs = [config for config in build_config_matrix("benchmark") if args.filter in config_key(config)]
+    results = []
+    with get_console().status("") as status:
+        for index, config in enumerate(configs, 1):
+            status.update(f"[bold green]Measuring {config_key(config)} ({index}/{len(configs)})...")
+            results.append(measure(config, args.repeat))
+
+    report = BenchmarkReport(
+        version=__version__,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        created=datetime.now(UTC).isoformat(timespec="seconds"),
+        repeat=args.repeat,
+        results=results,
+    )
+    args.output.write_bytes(msgspec.json.format(msgspec.json.encode(report)))
+    print_summary(report)
+    get_console().print(f"Results written to [bold]{args.output}[/bold]")
+
+    if args.compare is not None:
+        baseline = msgspec.json.decode(args.compare.read_bytes(), type=BenchmarkReport)
+        if not compare(report, baseline, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
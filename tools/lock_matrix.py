@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Pre-resolve a ``uv.lock`` for every dependency set a generated project can declare.
+
+Every combination of database, applicable plugin set and Docker flags is rendered,
+the combinations are grouped by the dependencies of their ``pyproject.toml``, and
+``uv lock`` resolves each group once for a placeholder project name. The lock files
+are written to ``src/Litestar/Locks`` and shipped with the package, so projects are
+generated with a lock and ``uv sync`` can run offline from a warm cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from pathlib import Path
+
+from rich.console import Console
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+# Make the package importable when the script is run from a checkout
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.config import build_config_matrix  # noqa: E402
+from src.generator import ProjectGenerator  # noqa: E402
+from src.locks import LOCK_FILE, LOCK_PROJECT_NAME, LOCKS_DIR, DependencySpec, get_lock_path  # noqa: E402
+from src.models import Framework  # noqa: E402
+
+FRAMEWORK_DIR = ROOT_DIR / "src" / Framework.LITESTAR.value
+
+
+def collect_pyprojects() -> dict[str, str]:
+    """Render the ``pyproject.toml`` of every combination, keeping one per dependency set.
+
+    Returns:
+        The rendered files, keyed by the digest of their dependency set.
+
+    """
+    pyprojects: dict[str, str] = {}
+    for config in build_config_matrix(LOCK_PROJECT_NAME):
+        content = ProjectGenerator(config, Path(config.slug)).render()[Path("pyproject.toml")].content
+        pyprojects.setdefault(DependencySpec.from_pyproject(content).key, content)
+    return pyprojects
+
+
+def resolve(uv: str, pyproject: str) -> str:
+    """Resolve a project's dependencies with ``uv lock`` in a scratch directory.
+
+    Returns:
+        The content of the lock file.
+
+    """
+    with tempfile.TemporaryDirectory(prefix="litestar-start-lock-") as directory:
+        project_dir = Path(directory)
+        (project_dir / "pyproject.toml").write_text(pyproject, encoding="utf-8")
+        subprocess.run([uv, "lock", "--quiet"], cwd=project_dir, check=True)  # noqa: S603
+        return (project_dir / LOCK_FILE).read_text(encoding="utf-8")
+
+
+def main() -> None:
+    """Resolve, check or prune the shipped lock files.
+
+    Raises:
+        SystemExit: If uv is missing, or ``--check`` finds missing or stale lock files.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only verify every dependency set has a lock file")
+    parser.add_argument("--upgrade", action="store_true", help="resolve existing lock files again")
+    args = parser.parse_args()
+
+    console = Console()
+    pyprojects = collect_pyprojects()
+    locks_dir = FRAMEWORK_DIR / LOCKS_DIR
+    expected = {get_lock_path(FRAMEWORK_DIR, DependencySpec.from_pyproject(content)) for content in pyprojects.values()}
+    stale = set(locks_dir.glob("*.lock")) - expected
+
+    if args.check:
+        missing = sorted(path for path in expected if not path.exists())
+        for path in missing:
+            console.print(f"[red]missing:[/red] {path.relative_to(ROOT_DIR)}")
+        for path in sorted(stale):
+            console.print(f"[red]stale:[/red] {path.relative_to(ROOT_DIR)}")
+        if missing or stale:
+            raise SystemExit(1)
+        console.print(f"[green]{len(expected)} lock file(s) up to date[/green]")
+        return
+
+    uv = shutil.which("uv")
+    if uv is None:
+        msg = "uv is required to resolve lock files"
+        raise SystemExit(msg)
+
+    locks_dir.mkdir(exist_ok=True)
+    for key, pyproject in sorted(pyprojects.items()):
+        path = locks_dir / f"{key}.lock"
+        if path.exists() and not args.upgrade:
+            continue
+        console.print(f"Resolving [bold]{path.relative_to(ROOT_DIR)}[/bold]")
+        path.write_text(resolve(uv, pyproject), encoding="utf-8")
+    for path in sorted(stale):
+        console.print(f"Removing [bold]{path.relative_to(ROOT_DIR)}[/bold]")
+        path.unlink()
+
+
+if __name__ == "__main__":
+    main()